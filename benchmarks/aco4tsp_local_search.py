@@ -0,0 +1,55 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+"""
+Compare the quality and run time of the ant colony optimization's local search operators.
+
+Usage: python benchmarks/aco4tsp_local_search.py [--tsp-file FILE] [--seeds N] [--ants N] [--iterations N]
+"""
+
+import argparse
+import logging
+from time import perf_counter
+
+import numpy as np
+
+from swarmlib.aco4tsp.aco_problem import ACOProblem, LOCAL_SEARCHES
+
+
+def _benchmark(local_search, args):
+    distances, durations = [], []
+    for seed in range(args.seeds):
+        problem = ACOProblem(
+            ant_number=args.ants,
+            iteration_number=args.iterations,
+            local_search=local_search,
+            seed=seed,
+            **({'tsp_file': args.tsp_file} if args.tsp_file else {}))
+
+        start = perf_counter()
+        _, distance = problem.solve()
+        durations.append(perf_counter() - start)
+        distances.append(distance)
+
+    return np.mean(distances), np.min(distances), np.mean(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tsp-file', type=str, default=None, help='TSPLIB file (default the bundled burma14.tsp)')
+    parser.add_argument('--seeds', type=int, default=50, help='Number of seeded runs per operator (default 50)')
+    parser.add_argument('--ants', type=int, default=1, help='Number of ants (default 1)')
+    parser.add_argument('--iterations', type=int, default=1, help='Number of iterations (default 1)')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    print(f'{"operator":>8} | {"mean length":>11} | {"best length":>11} | {"mean time [s]":>13}')
+    for local_search in LOCAL_SEARCHES:
+        mean_distance, best_distance, mean_duration = _benchmark(local_search, args)
+        print(f'{local_search:>8} | {mean_distance:>11.1f} | {best_distance:>11.1f} | {mean_duration:>13.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+"""
+Compare the convergence speed of the ant colony optimization variants.
+Each variant runs with increasing iteration budgets. The table shows the tour lengths reached within each budget.
+
+Usage: python benchmarks/aco4tsp_variants.py [--tsp-file FILE] [--seeds N] [--ants N] [--budgets N [N ...]]
+"""
+
+import argparse
+import logging
+from time import perf_counter
+
+import numpy as np
+
+from swarmlib.aco4tsp.aco_problem import ACOProblem
+from swarmlib.aco4tsp.variants import VARIANTS
+
+
+def _benchmark(variant, iterations, args):
+    distances, durations = [], []
+    for seed in range(args.seeds):
+        problem = ACOProblem(
+            ant_number=args.ants,
+            iteration_number=iterations,
+            variant=variant,
+            alpha=1.,
+            beta=2.,
+            seed=seed,
+            **({'tsp_file': args.tsp_file} if args.tsp_file else {}))
+
+        start = perf_counter()
+        _, distance = problem.solve()
+        durations.append(perf_counter() - start)
+        distances.append(distance)
+
+    return np.mean(distances), np.min(distances), np.mean(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tsp-file', type=str, default=None, help='TSPLIB file (default the bundled burma14.tsp)')
+    parser.add_argument('--seeds', type=int, default=20, help='Number of seeded runs per variant and budget (default 20)')
+    parser.add_argument('--ants', type=int, default=10, help='Number of ants (default 10)')
+    parser.add_argument('--budgets', type=int, nargs='+', default=[1, 2, 5, 10, 20, 50], help='Iteration budgets (default 1 2 5 10 20 50)')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    print(f'{"variant":>7} | {"iterations":>10} | {"mean length":>11} | {"best length":>11} | {"mean time [s]":>13}')
+    for variant in VARIANTS:
+        for iterations in args.budgets:
+            mean_distance, best_distance, mean_duration = _benchmark(variant, iterations, args)
+            print(f'{variant:>7} | {iterations:>10} | {mean_distance:>11.1f} | {best_distance:>11.1f} | {mean_duration:>13.4f}')
+
+
+if __name__ == '__main__':
+    main()
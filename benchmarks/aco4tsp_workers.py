@@ -0,0 +1,57 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+"""
+Measure how the ant colony optimization's processes engine scales with the number of worker processes.
+The speedup is relative to the vectorized engine, which constructs all tours in the main process.
+
+Usage: python benchmarks/aco4tsp_workers.py [--tsp-file FILE] [--ants N] [--iterations N] [--local-search NAME] [--workers N [N ...]]
+"""
+
+import argparse
+import logging
+import os
+from time import perf_counter
+
+from swarmlib.aco4tsp.aco_problem import ACOProblem, LOCAL_SEARCHES
+
+
+def _benchmark(args, **kwargs):
+    problem = ACOProblem(
+        ant_number=args.ants,
+        iteration_number=args.iterations,
+        local_search=args.local_search,
+        seed=0,
+        **({'tsp_file': args.tsp_file} if args.tsp_file else {}),
+        **kwargs)
+
+    start = perf_counter()
+    _, distance = problem.solve()
+    return distance, perf_counter() - start
+
+
+def main():
+    cpu_count = os.cpu_count()
+    workers = sorted({1, 2, 4, 8, 16, 32, cpu_count})
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tsp-file', type=str, default=None, help='TSPLIB file (default the bundled burma14.tsp)')
+    parser.add_argument('--ants', type=int, default=64, help='Number of ants (default 64)')
+    parser.add_argument('--iterations', type=int, default=10, help='Number of iterations (default 10)')
+    parser.add_argument('--local-search', type=str, default='2opt', choices=[*LOCAL_SEARCHES], help='Local search (default 2opt)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[worker for worker in workers if worker <= cpu_count],
+                        help='Numbers of worker processes (default powers of two up to the number of CPUs)')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    distance, baseline = _benchmark(args, engine='vectorized')
+    print(f'{"engine":>10} | {"workers":>7} | {"length":>9} | {"time [s]":>8} | {"speedup":>7}')
+    print(f'{"vectorized":>10} | {1:>7} | {distance:>9.1f} | {baseline:>8.3f} | {1:>7.2f}')
+    for worker_number in args.workers:
+        distance, duration = _benchmark(args, engine='processes', workers=worker_number)
+        print(f'{"processes":>10} | {worker_number:>7} | {distance:>9.1f} | {duration:>8.3f} | {baseline / duration:>7.2f}')
+
+
+if __name__ == '__main__':
+    main()
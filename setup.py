@@ -30,6 +30,10 @@ setup(
     author='Leo Hanisch',
     license='BSD 3-Clause License',
     install_requires=required_libs,
+    extras_require={
+        # Find nearest neighbors with a KD-tree instead of scanning all distances
+        'kdtree': ['scipy>=1.6.0, <2.0.0']
+    },
     project_urls={
         'Documentation': 'https://github.com/HaaLeo/swarmlib/wiki',
         'Source': 'https://github.com/HaaLeo/swarmlib',
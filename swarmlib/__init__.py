@@ -11,3 +11,4 @@ from .abc.abc_problem import ABCProblem
 from .gwo.gwo_problem import GWOProblem
 from .woa.woa_problem import WOAProblem
 from .util.functions import FUNCTIONS
+from .util.solution import Solution
@@ -3,14 +3,15 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
-from copy import deepcopy
-from functools import reduce
 import logging
 
-from .bees.employee_bee import EmployeeBee
-from .bees.onlooker_bee import OnlookerBee
+import numpy as np
+
 from .visualizer import Visualizer
+from ..util.levy_flight import LevyFlightSampler
+from ..util.population import Population
 from ..util.problem_base import ProblemBase
+from ..util.solution import Solution
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,56 +21,79 @@ class ABCProblem(ProblemBase):
     def __init__(self, **kwargs):
         """
         Initializes a new instance of the ABCProblem class.
+        The bees are rows of a population, the employee bees followed by the onlooker bees. Each phase
+        of an iteration handles all of its bees at once.
         """
         super().__init__(**kwargs)
         self.__iteration_number = kwargs['iteration_number']
-        self.__employee_bees = [
-            EmployeeBee(**kwargs, bit_generator=self._random)
-            for _ in range(kwargs['bees'])
-        ]
+        self.__bee_number = kwargs['bees']
+        self.__limit = kwargs.get('trials', 3)
+        self.__levy_flight = LevyFlightSampler(kwargs.get('alpha', 1.), kwargs.get('lambda', 1.5), self._random)
+        self.__population = Population(2 * self.__bee_number, **kwargs, bit_generator=self._random, evaluator=self._evaluator)
 
-        self.__onlooker_bees = [
-            OnlookerBee(**kwargs, bit_generator=self._random)
-            for _ in range(kwargs['bees'])
-        ]
+        # The number of unsuccessful searches of each bee and whether it was reset since its last success
+        self.__trials = np.zeros(2 * self.__bee_number, dtype=int)
+        self.__reset = np.ones(2 * self.__bee_number, dtype=bool)
 
-        self._visualizer = Visualizer(**kwargs)
+        self._init_visualizer(Visualizer, **kwargs)
 
-    def solve(self):
+    def solve(self) -> Solution:
         """
         Solve the ABC problem
         """
-        best = min(self.__employee_bees + self.__onlooker_bees, key=lambda bee: bee.value)
-        self._visualizer.add_data(employee_bees=self.__employee_bees, onlooker_bees=self.__onlooker_bees, best_position=best.position)
+        employees = np.arange(self.__bee_number)
+        onlookers = np.arange(self.__bee_number, 2 * self.__bee_number)
+
+        best = self._best_solution(self.__population, 0)
+        self.__add_data(best)
 
         for iteration in range(self.__iteration_number):
             # Employee bee phase
-            for bee in self.__employee_bees:
-                bee.explore()
+            # Search new food sources around the employee bees' own ones
+            self.__explore(employees, employees)
 
-            # Calculate the employee bees fitness values and probabilities
-            overall_fitness = reduce(lambda acc, curr: acc + curr.fitness, self.__employee_bees, 0)
-            employee_bees_fitness_probs = [bee.fitness/overall_fitness for bee in self.__employee_bees]
-
-            # Choose the employee bees positions proportional to their fitness
-            choices = self._random.choice(self.__employee_bees, size=len(self.__employee_bees), p=employee_bees_fitness_probs)
+            # Choose the employee bees' food sources proportional to their fitness, preferring negative values
+            values = self.__population.values[employees]
+            fitness = np.where(values > 0, 1 / (1 + np.abs(values)), 1 + np.abs(values))
+            choices = self._random.choice(employees, size=self.__bee_number, p=fitness / np.sum(fitness))
 
             # Onlooker phase
             # Explore new food sources based on the chosen employees' food sources
-            for bee, choice in zip(self.__onlooker_bees, choices):
-                bee.explore(choice.position, choice.value)
+            self.__explore(onlookers, choices)
 
             # Scout phase
-            for bee in self.__employee_bees + self.__onlooker_bees:
-                bee.reset()
+            # Reset the bees that exceeded the trial limit
+            scouts = np.flatnonzero(self.__trials >= self.__limit)
+            if len(scouts):
+                self.__population.initialize(scouts)
+                self.__trials[scouts] = 0
+                self.__reset[scouts] = True
 
              # Update best food source
-            current_best = min(self.__employee_bees + self.__onlooker_bees)
-            if current_best < best:
-                best = deepcopy(current_best)
+            if np.min(self.__population.values) < best.value:
+                best = self._best_solution(self.__population, iteration + 1, best)
                 LOGGER.info('Iteration %i Found new best solution="%s" at position="%s"', iteration+1, best.value, best.position)
 
             # Add data for plotting
-            self._visualizer.add_data(employee_bees=self.__employee_bees, onlooker_bees=self.__onlooker_bees, best_position=best.position)
+            self.__add_data(best)
 
         return best
+
+    def __explore(self, bees: np.ndarray, sources: np.ndarray) -> None:
+        # Search new food sources around the given ones and move each bee whose new food source is better
+        start_values = self.__population.values[sources]
+        new_positions = self.__population.clip(self.__levy_flight(self.__population.positions[sources]))
+        new_values = self.__population.evaluate(new_positions)
+
+        improved = new_values < start_values
+        self.__population.move(new_positions[improved], bees[improved], new_values[improved])
+        self.__trials[bees[improved]] = 0
+        self.__trials[bees[~improved]] += 1
+        self.__reset[bees[improved]] = False
+
+    def __add_data(self, best: Solution) -> None:
+        self._visualizer.add_data(
+            positions=self.__population.positions[:self.__bee_number],
+            reset=self.__reset[:self.__bee_number],
+            onlooker_positions=self.__population.positions[self.__bee_number:],
+            best_position=best.position)
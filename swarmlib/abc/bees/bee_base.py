@@ -3,7 +3,8 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
-from typing import Tuple
+import numpy as np
+
 from ...util.coordinate import Coordinate
 from ...util.levy_flight import levy_flight
 
@@ -12,14 +13,26 @@ class BeeBase(Coordinate):
 
     def __init__(self, **kwargs) -> None:
         """
-        Initializes a new instance of the Bee class
+        Initializes a new instance of the Bee class.
+        Like its position, the bee's trials and reset flag are views onto arrays of the whole population,
+        e.g. the ones of an `ABCProblem`.
+
+        Keyword Arguments:
+            trials {int} -- The number of unsuccessful searches until the bee is reset (default 3)
+            trial_counts {numpy.ndarray} -- The number of unsuccessful searches of each bee (default None, create new ones)
+            reset_flags {numpy.ndarray} -- Whether each bee was reset since its last success (default None, create new ones)
+            For the coordinate its arguments.
         """
         super().__init__(**kwargs)
         self.__limit = kwargs.get('trials', 3)
         self.__lambda = kwargs.get('lambda', 1.5)
         self.__alpha = kwargs.get('alpha', 1.)
-        self.__trials = 0
-        self.__reset = True
+        self.__trials = kwargs.get('trial_counts', None)
+        if self.__trials is None:
+            self.__trials = np.zeros(len(self._population), dtype=int)
+        self.__reset = kwargs.get('reset_flags', None)
+        if self.__reset is None:
+            self.__reset = np.ones(len(self._population), dtype=bool)
 
     @property
     def is_reset(self) -> bool:
@@ -29,31 +42,62 @@ class BeeBase(Coordinate):
         Returns:
             bool: True if the bee was reset otherwise False
         """
-        return self.__reset
+        return bool(self.__reset[self._index])
+
+    @property
+    def trials(self) -> int:
+        """
+        Get the number of unsuccessful searches since the bee's last success or reset.
+
+        Returns:
+            int: The number of trials
+        """
+        return int(self.__trials[self._index])
 
     def reset(self) -> None:
         """
         Reset the bee if it exceeded the trial limit.
         """
-        if self.__trials >= self.__limit:
+        if self.__trials[self._index] >= self.__limit:
             self._initialize()
-            self.__trials = 0
-            self.__reset = True
+            self.__trials[self._index] = 0
+            self.__reset[self._index] = True
 
-    def _explore(self, starting_position: Tuple[float, float], start_value: float) -> None:
+    def search(self, starting_position: np.ndarray) -> np.ndarray:
         """
-        Try to generate a new, position and save the better one
+        Generate a new food source around the starting position.
 
         Args:
-            starting_position (Tuple[float, float]): The starting position
-            start_value (float): The positions value
+            starting_position (numpy.ndarray): The starting position
+
+        Returns:
+            numpy.ndarray: The new food source's position clipped to the boundaries
         """
-        new_pos = levy_flight(starting_position, self.__alpha, self.__lambda, self._random)
-        new_value = self._function(new_pos)
+        return self._population.clip(levy_flight(starting_position, self.__alpha, self.__lambda, self._random))[0]
 
+    def update(self, new_position: np.ndarray, new_value: float, start_value: float) -> None:
+        """
+        Save the new food source if it is better than the starting one.
+
+        Args:
+            new_position (numpy.ndarray): The new food source's position within the boundaries
+            new_value (float): The new food source's value
+            start_value (float): The starting position's value
+        """
         if new_value < start_value:
-            self._position = new_pos
-            self.__trials = 0
-            self.__reset = False
+            self._population.move(new_position, self._index, new_value)
+            self.__trials[self._index] = 0
+            self.__reset[self._index] = False
         else:
-            self.__trials += 1
+            self.__trials[self._index] += 1
+
+    def _explore(self, starting_position: np.ndarray, start_value: float) -> None:
+        """
+        Try to generate a new, position and save the better one
+
+        Args:
+            starting_position (numpy.ndarray): The starting position
+            start_value (float): The positions value
+        """
+        new_pos = self.search(starting_position)
+        self.update(new_pos, self._population.evaluate_position(new_pos), start_value)
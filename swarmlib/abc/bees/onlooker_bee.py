@@ -3,16 +3,16 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
-from typing import Tuple
+import numpy as np
 from .bee_base import BeeBase
 
 class OnlookerBee(BeeBase):
-    def explore(self, starting_position: Tuple[float, float], start_value: float) -> None:
+    def explore(self, starting_position: np.ndarray, start_value: float) -> None:
         """
         Explore new food sources from the given one
 
         Args:
-            starting_position ([type]): [description]
-            start_value (float): [description]
+            starting_position (numpy.ndarray): The position of the chosen employee bee's food source
+            start_value (float): The food source's value
         """
         self._explore(starting_position, start_value)
@@ -13,7 +13,7 @@ class Visualizer(BaseVisualizer):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        ax = self._fig.gca(label='BaseAxis')
+        ax = self._ax
         self.__best_bees_artist, = ax.plot([], [], 'o', color='#FFA500' if self._dark else '#ffff00', ms=6)
         self.__best_bees = [[], []]
 
@@ -23,15 +23,15 @@ class Visualizer(BaseVisualizer):
         self._abandon_map = []
 
     def add_data(self, **kwargs) -> None:
-        employee_positions, employee_reset = zip(*[(bee.position, bee.is_reset) for bee in kwargs['employee_bees']])
-        kwargs['positions'] = employee_positions
+        # The positions are the employee bees' ones
         super().add_data(**kwargs)
 
         # Indicates whether the bee was generated this iteration or not
-        self._abandon_map.append(np.array(employee_reset))
+        employee_reset = np.array(kwargs['reset'])
+        self._abandon_map.append(employee_reset)
 
         # Handle onlooker_positions
-        onlooker_positions = [bee.position for bee in kwargs['onlooker_bees']]
+        onlooker_positions = np.array(kwargs['onlooker_positions'], dtype=float)
 
         self.__onlooker_bee_positions.append(np.transpose(onlooker_positions))
 
@@ -42,7 +42,7 @@ class Visualizer(BaseVisualizer):
 
         # Initially add data twice
         if len(self.__onlooker_bee_positions) == 1:
-            self._abandon_map.append(np.array(employee_reset))
+            self._abandon_map.append(employee_reset)
             self.__onlooker_bee_positions.append(np.transpose(onlooker_positions))
             self.__best_bees[0].append(x_pos)
             self.__best_bees[1].append(y_pos)
@@ -3,19 +3,38 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
+from functools import partial
 import inspect
 import logging
+import os
 from os import path
+import warnings
 
-import tsplib95
+import numpy as np
 
 from .ant import Ant
+from .colony_pool import ColonyPool
+from .local_2_opt import run_2opt
+from .local_3_opt import run_3opt
+from .local_or_opt import run_or_opt
+from .tour_builder import TourBuilder
 from .tsp_graph import Graph
+from .tsplib_loader import load_instance
+from .variants import VARIANTS
 from .visualizer import Visualizer
+from ..util.null_visualizer import NullVisualizer
 from ..util.problem_base import ProblemBase
 
 LOGGER = logging.getLogger(__name__)
 
+ENGINES = ('vectorized', 'threads', 'processes')
+LOCAL_SEARCHES = {
+    'none': None,
+    '2opt': run_2opt,
+    'oropt': run_or_opt,
+    '3opt': run_3opt
+}
+
 # pylint: disable=too-many-instance-attributes,invalid-name,too-many-locals
 
 
@@ -28,84 +47,169 @@ class ACOProblem(ProblemBase):
 
         Keyword arguments:  \r
         `tsp_file`   -- Path of the tsp file that shall be loaded  \r
+        `cache_dir`     -- Directory where loaded tsp files are cached, e.g. `DEFAULT_CACHE_DIR`. None disables the cache (default None)  \r
         `rho`           -- Evaporation rate (default 0.5)  \r
         `alpha`         -- Relative importance of the pheromone (default 0.5)  \r
         `beta`          -- Relative importance of the heuristic information (default 0.5)  \r
         `q`             -- Constant Q. Used to calculate the pheromone, laid down on an edge (default 1)  \r
         `iterations`    -- Number of iterations to execute (default 10)  \r
         `plot_interval` -- Plot intermediate result after this amount of iterations (default 10) \r
-        `two_opt`       -- Additionally use 2-opt local search after each iteration (default true)
+        `local_search`  -- Local search applied to each ant's tour. One of `none`, `2opt`, `oropt` or `3opt` (default `none`)  \r
+        `two_opt`       -- Deprecated. Use `local_search='2opt'` instead  \r
+        `candidate_number` -- Number of nearest neighbors an ant chooses its next node from.
+                           Only when all of them are visited, all unvisited nodes are considered.
+                           The local search uses the same neighbors. (default None, consider all nodes)  \r
+        `engine`        -- How the ants construct their tours. Either `vectorized` to construct all tours at once,
+                           `threads` to run one thread per ant or `processes` to split the tours among
+                           worker processes which share the pheromone (default `vectorized`)  \r
+        `workers`       -- Number of worker processes of the `processes` engine (default number of CPUs)  \r
+        `variant`       -- The ant colony optimization variant. One of `AS` (Ant System), `MMAS` (MAX-MIN Ant System)
+                           or `ACS` (Ant Colony System) (default `AS`)  \r
+        `q0`            -- ACS only. Probability to choose the most attractive node (default 0.9)  \r
+        `xi`            -- ACS only. Evaporation rate of the local pheromone update (default 0.1)  \r
+        `p_best`        -- MMAS only. Used to calculate the lower pheromone bound (default 0.05)  \r
+        `stagnation_limit` -- MMAS only. Iterations without improvement before the pheromone is reinitialized (default 20)  \r
+        `lazy_distances` -- Compute edge lengths on demand from the node coordinates and store the pheromone of the
+                           candidate edges and of the edges which received pheromone only. Use it for instances too large for n x n matrices. Requires `candidate_number`. (default False)  \r
+        `distance_cache_rows` -- Number of distance rows cached when `lazy_distances` is set (default 256)  \r
+        `record`        -- Record the pheromone for the replay. Disable it to run headless (default True)  \r
+        `record_interval` -- Record the pheromone of every record_interval-th iteration only. The last one is always recorded (default 1)  \r
+        `record_edges`  -- Record the pheromone of this number of strongest edges and of the best tour only (default None, all edges)
         """
         super().__init__(**kwargs)
         self.__ant_number = kwargs['ant_number']  # Number of ants
         tsp_file = kwargs.get('tsp_file', path.join(path.abspath(path.dirname(inspect.getfile(inspect.currentframe()))), 'resources/burma14.tsp'))
-        self.__graph = Graph(tsplib95.load_problem(tsp_file))
+        self.__candidate_number = kwargs.get('candidate_number', None)
+        lazy_distances = kwargs.get('lazy_distances', False)
+        instance = load_instance(tsp_file, kwargs.get('cache_dir', None), lazy_distances, kwargs.get('distance_cache_rows', 256))
+        self.__graph = Graph(instance, self.__candidate_number)
         LOGGER.info('Loaded tsp problem="%s"', tsp_file)
 
-        self.__rho = kwargs.get('rho', 0.5)  # evaporation rate
         self.__alpha = kwargs.get('alpha', 0.5)  # used for edge detection
         self.__beta = kwargs.get('beta', 0.5)  # used for edge detection
         self.__Q = kwargs.get('q', 1)  # Hyperparameter Q
         self.__num_iterations = kwargs.get('iteration_number', 10)  # Number of iterations
-        self.__use_2_opt = kwargs.get('two_opt', False)
-
-        self._visualizer = Visualizer(**kwargs)
+        if 'two_opt' in kwargs:
+            warnings.warn('The argument two_opt is deprecated. Use local_search=\'2opt\' instead.', DeprecationWarning, stacklevel=2)
+        local_search = kwargs.get('local_search', '2opt' if kwargs.get('two_opt', False) else 'none')
+        if local_search not in LOCAL_SEARCHES:
+            raise ValueError(f'Unknown local_search="{local_search}". Choose one of {tuple(LOCAL_SEARCHES)}.')
+        self.__local_search = LOCAL_SEARCHES[local_search]
+        self.__engine = kwargs.get('engine', 'vectorized')
+        if self.__engine not in ENGINES:
+            raise ValueError(f'Unknown engine="{self.__engine}". Choose one of {ENGINES}.')
+        variant = kwargs.get('variant', 'AS')
+        if variant not in VARIANTS:
+            raise ValueError(f'Unknown variant="{variant}". Choose one of {tuple(VARIANTS)}.')
+        self.__strategy = VARIANTS[variant](self.__graph, **kwargs)
+        self.__workers = kwargs.get('workers', None) or os.cpu_count()
+        if self.__engine == 'processes' and self.__strategy.local_update is not None:
+            # The workers would update the shared pheromone concurrently
+            raise ValueError(f'The variant="{variant}" cannot be used with the processes engine.')
+        if self.__engine == 'processes' and lazy_distances:
+            raise ValueError('Distances computed on demand cannot be shared with the processes engine.')
+
+        self._visualizer = Visualizer(**kwargs) if kwargs.get('record', True) else NullVisualizer()
 
     def solve(self):
         """
         Solve the given problem.
         """
-
-        ants = []
+        self.__strategy.initialize()
+
+        pool = None
+        candidates = self.__graph.get_neighbors(self.__candidate_number) if self.__candidate_number else None
+        if self.__engine == 'threads':
+            # Create ants
+            ants = [
+                Ant(self._random.choice(self.__graph.get_nodes()),
+                    self.__graph, self.__alpha, self.__beta, self.__Q, self.__local_search, self._random, self.__candidate_number,
+                    self.__strategy.q0, self.__strategy.local_update)
+                for _ in range(self.__ant_number)
+            ]
+            construct_tours = partial(self.__run_ants, ants)
+        elif self.__engine == 'processes':
+            # One seed sequence per worker keeps the result reproducible for a given seed and number of workers
+            workers = min(self.__workers, self.__ant_number)
+            seed_sequences = np.random.SeedSequence(self._random.integers(2**63)).spawn(workers)
+            neighbors = self.__graph.get_neighbors(self.__candidate_number) if self.__local_search else None
+            pool = ColonyPool(self.__graph, self.__alpha, self.__beta, seed_sequences, candidates=candidates, q0=self.__strategy.q0,
+                              local_search=self.__local_search, neighbors=neighbors)
+            # The workers apply the local search themselves
+            construct_tours = partial(self.__build_tours, pool.build, None)
+        else:
+            tour_builder = TourBuilder(self.__graph, self.__alpha, self.__beta, self._random, candidates,
+                                       q0=self.__strategy.q0, local_update=self.__strategy.local_update)
+            construct_tours = partial(self.__build_tours, tour_builder.build, self.__local_search)
+
+        try:
+            return self.__optimize(construct_tours)
+        finally:
+            if pool is not None:
+                pool.close()
+
+    def __optimize(self, construct_tours):
+        """
+        Construct tours and update the pheromone for the given number of iterations.
+        """
         shortest_distance = None
+        best_tour = None
         best_path = None
 
-        # Create ants
-        ants = [
-            Ant(self._random.choice(self.__graph.get_nodes()),
-                self.__graph, self.__alpha, self.__beta, self.__Q, self.__use_2_opt, self._random)
-            for _ in range(self.__ant_number)
-        ]
-
         for _ in range(self.__num_iterations):
-            # Start all multithreaded ants
-            for ant in ants:
-                ant.start()
+            tours, distances = construct_tours()
+
+            # Check for best path
+            best_index = np.argmin(distances)
+            if not shortest_distance or distances[best_index] < shortest_distance:
+                shortest_distance = distances[best_index]
+                best_tour = tours[best_index].copy()
+                best_path = [self.__graph.get_node(index) for index in best_tour]
+                LOGGER.info('Updated shortest_distance="%s" and best_path="%s"',
+                            shortest_distance, best_path)
+
+            # Evaporate and add pheromone as defined by the variant
+            self.__strategy.update(tours, distances, best_tour, shortest_distance)
+
+            self._visualizer.add_data(graph=self.__graph, best_tour=best_tour)
+
+        LOGGER.info('Finish! Shortest_distance="%s" and best_path="%s"',
+                    shortest_distance, best_path)
+        return best_path, shortest_distance
 
-            # Wait for all ants to finish
-            for ant in ants:
-                ant.join()
+    def __run_ants(self, ants):
+        """
+        Run one thread per ant and collect their tours.
+        """
+        # Start all multithreaded ants
+        for ant in ants:
+            ant.start()
 
-            # decay pheromone
-            edges = self.__graph.get_edges()
-            for edge in edges:
-                pheromone = self.__graph.get_edge_pheromone(edge)
-                pheromone *= 1-self.__rho
-                self.__graph.set_pheromone(edge, pheromone)
+        # Wait for all ants to finish
+        for ant in ants:
+            ant.join()
 
-            # Add each ant's pheromone
-            for ant in ants:
+        tours = np.array([self.__graph.get_indices(ant.traveled_nodes) for ant in ants])
+        distances = np.array([ant.traveled_distance for ant in ants])
 
-                ant.spawn_pheromone()
+        # Reset ants' thread
+        for ant in ants:
+            ant.initialize(self._random.choice(self.__graph.get_nodes()))
 
-                # Check for best path
-                if not shortest_distance or ant.traveled_distance < shortest_distance:
-                    shortest_distance = ant.traveled_distance
-                    best_path = ant.traveled_nodes
-                    LOGGER.info('Updated shortest_distance="%s" and best_path="%s"',
-                                shortest_distance, best_path)
+        return tours, distances
 
-                # Reset ants' thread
-                ant.initialize(self._random.choice(self.__graph.get_nodes()))
+    def __build_tours(self, build, local_search):
+        """
+        Construct all ants' tours at once.
+        """
+        tours, distances = build(self._random.integers(len(self.__graph.get_nodes()), size=self.__ant_number))
 
-            self._visualizer.add_data(
-                best_path=best_path,
-                pheromone_map={edge: self.__graph.get_edge_pheromone(edge) for edge in edges}
-            )
+        if local_search:
+            for index, tour in enumerate(tours):
+                improved_tour, distances[index] = local_search(tour, self.__graph.distance_matrix, self.__graph.get_neighbors(self.__candidate_number))
+                tours[index] = improved_tour
 
-        LOGGER.info('Finish! Shortest_distance="%s" and best_path="%s"',
-                    shortest_distance, best_path)
-        return best_path, shortest_distance
+        return tours, distances
 
     def replay(self):
         """
@@ -6,22 +6,30 @@
 import logging
 from threading import Thread
 import numpy as np
-from .local_2_opt import run_2opt
 LOGGER = logging.getLogger(__name__)
 # pylint: disable=attribute-defined-outside-init,too-many-instance-attributes,too-many-arguments,super-init-not-called,invalid-name
 
 
 class Ant(Thread):
-    def __init__(self, start_node, graph, alpha, beta, Q, use_2_opt, random):
-        """Initializes a new instance of the Ant class."""
+    def __init__(self, start_node, graph, alpha, beta, Q, local_search, random, candidate_number=None, q0=0., local_update=None):
+        """Initializes a new instance of the Ant class.
+        When `candidate_number` is set, the ant only considers the unvisited nodes among the
+        `candidate_number` nearest neighbors of its current node. When all of them are visited,
+        it considers all unvisited nodes.
+        With probability `q0` the ant travels to the most attractive node instead of a random one.
+        `local_update` is called with the start and end index of each traveled edge."""
         self.initialize(start_node)
         self.graph = graph
+        self.__candidate_number = candidate_number
+        self.__candidates = graph.get_neighbors(candidate_number) if candidate_number else None
 
         self.__alpha = alpha
         self.__beta = beta
         self.__Q = Q
-        self.__use_2_opt = use_2_opt
+        self.__local_search = local_search
         self._random = random
+        self.__q0 = q0
+        self.__local_update = local_update
 
     def initialize(self, start_node):
         Thread.__init__(self)
@@ -34,46 +42,50 @@ class Ant(Thread):
     def run(self):
         """Run the ant."""
         # Possible locations where the ant can got to from the current node without the location it has already been.
-        possible_locations = self.graph.get_connected_nodes(
-            self.__current_node).difference(self.traveled_nodes)
+        possible_locations = set(self.graph.get_nodes()).difference(self.traveled_nodes)
 
         while possible_locations:
             self.__select_edge(possible_locations)
             self.__move_to_next_node(self.selected_edge)
-
-            possible_locations = self.graph.get_connected_nodes(
-                self.__current_node).difference(self.traveled_nodes)
+            possible_locations.discard(self.__current_node)
 
         # Move back to origin
         self.__move_to_next_node((self.__current_node, self.traveled_nodes[0]))
 
-        if self.__use_2_opt:
-            self.traveled_nodes, self.traveled_distance = run_2opt(
-                self.traveled_nodes,
-                self.graph.get_edge_length)
-
+        if self.__local_search:
+            tour, self.traveled_distance = self.__local_search(
+                self.graph.get_indices(self.traveled_nodes),
+                self.graph.distance_matrix,
+                self.graph.get_neighbors(self.__candidate_number))
+            self.traveled_nodes = [self.graph.get_node(index) for index in tour]
 
     def __select_edge(self, possible_locations):
         """Select the edge where to go next."""
-        LOGGER.debug('Possible locations="%s"', possible_locations)
-        attractiveness = {}
-        overall_attractiveness = .0
-        for node in possible_locations:
-            edge = (self.__current_node, node)
-
-            edge_pheromone = self.graph.get_edge_pheromone(edge)
-            # Gets the rounded distance.
-            distance = self.graph.get_edge_length(edge)
-
-            attractiveness[node] = pow(
-                edge_pheromone, self.__alpha)*pow(1/distance, self.__beta)
-            overall_attractiveness += attractiveness[node]
+        current_index = self.graph.get_indices([self.__current_node])[0]
+
+        locations = []
+        if self.__candidates is not None:
+            locations = [
+                self.graph.get_node(index)
+                for index in self.__candidates[current_index]
+                if self.graph.get_node(index) in possible_locations
+            ]
+        if not locations:
+            locations = list(possible_locations)
+        LOGGER.debug('Possible locations="%s"', locations)
+
+        indices = self.graph.get_indices(locations)
+        edge_pheromone = self.graph.pheromone_matrix[current_index, indices]
+        distance = self.graph.distance_matrix[current_index, indices]
+        attractiveness = np.power(edge_pheromone, self.__alpha)*np.power(1/distance, self.__beta)
+        overall_attractiveness = np.sum(attractiveness)
 
         if overall_attractiveness == 0:
-            self.selected_edge = (self.__current_node,
-                                  self._random.choice(list(attractiveness.keys())))
+            self.selected_edge = (self.__current_node, self._random.choice(locations))
+        elif self.__q0 > 0 and self._random.random() < self.__q0:
+            self.selected_edge = (self.__current_node, locations[np.argmax(attractiveness)])
         else:
-            choice = self._random.choice(list(attractiveness.keys()), p=list(attractiveness.values())/np.sum(list(attractiveness.values())))
+            choice = self._random.choice(locations, p=attractiveness/overall_attractiveness)
             self.selected_edge = (self.__current_node, choice)
 
         LOGGER.debug('Selected edge: %s', (self.selected_edge,))
@@ -87,11 +99,11 @@ class Ant(Thread):
                      self.__current_node, edge_to_travel[1], self.traveled_distance)
         self.__current_node = edge_to_travel[1]
 
+        if self.__local_update is not None:
+            edge = self.graph.get_indices(edge_to_travel)
+            self.__local_update(edge[:1], edge[1:])
+
     def spawn_pheromone(self):
-        # loop all except the last item
-        for idx in range(len(self.traveled_nodes) - 1):
-            traveled_edge = (
-                self.traveled_nodes[idx], self.traveled_nodes[idx+1])
-            pheromone = self.graph.get_edge_pheromone(traveled_edge)
-            pheromone += self.__Q/self.graph.get_edge_length(traveled_edge)
-            self.graph.set_pheromone(traveled_edge, pheromone)
+        tour = self.graph.get_indices(self.traveled_nodes)
+        starts, ends = tour[:-1], tour[1:]
+        self.graph.deposit(starts, ends, self.__Q/self.graph.distance_matrix[starts, ends])
@@ -0,0 +1,153 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from collections import namedtuple
+import logging
+import multiprocessing
+from typing import Tuple
+
+import numpy as np
+
+from .tour_builder import TourBuilder, compute_heuristic
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+LOGGER = logging.getLogger(__name__)
+
+# The part of the graph a worker's tour builder needs. Both matrices are views onto the shared memory.
+SharedGraph = namedtuple('SharedGraph', ['distance_matrix', 'pheromone_matrix'])
+
+
+class ColonyPool:
+    def __init__(self, graph, alpha: float, beta: float, seed_sequences, **kwargs):
+        """
+        Initializes a new instance of the `ColonyPool` class.
+        It starts one process per seed sequence. Each process constructs a share of the ants' tours.
+        The distance, pheromone and heuristic matrices are stored in shared memory, hence only the start nodes
+        and the constructed tours are sent between the processes. The graph's pheromone is stored in the
+        shared memory until the pool is closed, so pheromone updates of the parent are seen by all workers.
+
+        Arguments:
+            graph {Graph} -- The graph the ants travel on
+            alpha {float} -- Relative importance of the pheromone
+            beta {float} -- Relative importance of the heuristic information
+            seed_sequences {List[numpy.random.SeedSequence]} -- One seed sequence per worker
+
+        Keyword arguments:
+            candidates {numpy.ndarray} -- Candidate lists the ants choose their next node from (default None)
+            q0 {float} -- Probability to choose the most attractive node instead of a random one (default 0)
+            local_search {Callable} -- Local search applied to each tour by the worker that constructed it (default None)
+            neighbors {numpy.ndarray} -- Neighbor lists used by the local search (default None)
+        """
+        if shared_memory is None:
+            raise RuntimeError('The processes engine requires Python 3.8 or newer.')
+
+        self.__graph = graph
+        distances = graph.distance_matrix
+        self.__memories = [shared_memory.SharedMemory(create=True, size=distances.nbytes) for _ in range(3)]
+        shared_distances, shared_pheromone, shared_heuristic = self.__views(distances.shape)
+        shared_distances[:] = distances
+        compute_heuristic(shared_distances, beta, out=shared_heuristic)
+        graph.attach_pheromone(shared_pheromone)
+
+        settings = {
+            'names': [memory.name for memory in self.__memories],
+            'shape': distances.shape,
+            'alpha': alpha,
+            'beta': beta,
+            **kwargs
+        }
+
+        self.__connections = []
+        self.__processes = []
+        for seed_sequence in seed_sequences:
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_work, args=(child_connection, seed_sequence, settings), daemon=True)
+            process.start()
+            child_connection.close()
+            self.__connections.append(parent_connection)
+            self.__processes.append(process)
+
+        LOGGER.info('Started %s colony workers', len(self.__processes))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def build(self, starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Construct one closed tour per start node. The start nodes are split evenly among the workers.
+
+        Arguments:
+            starts {numpy.ndarray} -- The start node index of each ant
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray] -- The tours' node indices (ants x nodes+1) and the tours' lengths
+        """
+        shares = np.array_split(starts, len(self.__connections))
+        for connection, share in zip(self.__connections, shares):
+            connection.send(share)
+
+        results = [connection.recv() for connection in self.__connections]
+        return np.concatenate([tours for tours, _ in results]), np.concatenate([lengths for _, lengths in results])
+
+    def close(self) -> None:
+        """
+        Stop all workers and release the shared memory. The graph keeps a private copy of the pheromone.
+        """
+        if not self.__memories:
+            return
+
+        for connection in self.__connections:
+            connection.send(None)
+            connection.close()
+        for process in self.__processes:
+            process.join()
+
+        self.__graph.attach_pheromone(np.empty_like(self.__graph.pheromone_matrix))
+        for memory in self.__memories:
+            memory.close()
+            memory.unlink()
+        self.__memories = []
+
+    def __views(self, shape):
+        return [np.ndarray(shape, dtype=np.float64, buffer=memory.buf) for memory in self.__memories]
+
+
+def _work(connection, seed_sequence, settings):
+    """
+    Construct tours for the start nodes received from the connection until None is received.
+    """
+    memories = [shared_memory.SharedMemory(name=name) for name in settings['names']]
+    try:
+        _serve(connection, memories, seed_sequence, settings)
+    finally:
+        connection.close()
+        for memory in memories:
+            memory.close()
+
+
+def _serve(connection, memories, seed_sequence, settings):
+    # The views onto the shared memory must not outlive this function. Otherwise the memory cannot be closed.
+    distances, pheromone, heuristic = [np.ndarray(settings['shape'], dtype=np.float64, buffer=memory.buf) for memory in memories]
+    graph = SharedGraph(distances, pheromone)
+    tour_builder = TourBuilder(
+        graph, settings['alpha'], settings['beta'], np.random.default_rng(seed_sequence),
+        settings.get('candidates'), q0=settings.get('q0', 0.), heuristic=heuristic)
+    local_search = settings.get('local_search')
+
+    starts = connection.recv()
+    while starts is not None:
+        tours, lengths = tour_builder.build(starts)
+        if local_search:
+            for index, tour in enumerate(tours):
+                tours[index], lengths[index] = local_search(tour, graph.distance_matrix, settings.get('neighbors'))
+        connection.send((tours, lengths))
+        starts = connection.recv()
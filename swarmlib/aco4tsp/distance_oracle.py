@@ -0,0 +1,239 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from collections import OrderedDict
+import logging
+from typing import NamedTuple
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None  # pylint: disable=invalid-name
+
+LOGGER = logging.getLogger(__name__)
+
+# Number of distances computed at once when all rows are scanned for the nearest neighbors
+BLOCK_SIZE = 2**22
+
+# Minimum number of points per leaf of the tree which finds the nearest neighbors if scipy is not installed
+LEAF_SIZE = 16
+
+SCALARS = (int, np.integer)
+
+
+class DistanceOracle:
+    def __init__(self, points: np.ndarray, distance_function, cache_rows: int = 256, embedding: np.ndarray = None, scalar_function=None):  # pylint: disable=too-many-arguments
+        """
+        Initializes a new instance of the `DistanceOracle` class.
+        It computes edge lengths on demand from the node coordinates instead of storing all n x n of them.
+        It is indexed like a distance matrix. Complete rows are kept in a bounded LRU cache.
+
+        Arguments:
+            points {numpy.ndarray} -- The n x d points passed to the distance function
+            distance_function {Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray]} -- Computes the distances
+                between broadcastable arrays of start and end points
+
+        Keyword Arguments:
+            cache_rows {int} -- Maximum number of cached rows (default 256)
+            embedding {numpy.ndarray} -- Points whose euclidean distances have the same order as the distance function's.
+                Used to find the nearest neighbors with scipy's KD-tree if it is installed or with `tree_nearest_neighbors` otherwise.
+                (default None, scan all rows)
+            scalar_function {Callable[[Tuple, Tuple], float]} -- Computes the distance between two points given as tuples.
+                Single edge lengths, e.g. of the local search, are much faster to compute without numpy. (default None)
+        """
+        self.__points = points
+        self.__point_tuples = [tuple(point) for point in points.tolist()] if scalar_function else None
+        self.__distance_function = distance_function
+        self.__scalar_function = scalar_function
+        self.__cache_rows = cache_rows
+        self.__embedding = embedding
+        self.__rows = OrderedDict()
+
+    def __len__(self):
+        return len(self.__points)
+
+    @property
+    def shape(self):
+        return len(self), len(self)
+
+    def __getitem__(self, index):  # pylint: disable=too-many-return-statements
+        if not isinstance(index, tuple):
+            if np.ndim(index) == 0:
+                return self.row(int(index))
+            return np.array([self.row(row) for row in np.asarray(index).tolist()]).reshape(np.shape(index) + (len(self),))
+
+        rows, columns = index
+        if isinstance(rows, SCALARS) and isinstance(columns, SCALARS):
+            # Single edges are looked up very often, hence this path avoids numpy as far as possible
+            row = self.__rows.get(rows)
+            if row is not None:
+                return row[columns]
+            if rows == columns:
+                return 0.
+            if self.__scalar_function is not None:
+                return self.__scalar_function(self.__point_tuples[rows], self.__point_tuples[columns])
+            return float(self.__distance_function(self.__points[rows], self.__points[columns]))
+        if isinstance(columns, slice):
+            return self[rows][..., columns]
+
+        rows, columns = np.asarray(rows), np.asarray(columns)
+        distances = self.__distance_function(self.__points[rows], self.__points[columns])
+        return np.where(rows == columns, 0., distances)
+
+    def row(self, index: int) -> np.ndarray:
+        """
+        Get the distances from the given node to all nodes. The row is cached.
+        """
+        row = self.__rows.get(index)
+        if row is None:
+            row = self.__distance_function(self.__points[index], self.__points)
+            row[index] = 0
+            row.flags.writeable = False
+            self.__rows[index] = row
+            if len(self.__rows) > self.__cache_rows:
+                self.__rows.popitem(last=False)
+        else:
+            self.__rows.move_to_end(index)
+        return row
+
+    def nearest_neighbors(self, neighbor_number: int) -> np.ndarray:
+        """
+        Get the nearest neighbors of each node without computing all rows at once.
+
+        Arguments:
+            neighbor_number {int} -- The number of neighbors per node
+
+        Returns:
+            numpy.ndarray -- Row i contains the indices of the nearest neighbors of node i sorted by distance.
+        """
+        if neighbor_number is None:
+            raise ValueError('The distance oracle cannot list all neighbors of each node. Pass a neighbor_number.')
+
+        size = len(self)
+        neighbor_number = min(neighbor_number, size - 1)
+        # Find one more neighbor as the node itself is found as well
+        if self.__embedding is not None and cKDTree is not None:
+            _, candidates = cKDTree(self.__embedding).query(self.__embedding, neighbor_number + 1)
+            candidates = np.asarray(candidates, dtype=np.intp).reshape(size, neighbor_number + 1)
+        elif self.__embedding is not None:
+            candidates = tree_nearest_neighbors(self.__embedding, neighbor_number + 1)
+        else:
+            LOGGER.info('Scan all distances for the %s nearest neighbors of %s nodes', neighbor_number, size)
+            candidates = np.empty((size, neighbor_number + 1), dtype=np.intp)
+            block = max(BLOCK_SIZE // size, 1)
+            for start in range(0, size, block):
+                rows = np.arange(start, min(start + block, size))
+                distances = self.__distance_function(self.__points[rows, np.newaxis], self.__points[np.newaxis])
+                candidates[rows] = np.argpartition(distances, neighbor_number, axis=1)[:, :neighbor_number + 1]
+
+        # Drop the node itself, or the farthest candidate if the node was not found due to ties, and sort by distance
+        nodes = np.arange(size)[:, np.newaxis]
+        distances = np.where(candidates == nodes, np.inf, self[nodes, candidates])
+        order = np.argsort(distances, axis=1, kind='stable')
+        return np.take_along_axis(candidates, order, axis=1)[:, :neighbor_number]
+
+
+def tree_nearest_neighbors(points: np.ndarray, neighbor_number: int) -> np.ndarray:
+    """
+    Find the nearest points of each point by their euclidean distance. The point itself is found as well.
+    The points are split at the median of their widest axis until each leaf holds less than twice `LEAF_SIZE`
+    or twice `neighbor_number` points, so dense clusters get small leaves. The points of a leaf are only compared to the
+    points of the leaves that are closer than the farthest neighbor found within the leaf, hence the work per leaf is bounded.
+
+    Arguments:
+        points {numpy.ndarray} -- The n x d points
+        neighbor_number {int} -- The number of points to find for each point. At most n.
+
+    Returns:
+        numpy.ndarray -- Row i contains the indices of the nearest points of point i in arbitrary order.
+    """
+    tree = _build_tree(points, max(neighbor_number, LEAF_SIZE))
+    leaves = np.flatnonzero(tree.children[:, 0] < 0)
+
+    # Each leaf holds enough points, so its own points bound the distance to the neighbors of its points
+    bounds = np.array([
+        np.partition(_squared_distances(points[members], points[members]), neighbor_number - 1, axis=1)[:, neighbor_number - 1].max()
+        for members in (tree.members(leaf) for leaf in leaves)
+    ])
+    close_leaves = _close_leaves(tree, leaves, bounds)
+
+    neighbors = np.empty((len(points), neighbor_number), dtype=np.intp)
+    for leaf, others in zip(leaves, close_leaves):
+        members = tree.members(leaf)
+        candidates = np.concatenate([members, *[tree.members(node) for node in others.tolist()]])
+        distances = _squared_distances(points[members], points[candidates])
+        neighbors[members] = candidates[np.argpartition(distances, neighbor_number - 1, axis=1)[:, :neighbor_number]]
+
+    return neighbors
+
+
+class _Tree(NamedTuple):
+    """
+    Nodes of the tree built by `_build_tree`. Node i holds the points order[starts[i]:ends[i]] within the bounding box
+    from lower[i] to upper[i]. Its children are children[i], or -1 for leaves.
+    """
+    order: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+    children: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+
+    def members(self, node):
+        return self.order[self.starts[node]:self.ends[node]]
+
+
+def _build_tree(points, leaf_size):
+    """
+    Split the points at the median of their widest axis until less than 2 * leaf_size points are left.
+    """
+    order = np.arange(len(points))
+    starts, ends, children, lower, upper = [0], [len(points)], [], [], []
+    node = 0
+    while node < len(starts):
+        start, end = starts[node], ends[node]
+        coordinates = points[order[start:end]]
+        lower.append(coordinates.min(axis=0))
+        upper.append(coordinates.max(axis=0))
+        if end - start < 2 * leaf_size:
+            children.append((-1, -1))
+        else:
+            middle = (end - start) // 2
+            order[start:end] = order[start:end][np.argpartition(coordinates[:, np.argmax(upper[-1] - lower[-1])], middle)]
+            children.append((len(starts), len(starts) + 1))
+            starts += [start, start + middle]
+            ends += [start + middle, end]
+        node += 1
+
+    return _Tree(order, np.array(starts), np.array(ends), np.array(children, dtype=np.intp), np.array(lower), np.array(upper))
+
+
+def _close_leaves(tree, leaves, bounds):
+    """
+    Get the other leaves whose bounding boxes are closer to each leaf's box than its squared bound.
+    All leaves descend from the root at once as a frontier of (leaf index, node) pairs.
+    """
+    queries, nodes = np.arange(len(leaves)), np.zeros(len(leaves), dtype=np.intp)
+    found_queries, found_nodes = [], []
+    while len(queries) > 0:
+        gaps = np.maximum(tree.lower[nodes] - tree.upper[leaves[queries]], 0) + np.maximum(tree.lower[leaves[queries]] - tree.upper[nodes], 0)
+        close = np.einsum('ij,ij->i', gaps, gaps) < bounds[queries]
+        queries, nodes = queries[close], nodes[close]
+        is_leaf = tree.children[nodes, 0] < 0
+        other = is_leaf & (nodes != leaves[queries])
+        found_queries.append(queries[other])
+        found_nodes.append(nodes[other])
+        queries, nodes = np.repeat(queries[~is_leaf], 2), tree.children[nodes[~is_leaf]].ravel()
+
+    found_queries, found_nodes = np.concatenate(found_queries), np.concatenate(found_nodes)
+    order = np.argsort(found_queries, kind='stable')
+    return np.split(found_nodes[order], np.searchsorted(found_queries[order], np.arange(1, len(leaves))))
+
+
+def _squared_distances(points, others):
+    delta = points[:, np.newaxis] - others[np.newaxis]
+    return np.einsum('ijk,ijk->ij', delta, delta)
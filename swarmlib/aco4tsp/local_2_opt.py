@@ -3,54 +3,71 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
+import numpy as np
 
-def _swap_2opt(route, i, k):
+from .local_search import EPSILON, improve_route
+
+
+def run_2opt(route, distances, neighbors=None):
     """
-    swaps the endpoints of two edges by reversing a section of nodes,
-        ideally to eliminate crossovers
-    returns the new route created with a the 2-opt swap
-    route - route to apply 2-opt
-    i - start index of the portion of the route to be reversed
-    k - index of last node in portion of route to be reversed
-    pre: 0 <= i < (len(route) - 1) and i < k < len(route)
-    post: length of the new route must match length of the given route
+    improves an existing route using 2-opt moves until no improving move is left.
+    Each move is evaluated by the length change of the four affected edges only.
+    returns the improved route and its distance
+    route - closed route to improve (first node equals last node) given as node indices
+    distances - the distance matrix
+    neighbors - candidate lists. Row i contains the nodes to consider for new edges of node i
+        sorted by their distance to i. When omitted, all nodes are considered.
     """
-    assert i >= 0
-    assert i < (len(route) - 1)
-    assert k > i
-    assert k < len(route)
-    new_route = route[0:i]
-    new_route.extend(reversed(route[i:k + 1]))
-    new_route.extend(route[k+1:])
-    assert len(new_route) == len(route)
-    return new_route
-
-
-def run_2opt(route, edge_distance_func):
+    return improve_route(route, distances, neighbors, (two_opt_move,))
+
+
+def two_opt_move(city_a, tour, position, distances, neighbors):
     """
-    improves an existing route using the 2-opt swap
-    best path found will differ depending of the start node of the list of nodes
-        representing the input tour
-    returns the best path found
-    route - route to improve
+    Search an improving move that replaces the edge between city_a and its successor (or predecessor)
+    and apply it by reversing a segment in place.
+    returns the cities whose edges changed or None
     """
-    best_route = route
-    best_distance = _route_distance(route, edge_distance_func)
-    for i in range(1, len(best_route) - 1):
-        for k in range(i+1, len(best_route) - 1):
-            new_route = _swap_2opt(best_route, i, k)
-            new_distance = _route_distance(new_route, edge_distance_func)
-            if new_distance < best_distance:
-                best_distance = new_distance
-                best_route = new_route
-
-    assert len(best_route) == len(route)
-    return best_route, best_distance
-
-
-def _route_distance(route, edge_distance_func):
-    distance = 0.
-    for idx in range(len(route) - 1):
-        distance += edge_distance_func((route[idx], route[idx+1]))
-
-    return distance
+    size = len(tour)
+    for direction in (1, -1):
+        city_b = tour[(position[city_a] + direction) % size]
+        distance_ab = distances[city_a, city_b]
+
+        for city_c in neighbors[city_a]:
+            distance_ac = distances[city_a, city_c]
+            if distance_ac >= distance_ab:
+                # The new edge is not shorter than the removed one. All following neighbors are even farther away.
+                break
+
+            city_d = tour[(position[city_c] + direction) % size]
+            if city_c == city_b or city_d == city_a:
+                continue
+
+            delta = distance_ac + distances[city_b, city_d] - distance_ab - distances[city_c, city_d]
+            if delta < -EPSILON:
+                if direction == 1:
+                    # a b ... c d -> a c ... b d
+                    _reverse(tour, position, position[city_b], position[city_c])
+                else:
+                    # d c ... b a -> d b ... c a
+                    _reverse(tour, position, position[city_c], position[city_b])
+                return city_a, city_b, city_c, city_d
+
+    return None
+
+
+def _reverse(tour, position, start, end):
+    """
+    reverses the segment from start to end (both positions inclusive) in place.
+    The segment may wrap around the end of the tour. Reverses the complementary segment instead
+    when it is shorter, which results in the same tour in the opposite direction.
+    """
+    size = len(tour)
+    length = (end - start) % size + 1
+    if 2 * length > size:
+        start, end = (end + 1) % size, (start - 1) % size
+        length = size - length
+
+    indices = (start + np.arange(length)) % size
+    cities = tour[indices[::-1]]
+    tour[indices] = cities
+    position[cities] = indices
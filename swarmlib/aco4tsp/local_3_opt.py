@@ -0,0 +1,23 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from .local_2_opt import two_opt_move
+from .local_or_opt import or_opt_move
+from .local_search import improve_route
+
+
+def run_3opt(route, distances, neighbors=None):
+    """
+    improves an existing route using Or-3opt moves until no improving move is left.
+    Or-3opt combines 2-opt moves with segment insertion (Or-opt) moves. Segment insertions are the
+    3-opt moves which keep the orientation of at least two of the three resulting paths.
+    Hence, it is a cheap subset of the full 3-opt neighborhood.
+    returns the improved route and its distance
+    route - closed route to improve (first node equals last node) given as node indices
+    distances - the distance matrix
+    neighbors - candidate lists. Row i contains the nodes to consider for new edges of node i
+        sorted by their distance to i. When omitted, all nodes are considered.
+    """
+    return improve_route(route, distances, neighbors, (two_opt_move, or_opt_move))
@@ -0,0 +1,98 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from .local_search import EPSILON, improve_route
+
+# pylint: disable=too-many-arguments,too-many-locals
+
+# Or-opt moves segments of up to this many cities
+MAX_SEGMENT_LENGTH = 3
+
+
+def run_or_opt(route, distances, neighbors=None):
+    """
+    improves an existing route using Or-opt moves until no improving move is left.
+    An Or-opt move moves a segment of one up to three consecutive cities to another place in the route,
+    either in its original or in reversed order.
+    Each move is evaluated by the length change of the affected edges only.
+    returns the improved route and its distance
+    route - closed route to improve (first node equals last node) given as node indices
+    distances - the distance matrix
+    neighbors - candidate lists. Row i contains the nodes to consider for new edges of node i
+        sorted by their distance to i. When omitted, all nodes are considered.
+    """
+    return improve_route(route, distances, neighbors, (or_opt_move,))
+
+
+def or_opt_move(city, tour, position, distances, neighbors):
+    """
+    Search an improving move for a segment that starts or ends at the given city and apply it.
+    returns the cities whose edges changed or None
+    """
+    size = len(tour)
+    for length in range(1, min(MAX_SEGMENT_LENGTH, size - 3) + 1):
+        for start in (position[city], position[city] - length + 1):
+            move = _find_move(start % size, length, tour, position, distances, neighbors)
+            if move is not None:
+                return _move_segment(tour, position, *move)
+
+    return None
+
+
+def _find_move(start, length, tour, position, distances, neighbors):
+    size = len(tour)
+    first, last = tour[start], tour[(start + length - 1) % size]
+    previous, following = tour[(start - 1) % size], tour[(start + length) % size]
+
+    # Gain of removing the segment and closing the gap
+    removal_gain = distances[previous, first] + distances[last, following] - distances[previous, following]
+    if removal_gain <= EPSILON:
+        return None
+
+    def in_segment(node):
+        return (position[node] - start) % size < length
+
+    for end_city in (first, last):
+        for candidate in neighbors[end_city]:
+            if distances[end_city, candidate] >= removal_gain:
+                # Gain criterion: insertions next to farther candidates are unlikely to pay off
+                break
+            if in_segment(candidate):
+                continue
+
+            candidate_position = position[candidate]
+            for edge_start, edge_end in (
+                    (candidate, tour[(candidate_position + 1) % size]),
+                    (tour[(candidate_position - 1) % size], candidate)):
+                if in_segment(edge_start) or in_segment(edge_end):
+                    continue
+
+                removed_edge = distances[edge_start, edge_end]
+                forward = distances[edge_start, first] + distances[last, edge_end] - removed_edge
+                backward = distances[edge_start, last] + distances[first, edge_end] - removed_edge
+                if min(forward, backward) - removal_gain < -EPSILON:
+                    return start, length, edge_start, edge_end, backward < forward
+
+    return None
+
+
+def _move_segment(tour, position, start, length, edge_start, edge_end, reverse):
+    """
+    Move the segment between edge_start and edge_end and update the tour and positions in place.
+    returns the cities whose edges changed
+    """
+    size = len(tour)
+    segment_indices = (start + np.arange(length)) % size
+    segment = tour[segment_indices]
+    previous, following = tour[(start - 1) % size], tour[(start + length) % size]
+
+    remaining = np.delete(tour, segment_indices)
+    insert_at = np.flatnonzero(remaining == edge_start)[0] + 1
+    tour[:] = np.concatenate((remaining[:insert_at], segment[::-1] if reverse else segment, remaining[insert_at:]))
+    position[tour] = np.arange(size)
+
+    return previous, following, edge_start, edge_end, segment[0], segment[-1]
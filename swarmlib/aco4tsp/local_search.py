@@ -0,0 +1,82 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from collections import deque
+
+import numpy as np
+
+from .tsp_graph import nearest_neighbors
+
+# Minimal gain of a move. Prevents endless loops caused by floating point noise.
+EPSILON = 1e-9
+
+
+def improve_route(route, distances, neighbors, moves):
+    """
+    improves an existing route with the given moves until no improving move is left.
+    Cities whose neighborhood did not change since their last unsuccessful search are skipped (don't look bits).
+    The first node of the route stays the first node of the improved route.
+    returns the improved route and its distance
+    route - closed route to improve (first node equals last node) given as node indices
+    distances - the distance matrix
+    neighbors - candidate lists. Row i contains the nodes to consider for new edges of node i
+        sorted by their distance to i. When None, all nodes are considered.
+    moves - functions that search and apply an improving move for a city.
+        Each is called with (city, tour, position, distances, neighbors), changes tour and position in place
+        and returns the cities whose edges changed or None when no improving move was found.
+    """
+    tour = np.array(route[:-1], dtype=np.intp)
+    if len(tour) > 3:
+        if neighbors is None:
+            neighbors = nearest_neighbors(distances)
+        _optimize(tour, distances, neighbors, moves)
+        tour = np.roll(tour, -np.flatnonzero(tour == route[0])[0])
+
+    best_route = [*tour.tolist(), int(tour[0])]
+    return best_route, route_distance(best_route, distances)
+
+
+def route_distance(route, distances):
+    route = np.asarray(route)
+    return float(np.sum(distances[route[:-1], route[1:]]))
+
+
+def _optimize(tour, distances, neighbors, moves):
+    position = np.empty(len(tour), dtype=np.intp)
+    position[tour] = np.arange(len(tour))
+
+    # Don't look bits may miss moves whose edges changed without touching the searching city.
+    # Hence, search with all cities active again until no improving move is left.
+    while _search(tour, position, distances, neighbors, moves):
+        pass
+
+
+def _search(tour, position, distances, neighbors, moves):
+    """
+    Search and apply improving moves, starting with all cities active.
+    returns True if at least one move was applied
+    """
+    queue = deque(tour.tolist())
+    queued = np.ones(len(tour), dtype=bool)
+    improved = False
+
+    while queue:
+        city = queue.popleft()
+        queued[city] = False
+
+        for move in moves:
+            touched_cities = move(city, tour, position, distances, neighbors)
+            if touched_cities is not None:
+                break
+        else:
+            continue
+
+        improved = True
+        for touched in touched_cities:
+            if not queued[touched]:
+                queued[touched] = True
+                queue.append(touched)
+
+    return improved
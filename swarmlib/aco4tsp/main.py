@@ -3,10 +3,13 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
+import argparse
 import logging
 from os import path, getcwd
 import inspect
-from .aco_problem import ACOProblem
+from .aco_problem import ACOProblem, ENGINES, LOCAL_SEARCHES
+from .tsplib_loader import DEFAULT_CACHE_DIR
+from .variants import VARIANTS
 
 LOGGER = logging.getLogger(__name__)
 
@@ -64,16 +67,100 @@ def configure_parser(sub_parsers):
         help='Number of iterations to execute (default 10)')
     parser.add_argument(
         '-o',
+        '--local-search',
+        type=str,
+        default='none',
+        choices=[*LOCAL_SEARCHES],
+        help='Local search applied to each ant\'s tour after each iteration (default none)')
+    # Deprecated alias of --local-search 2opt
+    parser.add_argument(
         '--two-opt',
-        action='store_true',
-        default=False,
-        help='Enable to use 2-opt local search after each iteration (default off)')
+        action='store_const',
+        const='2opt',
+        dest='local_search',
+        help=argparse.SUPPRESS)
+    parser.add_argument(
+        '-k',
+        '--candidate-number',
+        type=int,
+        default=None,
+        help='Number of nearest neighbors an ant chooses its next node from. The local search uses the same neighbors (default all nodes)')
+    parser.add_argument(
+        '-e',
+        '--engine',
+        type=str,
+        default='vectorized',
+        choices=ENGINES,
+        help='Construct all ants\' tours at once (vectorized), run one thread per ant (threads) or split the tours among worker processes (processes) (default vectorized)')
+    parser.add_argument(
+        '-w',
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes of the processes engine (default number of CPUs)')
+    parser.add_argument(
+        '-v',
+        '--variant',
+        type=str,
+        default='AS',
+        choices=[*VARIANTS],
+        help='Ant System (AS), MAX-MIN Ant System (MMAS) or Ant Colony System (ACS) (default AS)')
+    parser.add_argument(
+        '--q0',
+        type=float,
+        default=.9,
+        help='ACS only. Probability to choose the most attractive node instead of a random one (default 0.9)')
+    parser.add_argument(
+        '--xi',
+        type=float,
+        default=.1,
+        help='ACS only. Evaporation rate of the local pheromone update (default 0.1)')
+    parser.add_argument(
+        '--p-best',
+        type=float,
+        default=.05,
+        help='MMAS only. Probability to construct the best tour again when the pheromone converged. Used to calculate the lower pheromone bound (default 0.05)')
+    parser.add_argument(
+        '--stagnation-limit',
+        type=int,
+        default=20,
+        help='MMAS only. Number of iterations without improvement before the pheromone is reinitialized (default 20)')
     parser.add_argument(
         '-t',
         '--tsp-file',
         type=str,
         default=path.join(path.abspath(path.dirname(inspect.getfile(inspect.currentframe()))), 'resources/burma14.tsp'),
         help='Path of the tsp file that shall be loaded (default loads the built-in burma14.tsp)')
+    parser.add_argument(
+        '--lazy-distances',
+        action='store_true',
+        help='Compute edge lengths on demand and store the pheromone of the candidate edges and of the edges which '
+             'received pheromone only. Requires --candidate-number')
+    parser.add_argument(
+        '--distance-cache-rows',
+        type=int,
+        default=256,
+        help='Number of distance rows cached when --lazy-distances is set (default 256)')
+    parser.add_argument(
+        '--no-record',
+        dest='record',
+        action='store_false',
+        help='Do not record the pheromone for the replay. Use it to run headless')
+    parser.add_argument(
+        '--record-interval',
+        type=int,
+        default=1,
+        help='Record the pheromone of every n-th iteration only. The last iteration is always recorded (default 1)')
+    parser.add_argument(
+        '--record-edges',
+        type=int,
+        default=None,
+        help='Record the pheromone of this number of strongest edges and of the best tour only (default all edges)')
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f'Directory where loaded tsp files are cached to load them faster next time (default {DEFAULT_CACHE_DIR})')
 
     parser.add_argument(
         'ant_number',
@@ -0,0 +1,137 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from typing import Tuple
+
+import numpy as np
+
+
+class SparsePheromone:
+    def __init__(self, candidates: np.ndarray):
+        """
+        Initializes a new instance of the `SparsePheromone` class.
+        It stores the pheromone of the candidate list edges and of each other edge once it receives pheromone,
+        e.g. an edge of a tour which left the candidate lists. All other edges share one value,
+        which evaporates, is reset and clipped like the stored ones. It is indexed like a symmetric pheromone matrix.
+
+        Arguments:
+            candidates {numpy.ndarray} -- Candidate lists. Row i contains the nodes whose edge to i is stored.
+        """
+        self.__size = len(candidates)
+        starts = np.repeat(np.arange(self.__size), candidates.shape[1])
+        # Each undirected edge is stored once with the smaller node first. The keys are sorted, hence they can be binary searched.
+        self.__keys = np.unique(self.__key(starts, candidates.ravel()))
+        self.__values = np.zeros(len(self.__keys))
+        self.__default = 0.
+        # Adjacency lists of the stored edges, built when the first row is looked up after edges were stored
+        self.__adjacency = None
+
+    def __len__(self):
+        return self.__size
+
+    @property
+    def shape(self):
+        return self.__size, self.__size
+
+    def __getitem__(self, index):
+        if not isinstance(index, tuple):
+            return self.__rows(np.asarray(index))
+
+        positions, found = self.__find(*index)
+        return np.where(found, self.__values[positions], self.__default)
+
+    def __setitem__(self, index, values):
+        positions, found = self.__find(*index)
+        values = np.broadcast_to(values, found.shape)
+        missing = ~found & (values != self.__default)
+        if np.any(missing):
+            self.__insert(self.__key(*index)[missing])
+            positions, found = self.__find(*index)
+        self.__values[positions[found]] = values[found]
+
+    def __imul__(self, factor):
+        self.__values *= factor
+        self.__default *= factor
+        return self
+
+    def add(self, starts: np.ndarray, ends: np.ndarray, amounts: np.ndarray) -> None:
+        """
+        Add pheromone to the given edges. Edges which occur several times receive the pheromone several times.
+        Edges which are not stored yet are stored from now on.
+        """
+        self.__insert(self.__key(starts, ends))
+        positions, _ = self.__find(starts, ends)
+        np.add.at(self.__values, positions, np.broadcast_to(amounts, positions.shape))
+
+    def clip(self, minimum: float, maximum: float) -> None:
+        """
+        Clip the pheromone of all edges to the given bounds.
+        """
+        np.clip(self.__values, minimum, maximum, out=self.__values)
+        self.__default = min(max(self.__default, minimum), maximum)
+
+    def fill(self, value: float) -> None:
+        """
+        Set the pheromone of all edges to the given value.
+        """
+        self.__values.fill(value)
+        self.__default = value
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the stored edges.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray] -- The edges' start and end indices. The start is the smaller index.
+        """
+        return np.divmod(self.__keys, self.__size)
+
+    def __rows(self, rows):
+        """
+        Get the complete rows. Only the stored edges of each row are looked up.
+        """
+        if self.__adjacency is None:
+            self.__adjacency = self.__build_adjacency()
+        adjacent, adjacent_positions, offsets = self.__adjacency
+
+        result = np.full((rows.size, self.__size), self.__default)
+        for result_row, row in zip(result, rows.ravel().tolist()):
+            entries = slice(offsets[row], offsets[row + 1])
+            result_row[adjacent[entries]] = self.__values[adjacent_positions[entries]]
+        return result.reshape(rows.shape + (self.__size,))
+
+    def __build_adjacency(self):
+        """
+        Get the adjacency lists of the stored edges in both directions: the adjacent nodes, the positions of the edges'
+        values and the offset of each node's list.
+        """
+        edge_starts, edge_ends = self.edges()
+        nodes = np.concatenate([edge_starts, edge_ends])
+        order = np.argsort(nodes, kind='stable')
+        adjacent = np.concatenate([edge_ends, edge_starts])[order]
+        adjacent_positions = np.tile(np.arange(len(self.__keys)), 2)[order]
+        return adjacent, adjacent_positions, np.searchsorted(nodes[order], np.arange(self.__size + 1))
+
+    def __insert(self, keys):
+        """
+        Store the edges of the given keys with the shared value unless they are stored already.
+        """
+        keys = np.setdiff1d(keys, self.__keys)
+        if len(keys) == 0:
+            return
+
+        positions = np.searchsorted(self.__keys, keys)
+        self.__keys = np.insert(self.__keys, positions, keys)
+        self.__values = np.insert(self.__values, positions, self.__default)
+        self.__adjacency = None
+
+    def __key(self, starts, ends):
+        starts, ends = np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64)
+        return np.minimum(starts, ends) * self.__size + np.maximum(starts, ends)
+
+    def __find(self, starts, ends):
+        keys = self.__key(starts, ends)
+        positions = np.minimum(np.searchsorted(self.__keys, keys), len(self.__keys) - 1)
+        return positions, self.__keys[positions] == keys
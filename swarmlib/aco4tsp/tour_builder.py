@@ -0,0 +1,171 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import logging
+from typing import Tuple
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TourBuilder:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, graph, alpha: float, beta: float, random: np.random.Generator, candidates: np.ndarray = None, **kwargs):  # pylint: disable=too-many-arguments
+        """
+        Initializes a new instance of the `TourBuilder` class.
+        It constructs the tours of all ants at once instead of moving each ant on its own.
+
+        Arguments:
+            graph {Graph} -- The graph the ants travel on
+            alpha {float} -- Relative importance of the pheromone
+            beta {float} -- Relative importance of the heuristic information
+            random {numpy.random.Generator} -- The generator used to generate pseudo random numbers
+            candidates {numpy.ndarray} -- Candidate lists. Row i contains the nodes an ant at node i chooses from.
+                Only when all of them are visited, all unvisited nodes are considered. (default None, consider all nodes)
+
+        Keyword arguments:
+            q0 {float} -- Probability to choose the most attractive node instead of a random one (default 0)
+            local_update {Callable[[numpy.ndarray, numpy.ndarray], None]} -- Called with the edges' start and end indices
+                the ants traveled in each construction step (default None)
+            heuristic {numpy.ndarray} -- The heuristic information computed by `compute_heuristic` with the same beta,
+                e.g. shared by several builders (default None, it is computed from the distance matrix)
+        """
+        self.__graph = graph
+        self.__alpha = alpha
+        self.__beta = beta
+        self.__random = random
+        self.__candidates = candidates
+        self.__q0 = kwargs.get('q0', 0.)
+        self.__local_update = kwargs.get('local_update', None)
+
+        # Distances which are computed on demand are not stored as a matrix, hence neither is their heuristic information
+        distances = self.__graph.distance_matrix
+        self.__heuristic = kwargs.get('heuristic', None)
+        if self.__heuristic is None and isinstance(distances, np.ndarray):
+            self.__heuristic = compute_heuristic(distances, self.__beta)
+
+    def build(self, starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Construct one closed tour per start node.
+
+        Arguments:
+            starts {numpy.ndarray} -- The start node index of each ant
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray] -- The tours' node indices (ants x nodes+1) and the tours' lengths
+        """
+        ant_number = len(starts)
+        node_number = len(self.__graph.distance_matrix)
+        ants = np.arange(ant_number)
+
+        # The attractiveness only changes during the construction when there is a local pheromone update
+        attractiveness = None
+        if self.__local_update is None:
+            attractiveness = self.__attractiveness(np.arange(node_number), self.__candidates)
+
+        tours = np.empty((ant_number, node_number + 1), dtype=np.intp)
+        tours[:, 0] = starts
+        tours[:, -1] = starts
+        visited = np.zeros((ant_number, node_number), dtype=bool)
+        visited[ants, starts] = True
+
+        current = starts
+        for step in range(1, node_number):
+            if attractiveness is None:
+                weights = self.__attractiveness(current, None if self.__candidates is None else self.__candidates[current])
+            else:
+                weights = attractiveness[current]
+
+            previous = current
+            if self.__candidates is None:
+                current = self.__choose(weights, ~visited)
+            else:
+                current = self.__choose_candidates(previous, visited, weights)
+
+            tours[:, step] = current
+            visited[ants, current] = True
+            if self.__local_update is not None:
+                self.__local_update(previous, current)
+
+        if self.__local_update is not None:
+            self.__local_update(current, starts)
+
+        lengths = self.__graph.distance_matrix[tours[:, :-1], tours[:, 1:]].sum(axis=1)
+        LOGGER.debug('Constructed tours="%s" with lengths="%s"', tours, lengths)
+        return tours, lengths
+
+    def __choose_candidates(self, current, visited, candidate_weights):
+        """
+        Select the next node among the unvisited candidates of the current node.
+        Ants without unvisited candidates choose among all unvisited nodes.
+        """
+        candidates = self.__candidates[current]
+        allowed = ~np.take_along_axis(visited, candidates, axis=1)
+        has_candidates = np.any(allowed, axis=1)
+
+        selected = np.empty(len(current), dtype=np.intp)
+        if np.any(has_candidates):
+            choices = self.__choose(candidate_weights[has_candidates], allowed[has_candidates])
+            selected[has_candidates] = candidates[has_candidates, choices]
+
+        if not np.all(has_candidates):
+            fallback = ~has_candidates
+            selected[fallback] = self.__choose(self.__attractiveness(current[fallback]), ~visited[fallback])
+
+        return selected
+
+    def __attractiveness(self, rows, columns=None):
+        """
+        Get pheromone^alpha * heuristic^beta for the given rows.
+        If columns are given, only the columns of each row are returned.
+        """
+        index = rows if columns is None else (rows[:, np.newaxis], columns)
+        heuristic = compute_heuristic(self.__graph.distance_matrix[index], self.__beta) if self.__heuristic is None else self.__heuristic[index]
+        return np.power(self.__graph.pheromone_matrix[index], self.__alpha) * heuristic
+
+    def __choose(self, weights, allowed):
+        """
+        Roulette wheel selection for each row of weights. Only allowed entries can be selected.
+        Selects uniformly among the allowed entries if none of them is attractive.
+        With probability q0 the most attractive entry is selected instead.
+
+        Returns:
+            numpy.ndarray -- The selected column of each row
+        """
+        weights = np.where(allowed, weights, 0)
+        unattractive = ~np.any(weights > 0, axis=1)
+        weights[unattractive] = allowed[unattractive]
+
+        cumulative = np.cumsum(weights, axis=1)
+        thresholds = self.__random.random(len(weights)) * cumulative[:, -1]
+        choices = np.argmax(cumulative > thresholds[:, np.newaxis], axis=1)
+
+        if self.__q0 > 0:
+            exploit = self.__random.random(len(weights)) < self.__q0
+            choices[exploit] = np.argmax(weights[exploit], axis=1)
+
+        return choices
+
+
+def compute_heuristic(distances: np.ndarray, beta: float, out: np.ndarray = None) -> np.ndarray:
+    """
+    Get the heuristic information (1/distance)^beta. It is 0 for edges of length 0.
+
+    Arguments:
+        distances {numpy.ndarray} -- The distances
+        beta {float} -- Relative importance of the heuristic information
+
+    Keyword arguments:
+        out {numpy.ndarray} -- Array of the distances' shape the result is stored in (default None, a new array is allocated)
+
+    Returns:
+        numpy.ndarray -- The heuristic information
+    """
+    if out is None:
+        out = np.zeros(np.shape(distances))
+    else:
+        out[...] = 0
+    np.divide(1, distances, out=out, where=distances > 0)
+    return np.power(out, beta, out=out)
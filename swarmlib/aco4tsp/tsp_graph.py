@@ -4,73 +4,244 @@
 # ------------------------------------------------------------------------------------------------------
 
 import logging
-from copy import deepcopy
-from threading import RLock
-from tsplib95 import distances
+from itertools import combinations
 import networkx as nx
+import numpy as np
+
+from .distance_oracle import DistanceOracle
+from .sparse_pheromone import SparsePheromone
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Graph:
-    def __init__(self, problem):
-        self.__problem = problem
-        self.__problem.wfunc = self.__distance  # do not round distances
-        self.networkx_graph = self.__problem.get_graph()
-        self.__lock = RLock()
+class Graph:  # pylint: disable=too-many-public-methods
+    def __init__(self, instance, candidate_number: int = None):
+        """
+        Initializes a new instance of the `Graph` class.
+        The edge lengths and pheromone values are stored in dense n x n matrices
+        where n is the number of nodes. The node based API is a view onto these matrices.
+        If the instance's distances are a `DistanceOracle`, only the pheromone of the candidate list edges
+        and of the edges which received pheromone is stored.
+
+        Arguments:
+            instance {TspInstance} -- The loaded tsp problem
+
+        Keyword Arguments:
+            candidate_number {int} -- Length of the candidate lists whose edges' pheromone is stored.
+                Required if the distances are a `DistanceOracle`. (default None)
+        """
+        self.__instance = instance
+        self.__nodes = instance.nodes.tolist()
+        self.__indices = {node: index for index, node in enumerate(self.__nodes)}
+        self.__distances = instance.distances
+        self.__networkx_graph = None
+        self.__neighbors = {}
+        if isinstance(self.__distances, DistanceOracle):
+            if not candidate_number:
+                raise ValueError('Distances computed on demand require a candidate_number.')
+            self.__pheromone = SparsePheromone(self.get_neighbors(candidate_number))
+        else:
+            self.__pheromone = np.zeros_like(self.__distances)
 
     @property
     def node_coordinates(self):
-        return self.__problem.node_coords
+        return dict(zip(self.__nodes, self.__instance.coordinates))
 
     @property
     def name(self):
-        return deepcopy(self.__problem.comment)
+        return self.__instance.comment
+
+    @property
+    def distance_matrix(self) -> np.ndarray:
+        """The n x n edge length matrix. Row and column indices are the node indices."""
+        return self.__distances
+
+    @property
+    def pheromone_matrix(self) -> np.ndarray:
+        """The n x n pheromone matrix. Row and column indices are the node indices."""
+        return self.__pheromone
+
+    @property
+    def is_sparse(self) -> bool:
+        """Whether distances are computed on demand and only the candidate edges' pheromone is stored."""
+        return isinstance(self.__pheromone, SparsePheromone)
+
+    @property
+    def networkx_graph(self) -> nx.Graph:
+        """The graph over all edges listed by `get_edges`. It is created lazily as it is only needed for plotting."""
+        if self.__networkx_graph is None:
+            if self.is_sparse:
+                self.__networkx_graph = nx.Graph()
+                self.__networkx_graph.add_nodes_from(self.__nodes)
+                self.__networkx_graph.add_edges_from(self.get_edges())
+            else:
+                self.__networkx_graph = nx.complete_graph(self.__nodes)
+        return self.__networkx_graph
 
     def get_nodes(self):
         """Get all nodes."""
-        with self.__lock:
-            return list(self.networkx_graph.nodes())
+        return list(self.__nodes)
 
     def get_edges(self, node=None):
-        """Get all edges connected to the given node. (u,v)"""
-        with self.__lock:
-            return self.networkx_graph.edges(node)
+        """Get all edges connected to the given node. (u,v)
+        If the graph is sparse, only the edges whose pheromone is stored are listed."""
+        if self.is_sparse:
+            edges = [(self.__nodes[start], self.__nodes[end]) for start, end in zip(*self.__pheromone.edges())]
+            return edges if node is None else [edge if edge[0] == node else edge[::-1] for edge in edges if node in edge]
+        if node is None:
+            return list(combinations(self.__nodes, 2))
+        return [(node, other) for other in self.__nodes if other != node]
+
+    def get_edge_indices(self):
+        """
+        Get the matrix indices of all edges listed by `get_edges` in the same order.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray] -- The edges' start and end indices. The start is the smaller index.
+        """
+        if self.is_sparse:
+            return self.__pheromone.edges()
+        return np.triu_indices(len(self.__nodes), 1)
+
+    def get_indices(self, nodes) -> np.ndarray:
+        """Get the matrix indices of the given nodes."""
+        return np.array([self.__indices[node] for node in nodes], dtype=np.intp)
+
+    def get_node(self, index):
+        """Get the node at the given matrix index."""
+        return self.__nodes[index]
+
+    def get_neighbors(self, neighbor_number=None) -> np.ndarray:
+        """
+        Get the nearest neighbors of each node. The lists are computed once and cached.
+
+        Arguments:
+            neighbor_number {int} -- The number of neighbors per node. When omitted, all other nodes are listed.
+
+        Returns:
+            numpy.ndarray -- Row i contains the indices of the nearest neighbors of node i sorted by distance.
+        """
+        if neighbor_number not in self.__neighbors:
+            if isinstance(self.__distances, DistanceOracle):
+                self.__neighbors[neighbor_number] = self.__distances.nearest_neighbors(neighbor_number)
+            else:
+                self.__neighbors[neighbor_number] = nearest_neighbors(self.__distances, neighbor_number)
+        return self.__neighbors[neighbor_number]
 
     def set_pheromone(self, edge, value):
         """Set pheromone for the given edge.
         Edge is tuple (u,v)"""
-        with self.__lock:
-            self.networkx_graph.add_edge(*edge, pheromone=value)
+        start, end = self.__indices[edge[0]], self.__indices[edge[1]]
+        self.__pheromone[start, end] = value
+        self.__pheromone[end, start] = value
 
-    def get_connected_nodes(self, node):
+    def get_connected_nodes(self, node):  # pylint: disable=unused-argument
         """Get the connected nodes of the given node"""
-        with self.__lock:
-            return nx.node_connected_component(self.networkx_graph, node)
+        # The graph is complete, hence every node is connected to the given one.
+        return set(self.__nodes)
 
     def get_edge_pheromone(self, edge):
         """Get the pheromone value for the given edge"""
-        sorted_edge = tuple(sorted(edge))
-        return self.__get_edge_data(sorted_edge, 'pheromone')
+        return self.__pheromone[self.__indices[edge[0]], self.__indices[edge[1]]]
 
     def get_edge_length(self, edge):
-        """Get the `rounded` length of the given edge."""
-        # tsplib95 stores the distance as "weight"
-        return self.__get_edge_data(edge, 'weight')
+        """Get the length of the given edge."""
+        return self.__distances[self.__indices[edge[0]], self.__indices[edge[1]]]
 
-    def __get_edge_data(self, edge, label):
-        with self.__lock:
-            data = self.networkx_graph.get_edge_data(*edge)
-            result = deepcopy(data.get(label, 0))
+    def evaporate(self, rho: float) -> None:
+        """
+        Evaporate the pheromone of all edges in place.
 
-        # LOGGER.debug('Get data="%s", value="%s" for edge="%s"',
-        #              label, result, edge)
-        return result
+        Arguments:
+            rho {float} -- The evaporation rate
+        """
+        self.__pheromone *= 1 - rho
 
-    def __distance(self, start, end):
+    def deposit(self, starts: np.ndarray, ends: np.ndarray, amounts: np.ndarray) -> None:
         """
-        This method is used to call the tsplib95's distance functions
-        without rounding.
+        Add pheromone to the given edges in place.
+        Edges which occur several times receive the pheromone several times.
+
+        Arguments:
+            starts {numpy.ndarray} -- The edges' start indices
+            ends {numpy.ndarray} -- The edges' end indices
+            amounts {numpy.ndarray} -- The pheromone to add for each edge
+        """
+        if self.is_sparse:
+            self.__pheromone.add(starts, ends, amounts)
+        else:
+            np.add.at(self.__pheromone, (starts, ends), amounts)
+            np.add.at(self.__pheromone, (ends, starts), amounts)
+
+    def get_pheromone(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Get the pheromone of the given edges.
+
+        Arguments:
+            starts {numpy.ndarray} -- The edges' start indices
+            ends {numpy.ndarray} -- The edges' end indices
+
+        Returns:
+            numpy.ndarray -- The pheromone of each edge
+        """
+        return self.__pheromone[starts, ends]
+
+    def update_pheromone(self, starts: np.ndarray, ends: np.ndarray, values: np.ndarray) -> None:
+        """
+        Set the pheromone of the given edges in place.
+
+        Arguments:
+            starts {numpy.ndarray} -- The edges' start indices
+            ends {numpy.ndarray} -- The edges' end indices
+            values {numpy.ndarray} -- The new pheromone of each edge
+        """
+        self.__pheromone[starts, ends] = values
+        self.__pheromone[ends, starts] = values
+
+    def clip_pheromone(self, minimum: float, maximum: float) -> None:
+        """
+        Clip the pheromone of all edges to the given bounds in place.
         """
-        distance_function = distances.TYPES[self.__problem.edge_weight_type]
-        return distance_function(start=self.__problem.node_coords[start], end=self.__problem.node_coords[end], round=lambda x: round(x, 2))
+        if self.is_sparse:
+            self.__pheromone.clip(minimum, maximum)
+        else:
+            np.clip(self.__pheromone, minimum, maximum, out=self.__pheromone)
+
+    def attach_pheromone(self, pheromone: np.ndarray) -> None:
+        """
+        Store the pheromone in the given n x n array from now on, e.g. in a view onto shared memory.
+        The current pheromone is copied into it.
+
+        Arguments:
+            pheromone {numpy.ndarray} -- The array the pheromone is stored in
+        """
+        pheromone[:] = self.__pheromone
+        self.__pheromone = pheromone
+
+    def reset_pheromone(self, value: float) -> None:
+        """
+        Set the pheromone of all edges to the given value.
+        """
+        self.__pheromone.fill(value)
+
+
+def nearest_neighbors(distances, neighbor_number=None):
+    """
+    returns the neighbor lists of all nodes, sorted by distance and excluding the node itself.
+    distances - the distance matrix
+    neighbor_number - the length of each list. When omitted, all other nodes are listed.
+    """
+    size = len(distances)
+    neighbor_number = size - 1 if neighbor_number is None else min(neighbor_number, size - 1)
+
+    # Exclude the node itself by making it the farthest node
+    distances = np.array(distances, dtype=float)
+    np.fill_diagonal(distances, np.inf)
+
+    if neighbor_number < size - 1:
+        candidates = np.argpartition(distances, neighbor_number, axis=1)[:, :neighbor_number]
+    else:
+        candidates = np.tile(np.arange(size), (size, 1))
+    order = np.argsort(np.take_along_axis(distances, candidates, axis=1), axis=1, kind='stable')
+
+    return np.take_along_axis(candidates, order, axis=1)[:, :neighbor_number]
@@ -0,0 +1,309 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import hashlib
+from itertools import combinations
+import logging
+import math
+import os
+from os import path
+from typing import NamedTuple
+
+import numpy as np
+import tsplib95
+from tsplib95 import distances as tsplib95_distances
+
+from .distance_oracle import DistanceOracle
+
+LOGGER = logging.getLogger(__name__)
+
+# Cache directory used by the command line. The library only caches if a directory is given.
+DEFAULT_CACHE_DIR = path.join(path.expanduser('~'), '.cache', 'swarmlib', 'tsplib')
+
+# Number of distance matrix entries computed at once. Bounds the memory of the temporary arrays.
+BLOCK_SIZE = 2**22
+
+# Radius of the earth used by TSPLIB's GEO distance
+EARTH_RADIUS = 6378.388
+
+# The edge lengths are rounded to this many decimals instead of TSPLIB's integers. Only GEO distances stay integers.
+DECIMALS = 2
+
+# Changes whenever the cached distances change, so older cache entries are not used
+CACHE_VERSION = 2
+
+
+class TspInstance(NamedTuple):
+    """
+    A loaded symmetric traveling salesman problem.
+
+    Attributes:
+        name {str} -- The problem's name
+        comment {str} -- The problem's comment
+        nodes {numpy.ndarray} -- The node labels
+        coordinates {numpy.ndarray} -- The n x 2 node coordinates. Empty if the file has no coordinates.
+        distances {numpy.ndarray} -- The n x n distance matrix. It may be a read only memory map onto the cache
+            or a `DistanceOracle` which computes the distances on demand.
+    """
+    name: str
+    comment: str
+    nodes: np.ndarray
+    coordinates: np.ndarray
+    distances: np.ndarray
+
+
+def load_instance(tsp_file: str, cache_dir: str = None, lazy: bool = False, cache_rows: int = 256) -> TspInstance:
+    """
+    Load a TSPLIB file. Node coordinates of the types EUC_2D, CEIL_2D, GEO and ATT are parsed directly
+    and all distances are computed at once with numpy. Other files are loaded with tsplib95.
+    Like before, the distances are rounded to `DECIMALS` decimals instead of TSPLIB's integers.
+    If a `cache_dir` is given, the result is cached there, keyed by the file's hash.
+    Later calls load it from the cache and memory map the distances.
+
+    Arguments:
+        tsp_file {str} -- Path of the TSPLIB file
+
+    Keyword Arguments:
+        cache_dir {str} -- Directory of the cache, e.g. `DEFAULT_CACHE_DIR`. None disables the cache. (default None)
+        lazy {bool} -- Compute the distances on demand with a `DistanceOracle` instead of storing all of them.
+            Only supported for node coordinates of the types EUC_2D, CEIL_2D, GEO and ATT. The cache is not used. (default False)
+        cache_rows {int} -- Number of distance rows the `DistanceOracle` caches (default 256)
+
+    Returns:
+        TspInstance -- The loaded problem
+    """
+    if lazy:
+        return _parse(tsp_file, None, cache_rows)
+
+    if cache_dir is None:
+        return _parse(tsp_file, _allocate)
+
+    with open(tsp_file, 'rb') as file:
+        key = f'{hashlib.sha256(file.read()).hexdigest()}.v{CACHE_VERSION}'
+    instance_file = path.join(cache_dir, f'{key}.npz')
+    distances_file = path.join(cache_dir, f'{key}.distances.npy')
+
+    if path.isfile(instance_file) and path.isfile(distances_file):
+        LOGGER.info('Load tsp problem="%s" from cache="%s"', tsp_file, instance_file)
+        with np.load(instance_file) as cached:
+            return TspInstance(
+                name=str(cached['name']),
+                comment=str(cached['comment']),
+                nodes=cached['nodes'],
+                coordinates=cached['coordinates'],
+                distances=_map(distances_file))
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_cache(tsp_file, instance_file, distances_file)
+    except OSError as error:
+        LOGGER.warning('Cannot cache tsp problem="%s" in cache_dir="%s": %s', tsp_file, cache_dir, error)
+        return _parse(tsp_file, _allocate)
+
+    LOGGER.info('Cached tsp problem="%s" in cache="%s"', tsp_file, instance_file)
+    return load_instance(tsp_file, cache_dir)
+
+
+def euclidean_distances(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """EUC_2D and CEIL_2D: The euclidean distance rounded to `DECIMALS` decimals."""
+    return np.round(_euclidean(start, end), DECIMALS)
+
+
+def att_distances(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """ATT: The pseudo euclidean distance rounded to `DECIMALS` decimals. Like tsplib95, 1 is added if it was rounded down."""
+    value = _euclidean(start, end, 10)
+    distance = np.round(value, DECIMALS)
+    return np.where(distance < value, distance + 1, distance)
+
+
+def geo_distances(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """
+    GEO: The distance on the earth in km. The coordinates are the node coordinates in radians.
+    """
+    q1 = np.cos(start[..., 1] - end[..., 1])
+    q2 = np.cos(start[..., 0] - end[..., 0])
+    q3 = np.cos(start[..., 0] + end[..., 0])
+    return np.trunc(EARTH_RADIUS * np.arccos(np.clip(0.5 * ((1 + q1) * q2 - (1 - q1) * q3), -1, 1)) + 1)
+
+
+def geo_radians(coordinates: np.ndarray) -> np.ndarray:
+    """
+    Convert TSPLIB's GEO coordinates (DDD.MM, degrees and minutes) to radians.
+    """
+    degrees = np.trunc(coordinates)
+    return np.radians(degrees + (coordinates - degrees) * 5 / 3)
+
+
+def euclidean_distance(start: tuple, end: tuple) -> float:
+    """EUC_2D and CEIL_2D for a single edge."""
+    return round_distance(_scalar_euclidean(start, end))
+
+
+def att_distance(start: tuple, end: tuple) -> float:
+    """ATT for a single edge."""
+    value = _scalar_euclidean(start, end, 10)
+    distance = round_distance(value)
+    return distance + 1 if distance < value else distance
+
+
+def geo_distance(start: tuple, end: tuple) -> float:
+    """GEO for a single edge. It uses numpy's cosine to obtain exactly the same results as `geo_distances`."""
+    return float(geo_distances(np.array(start), np.array(end)))
+
+
+def round_distance(distance: float) -> float:
+    """Round a single distance to `DECIMALS` decimals exactly like numpy.round does."""
+    scale = 10**DECIMALS
+    return round(distance * scale) / scale
+
+
+DISTANCE_FUNCTIONS = {
+    'EUC_2D': euclidean_distances,
+    'CEIL_2D': euclidean_distances,
+    'ATT': att_distances,
+    'GEO': geo_distances
+}
+
+SCALAR_DISTANCE_FUNCTIONS = {
+    'EUC_2D': euclidean_distance,
+    'CEIL_2D': euclidean_distance,
+    'ATT': att_distance,
+    'GEO': geo_distance
+}
+
+
+def _euclidean(start, end, divisor=1):
+    delta_x = end[..., 0] - start[..., 0]
+    delta_y = end[..., 1] - start[..., 1]
+    return np.sqrt((delta_x * delta_x + delta_y * delta_y) / divisor)
+
+
+def _write_cache(tsp_file, instance_file, distances_file):
+    # Write to temporary files first, so concurrent or aborted runs never leave a partial cache entry behind
+    suffix = f'.{os.getpid()}.tmp'
+    instance = _parse(tsp_file, lambda shape: np.lib.format.open_memmap(distances_file + suffix, mode='w+', dtype=np.float64, shape=shape))
+    instance.distances.flush()
+    with open(instance_file + suffix, 'wb') as file:
+        np.savez(file, name=instance.name, comment=instance.comment, nodes=instance.nodes, coordinates=instance.coordinates)
+    os.replace(distances_file + suffix, distances_file)
+    os.replace(instance_file + suffix, instance_file)
+
+
+def _scalar_euclidean(start, end, divisor=1):
+    delta_x = end[0] - start[0]
+    delta_y = end[1] - start[1]
+    return math.sqrt((delta_x * delta_x + delta_y * delta_y) / divisor)
+
+
+def _map(distances_file):
+    # A plain array view onto the read only memory map
+    return np.asarray(np.load(distances_file, mmap_mode='r'))
+
+
+def _allocate(shape):
+    return np.zeros(shape)
+
+
+def _parse(tsp_file, allocate, cache_rows=None):
+    """
+    Parse the given file and compute its distances into the array returned by allocate(shape).
+    If allocate is None, the distances are computed on demand by a `DistanceOracle` instead.
+    """
+    with open(tsp_file, 'r', encoding='utf8') as file:
+        lines = file.read().splitlines()
+
+    specification, section_start = _read_specification(lines)
+    edge_weight_type = specification.get('EDGE_WEIGHT_TYPE')
+    if section_start is None or specification.get('TYPE') != 'TSP' or edge_weight_type not in DISTANCE_FUNCTIONS:
+        if allocate is None:
+            raise ValueError(f'Cannot compute the distances of tsp problem="{tsp_file}" with edge weight type="{edge_weight_type}" on demand.')
+        LOGGER.info('Load tsp problem="%s" with edge weight type="%s" using tsplib95', tsp_file, edge_weight_type)
+        return _load_with_tsplib95(tsp_file, allocate)
+
+    dimension = int(specification['DIMENSION'])
+    section = np.array(' '.join(lines[section_start:]).split()[:3 * dimension], dtype=float).reshape(dimension, 3)
+    nodes = section[:, 0].astype(np.int64)
+    coordinates = section[:, 1:]
+
+    points = geo_radians(coordinates) if edge_weight_type == 'GEO' else coordinates
+    if allocate is None:
+        embedding = _sphere_points(points) if edge_weight_type == 'GEO' else points
+        distances = DistanceOracle(points, DISTANCE_FUNCTIONS[edge_weight_type], cache_rows, embedding,
+                                   SCALAR_DISTANCE_FUNCTIONS[edge_weight_type])
+    else:
+        distances = allocate((dimension, dimension))
+        _compute_distances(DISTANCE_FUNCTIONS[edge_weight_type], points, distances)
+
+    return TspInstance(
+        name=specification.get('NAME', ''),
+        comment=specification.get('COMMENT', ''),
+        nodes=nodes,
+        coordinates=coordinates,
+        distances=distances)
+
+
+def _sphere_points(radians):
+    """
+    Get the points on the unit sphere. Their euclidean distances have the same order as the GEO distances.
+    """
+    latitude, longitude = radians[:, 0], radians[:, 1]
+    return np.column_stack([np.cos(latitude) * np.cos(longitude), np.cos(latitude) * np.sin(longitude), np.sin(latitude)])
+
+
+def _compute_distances(distance_function, points, distances):
+    """
+    Compute the distances between all points in blocks of rows and write them into the given array.
+    """
+    size = len(points)
+    block = max(BLOCK_SIZE // size, 1)
+    for start in range(0, size, block):
+        end = min(start + block, size)
+        distances[start:end] = distance_function(points[start:end, np.newaxis], points[np.newaxis])
+    np.fill_diagonal(distances, 0)
+
+
+def _read_specification(lines):
+    """
+    Read the key value pairs in front of the NODE_COORD_SECTION.
+    Returns them and the index of the section's first line, which is None if there is no such section.
+    """
+    specification = {}
+    for index, line in enumerate(lines):
+        if line.strip().startswith('NODE_COORD_SECTION'):
+            return specification, index + 1
+        if ':' in line:
+            key, value = line.split(':', 1)
+            specification.setdefault(key.strip(), value.strip())
+
+    return specification, None
+
+
+def _load_with_tsplib95(tsp_file, allocate):
+    problem = tsplib95.load_problem(tsp_file)
+    nodes = list(problem.get_nodes())
+    weight_function = _weight_function(problem)
+
+    distances = allocate((len(nodes), len(nodes)))
+    for start, end in combinations(range(len(nodes)), 2):
+        distance = weight_function(nodes[start], nodes[end])
+        distances[start, end] = distance
+        distances[end, start] = distance
+
+    coordinates = np.array([problem.node_coords[node] for node in nodes], dtype=float) if problem.node_coords else np.empty((0, 2))
+    return TspInstance(
+        name=problem.name or '',
+        comment=problem.comment or '',
+        nodes=np.array(nodes, dtype=np.int64),
+        coordinates=coordinates,
+        distances=distances)
+
+
+def _weight_function(problem):
+    if not problem.node_coords or problem.edge_weight_type not in tsplib95_distances.TYPES:
+        return problem.get_weight
+
+    # Call tsplib95's distance function without its rounding to integers
+    distance_function = tsplib95_distances.TYPES[problem.edge_weight_type]
+    return lambda start, end: distance_function(start=problem.node_coords[start], end=problem.node_coords[end], round=round_distance)
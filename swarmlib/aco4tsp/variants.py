@@ -0,0 +1,198 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import logging
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+# pylint: disable=invalid-name,too-many-instance-attributes
+
+
+class AntSystem:
+    """
+    The original Ant System. Every ant deposits pheromone on each edge of its tour.
+    The pheromone is not bounded.
+    """
+    # Probability to choose the most attractive node instead of a random one (pseudo-random proportional rule)
+    q0 = 0.
+    # Called with the edges the ants traveled in the current construction step. None if there is no local update.
+    local_update = None
+
+    def __init__(self, graph, **kwargs):
+        """
+        Initializes a new instance of the `AntSystem` class.
+
+        Arguments:
+            graph {Graph} -- The graph the ants travel on
+
+        Keyword arguments:
+            rho {float} -- Evaporation rate (default 0.5)
+            q {float} -- Constant Q. Used to calculate the pheromone, laid down on an edge (default 1)
+        """
+        self._graph = graph
+        self._rho = kwargs.get('rho', 0.5)
+        self._Q = kwargs.get('q', 1)
+
+    def initialize(self) -> None:
+        """
+        Set the initial pheromone before the first iteration.
+        """
+
+    def update(self, tours: np.ndarray, distances: np.ndarray, best_tour: np.ndarray, best_distance: float) -> None:  # pylint: disable=unused-argument
+        """
+        Update the pheromone after all ants constructed their tours.
+
+        Arguments:
+            tours {numpy.ndarray} -- The node indices of this iteration's tours (ants x nodes+1)
+            distances {numpy.ndarray} -- The tours' lengths
+            best_tour {numpy.ndarray} -- The node indices of the best tour found so far
+            best_distance {float} -- The length of the best tour found so far
+        """
+        self._graph.evaporate(self._rho)
+
+        starts, ends = tours[:, :-1].ravel(), tours[:, 1:].ravel()
+        self._graph.deposit(starts, ends, self._Q/self._graph.distance_matrix[starts, ends])
+
+
+class MaxMinAntSystem(AntSystem):
+    """
+    MAX-MIN Ant System. Only the iteration's best ant deposits pheromone and the pheromone is kept
+    within [tau_min, tau_max]. The pheromone is reinitialized when the search stagnates.
+    """
+
+    def __init__(self, graph, **kwargs):
+        """
+        Initializes a new instance of the `MaxMinAntSystem` class.
+
+        Arguments:
+            graph {Graph} -- The graph the ants travel on
+
+        Keyword arguments:
+            rho {float} -- Evaporation rate (default 0.5)
+            q {float} -- Constant Q. Used to calculate the pheromone, laid down on an edge (default 1)
+            p_best {float} -- Probability that the best tour is constructed again when the pheromone converged.
+                Used to calculate tau_min. (default 0.05)
+            stagnation_limit {int} -- Number of iterations without improvement before the pheromone is reinitialized (default 20)
+        """
+        super().__init__(graph, **kwargs)
+        self.__p_best = kwargs.get('p_best', 0.05)
+        self.__stagnation_limit = kwargs.get('stagnation_limit', 20)
+        self.__best_distance = None
+        self.__stagnation = 0
+        self.__tau_min = None
+        self.__tau_max = None
+
+    def initialize(self) -> None:
+        self.__set_bounds(nearest_neighbor_distance(self._graph.distance_matrix))
+        self._graph.reset_pheromone(self.__tau_max)
+
+    def update(self, tours: np.ndarray, distances: np.ndarray, best_tour: np.ndarray, best_distance: float) -> None:
+        if self.__best_distance is None or best_distance < self.__best_distance:
+            self.__best_distance = best_distance
+            self.__stagnation = 0
+            self.__set_bounds(best_distance)
+        else:
+            self.__stagnation += 1
+
+        self._graph.evaporate(self._rho)
+
+        iteration_best = np.argmin(distances)
+        tour = tours[iteration_best]
+        self._graph.deposit(tour[:-1], tour[1:], np.full(len(tour) - 1, self._Q/distances[iteration_best]))
+        self._graph.clip_pheromone(self.__tau_min, self.__tau_max)
+
+        if self.__stagnation >= self.__stagnation_limit:
+            LOGGER.info('No improvement for %s iterations. Reinitialize pheromone with tau_max="%s"', self.__stagnation, self.__tau_max)
+            self._graph.reset_pheromone(self.__tau_max)
+            self.__stagnation = 0
+
+    def __set_bounds(self, best_distance: float) -> None:
+        node_number = len(self._graph.distance_matrix)
+        self.__tau_max = self._Q / (self._rho * best_distance)
+
+        p_decision = np.power(self.__p_best, 1 / node_number)
+        average_choices = max(node_number / 2 - 1, 1)
+        self.__tau_min = min(self.__tau_max * (1 - p_decision) / (average_choices * p_decision), self.__tau_max)
+
+
+class AntColonySystem(AntSystem):
+    """
+    Ant Colony System. Ants choose the most attractive node with probability q0 (pseudo-random proportional rule).
+    Each traveled edge loses pheromone immediately (local update) and only the best tour found so far
+    receives pheromone after each iteration (global update).
+    """
+
+    def __init__(self, graph, **kwargs):
+        """
+        Initializes a new instance of the `AntColonySystem` class.
+
+        Arguments:
+            graph {Graph} -- The graph the ants travel on
+
+        Keyword arguments:
+            rho {float} -- Evaporation rate of the global update (default 0.5)
+            q {float} -- Constant Q. Used to calculate the pheromone, laid down on an edge (default 1)
+            q0 {float} -- Probability to choose the most attractive node (default 0.9)
+            xi {float} -- Evaporation rate of the local update (default 0.1)
+        """
+        super().__init__(graph, **kwargs)
+        self.q0 = kwargs.get('q0', 0.9)
+        self.__xi = kwargs.get('xi', 0.1)
+        self.__tau0 = None
+
+    def initialize(self) -> None:
+        node_number = len(self._graph.distance_matrix)
+        self.__tau0 = self._Q / (node_number * nearest_neighbor_distance(self._graph.distance_matrix))
+        self._graph.reset_pheromone(self.__tau0)
+
+    def local_update(self, starts: np.ndarray, ends: np.ndarray) -> None:  # pylint: disable=method-hidden
+        """
+        Move the pheromone of the given edges towards the initial pheromone.
+        An edge traveled by k ants, in either direction, is updated k times like by k ants one after another.
+
+        Arguments:
+            starts {numpy.ndarray} -- The traveled edges' start indices
+            ends {numpy.ndarray} -- The traveled edges' end indices
+        """
+        node_number = len(self._graph.distance_matrix)
+        edges, counts = np.unique(np.minimum(starts, ends) * node_number + np.maximum(starts, ends), return_counts=True)
+        starts, ends = np.divmod(edges, node_number)
+        pheromone = self._graph.get_pheromone(starts, ends)
+        self._graph.update_pheromone(starts, ends, self.__tau0 + (pheromone - self.__tau0) * (1 - self.__xi)**counts)
+
+    def update(self, tours: np.ndarray, distances: np.ndarray, best_tour: np.ndarray, best_distance: float) -> None:
+        starts, ends = best_tour[:-1], best_tour[1:]
+        pheromone = self._graph.get_pheromone(starts, ends)
+        self._graph.update_pheromone(starts, ends, (1 - self._rho) * pheromone + self._rho * self._Q / best_distance)
+
+
+VARIANTS = {
+    'AS': AntSystem,
+    'MMAS': MaxMinAntSystem,
+    'ACS': AntColonySystem
+}
+
+
+def nearest_neighbor_distance(distances: np.ndarray) -> float:
+    """
+    Get the length of the tour which always travels to the nearest unvisited node, starting at the first node.
+    It is used to estimate the initial pheromone.
+    """
+    node_number = len(distances)
+    visited = np.zeros(node_number, dtype=bool)
+    current = 0
+    visited[current] = True
+    overall_distance = 0.
+
+    for _ in range(node_number - 1):
+        candidates = np.where(visited, np.inf, distances[current])
+        following = np.argmin(candidates)
+        overall_distance += candidates[following]
+        visited[following] = True
+        current = following
+
+    return overall_distance + distances[current, 0]
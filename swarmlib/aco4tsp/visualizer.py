@@ -3,21 +3,49 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
+from typing import NamedTuple
+
 from matplotlib import animation
 from matplotlib import pyplot as plt
 import networkx as nx
+import numpy as np
 
 from ..util.visualizer_base import VisualizerBase
 
+
+class Snapshot(NamedTuple):
+    """The pheromone recorded in one iteration"""
+    iteration: int
+    positions: np.ndarray  # Positions of the recorded edges in the graph's edge list, None if all edges are recorded
+    pheromone: np.ndarray  # The recorded edges' pheromone as float32
+    best_tour: np.ndarray  # The best tour's node indices as int32
+
+
 class Visualizer(VisualizerBase):  # pylint:disable=too-many-instance-attributes
     def __init__(self, **kwargs):
+        """
+        Initializes a new instance of the `Visualizer` class.
+        It records the pheromone of the graph's edges as compact float32 snapshots.
+
+        Keyword Arguments:
+            interval {int} -- Milliseconds between two frames of the replay (default 1000)
+            continuous {bool} -- Repeat the replay (default False)
+            dark {bool} -- Use the dark theme (default False)
+            iteration_number {int} -- The number of iterations. The last one is always recorded. (default 10)
+            record_interval {int} -- Record every record_interval-th iteration only (default 1)
+            record_edges {int} -- Record the record_edges edges with the most pheromone and the best tour's edges only (default None, all edges)
+        """
         self.__interval = kwargs.get('interval', 1000)
         self.__continuous = kwargs.get('continuous', False)
+        self.__iteration_number = kwargs.get('iteration_number', 10)
+        self.__record_interval = kwargs.get('record_interval', 1)
+        self.__record_edges = kwargs.get('record_edges', None)
         dark = kwargs.get('dark', False)
 
-        # The edge color and width per iteration
-        self.__edge_widths = []
-        self.__edge_colors = []
+        self.__iteration = 0
+        self.__snapshots = []
+        # Sorted keys start * n + end of the graph's edges. Used to find the best tour's edges.
+        self.__edge_keys = None
 
         if dark:
             plt.style.use('dark_background')
@@ -29,26 +57,35 @@ class Visualizer(VisualizerBase):  # pylint:disable=too-many-instance-attributes
             self.__edge_color = 'black'
             self.__best_edge_color = 'blue'
 
+    @property
+    def snapshots(self):
+        """The recorded snapshots"""
+        return list(self.__snapshots)
+
     def add_data(self, **kwargs):
-        pheromone_map = kwargs['pheromone_map']
-        best_path = kwargs['best_path']
-
-        best_path_edges = [
-            tuple(sorted([
-                node,
-                best_path[idx+1]
-            ]))
-            for idx, node in enumerate(best_path[:-1])
-        ]
-
-        self.__edge_widths.append(self.__scale_range(pheromone_map.values()))
-
-        self.__edge_colors.append([
-            self.__best_edge_color
-            if edge in best_path_edges
-            else self.__edge_color
-            for edge in pheromone_map.keys()
-        ])
+        """
+        Record the graph's pheromone if the current iteration is recorded.
+
+        Keyword Arguments:
+            graph {Graph} -- The graph
+            best_tour {numpy.ndarray} -- The node indices of the best tour so far
+        """
+        self.__iteration += 1
+        if self.__iteration % self.__record_interval and self.__iteration != self.__iteration_number:
+            return
+
+        graph = kwargs['graph']
+        best_tour = np.asarray(kwargs['best_tour'], dtype=np.int32)
+        starts, ends = graph.get_edge_indices()
+        pheromone = graph.get_pheromone(starts, ends)
+
+        positions = None
+        if self.__record_edges is not None and self.__record_edges < len(pheromone):
+            strongest = np.argpartition(pheromone, -self.__record_edges)[-self.__record_edges:]
+            positions = np.union1d(strongest, self.__tour_positions(graph, best_tour)).astype(np.int32)
+            pheromone = pheromone[positions]
+
+        self.__snapshots.append(Snapshot(self.__iteration, positions, pheromone.astype(np.float32), best_tour))
 
     def replay(self, **kwargs):
         """Draw the given graph."""
@@ -57,26 +94,46 @@ class Visualizer(VisualizerBase):  # pylint:disable=too-many-instance-attributes
         plt.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
         node_pos = graph.node_coordinates
+        edges = graph.get_edges()
 
         def _update(num):
             ax.clear()
 
-            fig.canvas.set_window_title(f'{graph.name} - Iteration ({num+1}/{len(self.__edge_colors)})')
+            snapshot = self.__snapshots[num]
+            fig.canvas.manager.set_window_title(f'{graph.name} - Iteration ({snapshot.iteration}/{self.__iteration})')
+
+            positions = np.arange(len(edges)) if snapshot.positions is None else snapshot.positions
+            best = np.isin(positions, self.__tour_positions(graph, snapshot.best_tour))
+            edge_colors = np.where(best, self.__best_edge_color, self.__edge_color).tolist()
 
             nodes_artist = nx.draw_networkx_nodes(graph.networkx_graph, pos=node_pos, ax=ax, node_color=self.__node_color)
             labels_artist = nx.draw_networkx_labels(graph.networkx_graph, pos=node_pos, ax=ax)
-            edges_artist = nx.draw_networkx_edges(graph.networkx_graph, pos=node_pos, width=self.__edge_widths[num], edge_color=self.__edge_colors[num], ax=ax)
+            edges_artist = nx.draw_networkx_edges(graph.networkx_graph, pos=node_pos, edgelist=[edges[position] for position in positions.tolist()],
+                                                  width=self.__scale_range(snapshot.pheromone), edge_color=edge_colors, ax=ax)
 
             return nodes_artist, labels_artist, edges_artist
 
-        _ = animation.FuncAnimation(fig, _update, frames=len(self.__edge_colors), interval=self.__interval, repeat=self.__continuous)
+        _ = animation.FuncAnimation(fig, _update, frames=len(self.__snapshots), interval=self.__interval, repeat=self.__continuous)
         plt.show()
 
+    def __tour_positions(self, graph, tour):
+        """
+        Get the positions of the tour's edges in the graph's edge list. Edges which are not listed are skipped.
+        """
+        size = len(graph.get_nodes())
+        if self.__edge_keys is None:
+            starts, ends = graph.get_edge_indices()
+            self.__edge_keys = starts.astype(np.int64) * size + ends
+        tour = tour.astype(np.int64)
+        keys = np.minimum(tour[:-1], tour[1:]) * size + np.maximum(tour[:-1], tour[1:])
+        positions = np.minimum(np.searchsorted(self.__edge_keys, keys), len(self.__edge_keys) - 1)
+        return positions[self.__edge_keys[positions] == keys]
+
     @staticmethod
-    def __scale_range(seq, new_max=10, new_min=0.01):
-        old_max = max(seq)
-        old_min = min(seq)
-        return [
-            (((old_value - old_min) * (new_max - new_min)) / (old_max - old_min)) + new_min
-            for old_value in iter(seq)
-        ]
+    def __scale_range(values, new_max=10, new_min=0.01):
+        old_max = values.max()
+        old_min = values.min()
+        if old_max == old_min:
+            # Uniform pheromone, e.g. after it was (re)initialized
+            return np.full(len(values), new_min)
+        return (values - old_min) * ((new_max - new_min) / (old_max - old_min)) + new_min
@@ -5,14 +5,14 @@
 
 # pylint: disable=too-many-instance-attributes
 
-from copy import deepcopy
 import logging
 
 import numpy as np
 
-from .nest import Nest
-from ..util import levy_flight as cuckoo
+from ..util.levy_flight import LevyFlightSampler
+from ..util.population import Population
 from ..util.problem_base import ProblemBase
+from ..util.solution import Solution
 from .visualizer import Visualizer
 LOGGER = logging.getLogger(__name__)
 
@@ -23,61 +23,54 @@ class CuckooProblem(ProblemBase):
         Initialize a new cuckoo search problem.
         """
         super().__init__(**kwargs)
-        self.__upper_boundary = kwargs.get('upper_boundary', 4.)
-        self.__lower_boundary = kwargs.get('lower_boundary', 0.)
-        self.__alpha = kwargs.pop('alpha', 1)
+        self.__levy_flight = LevyFlightSampler(kwargs.pop('alpha', 1), kwargs.pop('lambda', 1.5), self._random)
         self.__max_generations = kwargs.pop('max_generations', 10)
-        self.__lambda = kwargs.pop('lambda', 1.5)
         self.__p_a = kwargs.pop('p_a', .1)
 
-        self.__function = kwargs['function']
-        self.__nests = [
-            Nest(lower_boundary=self.__lower_boundary, upper_boundary=self.__upper_boundary, function=self.__function, bit_generator=self._random)
-            for _ in range(kwargs['nests'])
-        ]
+        self.__population = Population(kwargs['nests'], **kwargs, bit_generator=self._random, evaluator=self._evaluator)
 
         # Initialize visualizer for plotting
         kwargs['iteration_number'] = self.__max_generations
-        self._visualizer = Visualizer(**kwargs)
+        self._init_visualizer(Visualizer, **kwargs)
 
-    def solve(self) -> Nest:
-        nest_indices = np.array(range(len(self.__nests)))
-        best_nest = deepcopy(min(self.__nests, key=lambda nest: nest.value))
+    def solve(self) -> Solution:
+        nest_number = len(self.__population)
+        nest_indices = np.arange(nest_number)
+        # A nest counts as abandoned from its initialization until a cuckoo's egg replaces it
+        abandoned = np.ones(nest_number, dtype=bool)
+        best_nest = self._best_solution(self.__population, 0)
 
-        positions, abandoned = zip(*[(nest.position, nest.abandoned) for nest in self.__nests])
-        self._visualizer.add_data(positions=positions, best_position=best_nest.position, abandoned=abandoned)
+        self._visualizer.add_data(positions=self.__population.positions, best_position=best_nest.position, abandoned=abandoned)
 
         LOGGER.info('Iteration 0 best solution="%s" at position="%s"', best_nest.value, best_nest.position)
 
         for iteration in range(self.__max_generations):
 
-            # Perform levy flights to get cuckoo's new position
-            new_cuckoo_pos = [
-                np.clip(cuckoo.levy_flight(nest.position, self.__alpha, self.__lambda, self._random), a_min=self.__lower_boundary, a_max=self.__upper_boundary)
-                for nest in self.__nests
-            ]
+            # Perform levy flights from all nests at once to get the cuckoos' new positions
+            new_cuckoo_pos = self.__population.clip(self.__levy_flight(self.__population.positions))
+            new_cuckoo_values = self.__population.evaluate(new_cuckoo_pos)
 
-            # Randomly select nests to be updated
+            # Each cuckoo lays its egg into a random nest and replaces it if the egg is better
             self._random.shuffle(nest_indices)
+            improved = new_cuckoo_values < self.__population.values[nest_indices]
+            self.__population.move(new_cuckoo_pos[improved], nest_indices[improved], new_cuckoo_values[improved])
+            abandoned[nest_indices[improved]] = False
 
-            # Update nests
-            for index, pos in zip(nest_indices, new_cuckoo_pos):
-                self.__nests[index].update_pos(pos)
-
-            # Abandon nests randomly considering p_a
-            for nest in self.__nests:
-                if self._random.random() < self.__p_a:
-                    nest.abandon()
+            # Abandon nests randomly considering p_a and initialize the new nests all at once
+            abandon = self._random.random(nest_number) < self.__p_a
+            if np.any(abandon):
+                self.__population.initialize(np.flatnonzero(abandon))
+                abandoned |= abandon
 
             # Update best nest
-            current_best = min(self.__nests)
-            if current_best < best_nest:
-                best_nest = deepcopy(current_best)
+            current_best = self.__population.best()
+            if self.__population.values[current_best] < best_nest.value:
+                best_nest = self._best_solution(self.__population, iteration + 1, best_nest)
                 LOGGER.info('Iteration %i Found new best solution="%s" at position="%s"', iteration+1, best_nest.value, best_nest.position)
 
             # Add data for plot
-            positions, abandoned = zip(*[(nest.position, nest.abandoned) for nest in self.__nests])
-            self._visualizer.add_data(positions=positions, best_position=current_best.position, abandoned=abandoned)
+            self._visualizer.add_data(
+                positions=self.__population.positions, best_position=self.__population.positions[current_best], abandoned=abandoned)
 
         LOGGER.info('Last best solution="%s" at position="%s"', best_nest.value, best_nest.position)
         return best_nest
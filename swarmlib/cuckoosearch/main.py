@@ -6,6 +6,7 @@
 import logging
 
 from .cuckoo_problem import CuckooProblem
+from ..util.arguments import boundary
 from ..util.functions import FUNCTIONS
 
 LOGGER = logging.getLogger(__name__)
@@ -44,15 +45,22 @@ def configure_parser(sub_parsers):
     parser.add_argument(
         '-u',
         '--upper-boundary',
-        type=float,
+        type=boundary,
         default=4.,
-        help='Upper boundary of the function (default 4)')
+        help='Upper boundary of the function. Either one for all dimensions or comma separated, one per dimension (default 4)')
     parser.add_argument(
         '-l',
         '--lower-boundary',
-        type=float,
+        type=boundary,
         default=0.,
-        help='Lower boundary of the function (default 0)')
+        help='Lower boundary of the function. Either one for all dimensions or comma separated, one per dimension (default 0)')
+    parser.add_argument(
+        '-D',
+        '--dimensions',
+        type=int,
+        default=2,
+        help='''Number of dimensions of the search space. The visualization is only available in 2D.
+        Functions which are defined in 2D only ignore all further dimensions (default 2)''')
     parser.add_argument(
         '-a',
         '--alpha',
@@ -77,6 +85,11 @@ def configure_parser(sub_parsers):
         type=float,
         default=.1,
         help='Fraction of nests that will be randomly abandoned after each iteration (default 0.1)')
+    parser.add_argument(
+        '--no-record',
+        dest='record',
+        action='store_false',
+        help='Do not record the nests for the replay. Use it to run headless')
 
     parser.add_argument(
         'nests',
@@ -3,7 +3,7 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
-from typing import Tuple
+import numpy as np
 
 from ..util.coordinate import Coordinate
 
@@ -28,17 +28,21 @@ class Nest(Coordinate):
         self.__abandoned = True
         self._initialize()
 
-    def update_pos(self, new_position: Tuple[float, float]) -> None:
+    def update_pos(self, new_position: np.ndarray, new_value: float = None) -> None:
         """
         If the new position's value is better than the old one, update the nests position and value.
+        The new position is clipped to the boundaries and evaluated once at most.
 
         Arguments:
-            new_position {Tuple[float, float]} -- The new position
+            new_position {numpy.ndarray} -- The new position
+
+        Keyword Arguments:
+            new_value {float} -- The clipped position's value if it was evaluated already, e.g. together with other positions (default None)
         """
+        new_position = self._population.clip(new_position)[0]
+        if new_value is None:
+            new_value = self._population.evaluate_position(new_position)
 
-        new_value = self._function(new_position)
         if new_value < self.value:
-            if self.__abandoned:
-                self.__abandoned = False
-            # Value is updated automatically in base class
-            self._position = new_position
+            self.__abandoned = False
+            self._population.move(new_position, self._index, new_value)
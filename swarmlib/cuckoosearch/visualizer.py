@@ -13,7 +13,7 @@ class Visualizer(BaseVisualizer):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        ax = self._fig.gca(label='BaseAxis')
+        ax = self._ax
         self.__best_nests_artist, = ax.plot([], [], 'o', color='#FFA500' if self._dark else '#ffff00', ms=6)
         self.__best_nests = [[], []]
         self._abandon_map = []
@@ -0,0 +1,163 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+# pylint: disable=too-many-arguments
+
+import logging
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None  # pylint: disable=invalid-name
+
+LOGGER = logging.getLogger(__name__)
+
+MEMORY_BUDGET = 256 * 2**20  # bytes
+# Bytes per pairwise interaction: the float weight and the brightness mask
+_BYTES_PER_PAIR = 9
+# Bytes per pair when scanning for the nearest neighbors: the float distance and the index array of the partition
+_SCAN_BYTES_PER_PAIR = 16
+# The approximate attraction chooses the brightest fireflies among that many times as many nearest neighbors
+NEIGHBORHOOD_FACTOR = 4
+
+
+def squared_distances(positions: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    Calculate the squared euclidean distances between all pairs of positions.
+
+    Arguments:
+        positions {numpy.ndarray} -- The (N x D) positions
+        others {numpy.ndarray} -- The (M x D) other positions
+
+    Returns:
+        numpy.ndarray -- The (N x M) squared distances
+    """
+    # Work in place to allocate a single (N x M) matrix
+    distances = np.matmul(positions, others.T)
+    distances *= -2
+    distances += np.sum(positions**2, axis=1)[:, None]
+    distances += np.sum(others**2, axis=1)[None, :]
+    # Rounding errors can make the distance of (nearly) equal positions negative
+    return np.maximum(distances, 0, out=distances)
+
+
+def attraction(positions: np.ndarray, values: np.ndarray, beta: float, gamma: float,
+               memory_budget: int = MEMORY_BUDGET) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the moves of all fireflies towards all brighter ones at once.
+    Each firefly i is attracted by each firefly j with a lower value by beta * exp(-gamma * r_ij^2) * (x_j - x_i).
+    The pairs are processed in tiles of as many rows as fit into the memory budget.
+
+    Arguments:
+        positions {numpy.ndarray} -- The (N x D) positions of the fireflies
+        values {numpy.ndarray} -- Their N values
+        beta {float} -- Attractiveness at distance=0
+        gamma {float} -- Characterizes the variation of the attractiveness
+
+    Keyword Arguments:
+        memory_budget {int} -- Bytes the pairwise matrices of a tile may use. At least one row is processed at once. (default 256 MiB)
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray] -- The (N x D) sums of the moves and whether each firefly moves at all
+    """
+    size = len(positions)
+    moves = np.empty_like(positions)
+    moved = np.empty(size, dtype=bool)
+    rows = max(memory_budget // (_BYTES_PER_PAIR * size), 1)
+
+    for start in range(0, size, rows):
+        tile = slice(start, min(start + rows, size))
+        # Work in place to keep a single float matrix per tile
+        weights = squared_distances(positions[tile], positions)
+        weights *= -gamma
+        np.exp(weights, out=weights)
+        brighter = values[None, :] < values[tile, None]
+        weights *= brighter
+        weights *= beta
+
+        moves[tile] = weights @ positions - np.sum(weights, axis=1)[:, None] * positions[tile]
+        moved[tile] = np.any(brighter, axis=1)
+        # Release the tile before the next one is allocated
+        del weights, brighter
+
+    return moves, moved
+
+
+def approximate_attraction(positions: np.ndarray, values: np.ndarray, beta: float, gamma: float, neighbor_number: int,
+                           memory_budget: int = MEMORY_BUDGET) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the moves of all fireflies towards their brightest neighbors.
+    Each firefly is attracted by the `neighbor_number` brightest fireflies among its `NEIGHBORHOOD_FACTOR` times as many
+    nearest neighbors that are brighter than itself, like in `attraction`. The neighbors are found with a KD-tree if
+    scipy is installed (the `kdtree` extra), which takes O(N log N). Otherwise all distances are scanned in tiles,
+    which takes O(N^2) like `attraction` and is not faster than it.
+
+    Arguments:
+        positions {numpy.ndarray} -- The (N x D) positions of the fireflies
+        values {numpy.ndarray} -- Their N values
+        beta {float} -- Attractiveness at distance=0
+        gamma {float} -- Characterizes the variation of the attractiveness
+        neighbor_number {int} -- The maximum number of fireflies a firefly is attracted by
+
+    Keyword Arguments:
+        memory_budget {int} -- Bytes the distance tiles may use if scipy is not installed (default 256 MiB)
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray] -- The (N x D) sums of the moves and whether each firefly moves at all
+    """
+    neighbors = nearest_neighbors(positions, NEIGHBORHOOD_FACTOR * neighbor_number, memory_budget)
+
+    # Choose the brightest neighbors, the ones that are not brighter than the firefly itself do not attract it
+    neighbor_values = np.where(values[neighbors] < values[:, None], values[neighbors], np.inf)
+    if neighbor_number < neighbors.shape[1]:
+        brightest = np.argpartition(neighbor_values, neighbor_number - 1, axis=1)[:, :neighbor_number]
+        neighbors = np.take_along_axis(neighbors, brightest, axis=1)
+        neighbor_values = np.take_along_axis(neighbor_values, brightest, axis=1)
+    brighter = np.isfinite(neighbor_values)
+
+    differences = positions[neighbors] - positions[:, None]
+    weights = beta * np.exp(-gamma * np.sum(differences**2, axis=2)) * brighter
+    return np.einsum('ij,ijk->ik', weights, differences), np.any(brighter, axis=1)
+
+
+def nearest_neighbors(positions: np.ndarray, neighbor_number: int, memory_budget: int = MEMORY_BUDGET) -> np.ndarray:
+    """
+    Find the nearest other positions of each position.
+
+    Arguments:
+        positions {numpy.ndarray} -- The (N x D) positions
+        neighbor_number {int} -- The number of neighbors per position. At most N - 1 are found.
+
+    Keyword Arguments:
+        memory_budget {int} -- Bytes the distance tiles may use if scipy is not installed (default 256 MiB)
+
+    Returns:
+        numpy.ndarray -- Row i contains the indices of the neighbors of position i in no particular order
+    """
+    size = len(positions)
+    neighbor_number = min(neighbor_number, size - 1)
+    if neighbor_number < 1:
+        return np.empty((size, 0), dtype=np.intp)
+
+    # Find one more neighbor as the position itself is found as well
+    if cKDTree is not None:
+        _, candidates = cKDTree(positions).query(positions, neighbor_number + 1)
+        candidates = np.asarray(candidates, dtype=np.intp).reshape(size, neighbor_number + 1)
+    else:
+        candidates = np.empty((size, neighbor_number + 1), dtype=np.intp)
+        rows = max(memory_budget // (_SCAN_BYTES_PER_PAIR * size), 1)
+        for start in range(0, size, rows):
+            tile = slice(start, min(start + rows, size))
+            distances = squared_distances(positions[tile], positions)
+            candidates[tile] = np.argpartition(distances, neighbor_number, axis=1)[:, :neighbor_number + 1]
+            del distances
+
+    # Drop the position itself, or the farthest candidate if it was not found due to equal positions
+    itself = candidates == np.arange(size)[:, None]
+    itself[~np.any(itself, axis=1), -1] = True
+    return candidates[~itself].reshape(size, neighbor_number)
@@ -28,4 +28,5 @@ class Firefly(Coordinate):
             self.__alpha*(self._random.uniform(0, 1)-0.5)
 
     def random_walk(self, area):
-        self._position = np.array([self._random.uniform(cord-area, cord+area) for cord in self._position])
+        position = self._position
+        self._position = self._random.uniform(position - area, position + area)
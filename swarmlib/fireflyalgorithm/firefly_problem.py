@@ -3,15 +3,23 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
-from copy import deepcopy
+# pylint: disable=too-many-instance-attributes
+
 import logging
 
+import numpy as np
+
+from .attraction import MEMORY_BUDGET, approximate_attraction, attraction
 from .firefly import Firefly
 from ..util.base_visualizer import BaseVisualizer
+from ..util.population import Population
 from ..util.problem_base import ProblemBase
+from ..util.solution import Solution
 
 LOGGER = logging.getLogger(__name__)
 
+ENGINES = ('loop', 'vectorized')
+
 
 class FireflyProblem(ProblemBase):
     def __init__(self, **kwargs):
@@ -19,40 +27,62 @@ class FireflyProblem(ProblemBase):
 
         Keyword arguments:  \r
         `firefly_number`   -- Number of fireflies used for solving
-        `function`         -- The 2D evaluation function. Its input is a 2D numpy.array  \r
-        `upper_boundary`   -- Upper boundary of the function (default 4)  \r
-        `lower_boundary`   -- Lower boundary of the function (default 0)  \r
+        `function`         -- The evaluation function. Its input is a numpy.array with one entry per dimension  \r
+        `dimensions`       -- Number of dimensions of the search space (default 2)  \r
+        `upper_boundary`   -- Upper boundary of the function, a single one or one per dimension (default 4)  \r
+        `lower_boundary`   -- Lower boundary of the function, a single one or one per dimension (default 0)  \r
         `alpha`            -- Randomization parameter (default 0.25)  \r
         `beta`             -- Attractiveness at distance=0 (default 1)  \r
         `gamma`            -- Characterizes the variation of the attractiveness. (default 0.97) \r
         `iteration_number` -- Number of iterations to execute (default 100)  \r
         `interval`         -- Interval between two animation frames in ms (default 500)  \r
-        `continuous`       -- Indicates whether the algorithm should run continuously (default False)
+        `continuous`       -- Indicates whether the algorithm should run continuously (default False)  \r
+        `engine`           -- Move the fireflies one after another (`loop`) or all at once (`vectorized`) (default loop)  \r
+        `evaluate_once`    -- Evaluate each firefly once per iteration instead of after each move. The brightness
+                              of the fireflies is fixed during an iteration then. The vectorized engine always does. (default False)  \r
+        `memory_budget`    -- Bytes the vectorized engine may use for the pairwise interactions. They are processed in tiles
+                              that fit into the budget. (default 256 MiB)  \r
+        `neighbor_number`  -- Let the vectorized engine attract each firefly by its brightest nearby fireflies only, at most
+                              that many. The neighbors are found with a KD-tree if scipy is installed. (default None, all brighter fireflies)  \r
+        `evaluation`       -- Evaluate the positions `serial`, in `threads`, in `processes` or with an executor (default serial)
         """
         super().__init__(**kwargs)
         self.__iteration_number = kwargs.get('iteration_number', 10)
+        self.__engine = kwargs.get('engine', 'loop')
+        if self.__engine not in ENGINES:
+            raise ValueError(f'Unknown engine="{self.__engine}". Choose one of {ENGINES}.')
+        self.__evaluate_once = kwargs.get('evaluate_once', False)
+        self.__alpha = kwargs.get('alpha', 0.25)
+        self.__beta = kwargs.get('beta', 1)
+        self.__gamma = kwargs.get('gamma', 0.97)
+        self.__memory_budget = kwargs.get('memory_budget', None) or MEMORY_BUDGET
+        self.__neighbor_number = kwargs.get('neighbor_number', None)
         # Create fireflies
+        self.__population = Population(kwargs['firefly_number'], **kwargs, bit_generator=self._random, evaluator=self._evaluator)
         self.__fireflies = [
-            Firefly(**kwargs, bit_generator=self._random)
-            for _ in range(kwargs['firefly_number'])
+            Firefly(**kwargs, population=self.__population, index=index)
+            for index in range(kwargs['firefly_number'])
         ]
 
         # Initialize visualizer for plotting
-        self._visualizer = BaseVisualizer(**kwargs)
-        self._visualizer.add_data(positions=[firefly.position for firefly in self.__fireflies])
+        self._init_visualizer(BaseVisualizer, **kwargs)
+        self._visualizer.add_data(positions=self.__population.positions)
 
-    def solve(self) -> Firefly:
+    def solve(self) -> Solution:
         """Solve the problem."""
         best = None
-        for _ in range(self.__iteration_number):
-            for i in self.__fireflies:
-                for j in self.__fireflies:
-                    if j < i:
-                        i.move_towards(j.position)
+        for iteration in range(self.__iteration_number):
+            if self.__engine == 'vectorized':
+                self.__move_all()
+            elif self.__evaluate_once:
+                # The moved fireflies are evaluated together at the end of the iteration
+                with self.__population.deferred():
+                    self.__move_one_by_one()
+            else:
+                self.__move_one_by_one()
 
-            current_best = min(self.__fireflies)
-            if not best or current_best < best:
-                best = deepcopy(current_best)
+            current_best = self.__fireflies[self.__population.best()]
+            best = self._best_solution(self.__population, iteration + 1, best)
 
             LOGGER.info('Current best value: %s, Overall best value: %s', current_best.value, best.value)
 
@@ -60,6 +90,25 @@ class FireflyProblem(ProblemBase):
             current_best.random_walk(0.1)
 
             # Add data for visualization
-            self._visualizer.add_data(positions=[firefly.position for firefly in self.__fireflies])
+            self._visualizer.add_data(positions=self.__population.positions)
 
         return best
+
+    def __move_one_by_one(self) -> None:
+        for i in self.__fireflies:
+            for j in self.__fireflies:
+                if j < i:
+                    i.move_towards(j.position)
+
+    def __move_all(self) -> None:
+        # All fireflies move towards all brighter ones at the same time, each one with a single random step
+        positions = self.__population.positions
+        if self.__neighbor_number:
+            moves, moved = approximate_attraction(positions, self.__population.values, self.__beta, self.__gamma,
+                                                  self.__neighbor_number, self.__memory_budget)
+        else:
+            moves, moved = attraction(positions, self.__population.values, self.__beta, self.__gamma, self.__memory_budget)
+        random_steps = self.__alpha * (self._random.uniform(0, 1, len(positions)) - 0.5)
+
+        indices = np.flatnonzero(moved)
+        self.__population.move(positions[indices] + moves[indices] + random_steps[indices, None], indices)
@@ -4,7 +4,8 @@
 # ------------------------------------------------------------------------------------------------------
 
 import logging
-from .firefly_problem import FireflyProblem
+from .firefly_problem import ENGINES, FireflyProblem
+from ..util.arguments import boundary
 from ..util.functions import FUNCTIONS
 
 LOGGER = logging.getLogger(__name__)
@@ -13,6 +14,7 @@ LOGGER = logging.getLogger(__name__)
 def _run_firefly_algorithm(args):
     LOGGER.info('Start firefly algorithm with parameters="%s"', args)
     args['function'] = FUNCTIONS[args['function']]
+    args['memory_budget'] = args['memory_budget'] * 2**20
 
     problem = FireflyProblem(**args)
     problem.solve()
@@ -43,15 +45,22 @@ def configure_parser(sub_parsers):
     parser.add_argument(
         '-u',
         '--upper-boundary',
-        type=float,
+        type=boundary,
         default=4.,
-        help='Upper boundary of the function (default 4)')
+        help='Upper boundary of the function. Either one for all dimensions or comma separated, one per dimension (default 4)')
     parser.add_argument(
         '-l',
         '--lower-boundary',
-        type=float,
+        type=boundary,
         default=0.,
-        help='Lower boundary of the function (default 0)')
+        help='Lower boundary of the function. Either one for all dimensions or comma separated, one per dimension (default 0)')
+    parser.add_argument(
+        '-D',
+        '--dimensions',
+        type=int,
+        default=2,
+        help='''Number of dimensions of the search space. The visualization is only available in 2D.
+        Functions which are defined in 2D only ignore all further dimensions (default 2)''')
     parser.add_argument(
         '-a',
         '--alpha',
@@ -77,6 +86,30 @@ def configure_parser(sub_parsers):
         default=10,
         help='Number of iterations to execute (default 10)')
 
+    parser.add_argument(
+        '-e',
+        '--engine',
+        type=str,
+        default='loop',
+        choices=ENGINES,
+        help='Move the fireflies one after another (loop) or all at once (vectorized) (default loop)')
+    parser.add_argument(
+        '--evaluate-once',
+        action='store_true',
+        default=False,
+        help='Evaluate each firefly once per iteration instead of after each move (default off)')
+    parser.add_argument(
+        '--memory-budget',
+        type=int,
+        default=256,
+        help='Megabytes the vectorized engine may use for the pairwise interactions of the fireflies (default 256)')
+    parser.add_argument(
+        '--neighbor-number',
+        type=int,
+        default=None,
+        help='''Let the vectorized engine attract each firefly by at most that many of its brightest nearby fireflies.
+        Large swarms scale with O(N log N) if scipy is installed (default None, all brighter fireflies)''')
+
     parser.add_argument(
         'firefly_number',
         type=int,
@@ -4,13 +4,11 @@
 # ------------------------------------------------------------------------------------------------------
 
 import logging
-from copy import deepcopy
 import numpy as np
-from .wolf import Wolf
 from .visualizer import Visualizer
+from ..util.population import Population
 from ..util.problem_base import ProblemBase
-
-# pylint: disable=too-many-instance-attributes
+from ..util.solution import Solution
 
 LOGGER = logging.getLogger(__name__)
 
@@ -19,49 +17,56 @@ class GWOProblem(ProblemBase):
     def __init__(self, **kwargs):
         """
         Initialize a new grey wolf optimization problem.
+        The whole pack is moved at once and its leaders are stored as rows of the population.
         """
         super().__init__(**kwargs)
 
         self.__iteration_number = kwargs.get('iteration_number', 30)
-        self.__wolves = [
-            Wolf(**kwargs, bit_generator=self._random)
-            for _ in range(kwargs['wolves'])
-        ]
+        self.__population = Population(kwargs['wolves'], **kwargs, bit_generator=self._random, evaluator=self._evaluator)
 
         # Initialize visualizer for plotting
-        best_indices = np.argsort(self.__wolves)[:3]
-        positions = [wolf.position for wolf in self.__wolves]
-        self._visualizer = Visualizer(**kwargs)
+        self._init_visualizer(Visualizer, **kwargs)
         self._visualizer.add_data(
-            positions=positions,
-            best_wolf_indices=best_indices)
+            positions=self.__population.positions,
+            best_wolf_indices=self.__leaders())
 
-    def solve(self) -> Wolf:
+    def solve(self) -> Solution:
 
         # Initialization
-        best = None
-        best_indices = np.argsort(self.__wolves)[:3]
-        alpha, beta, delta = [deepcopy(self.__wolves[index]) for index in best_indices]
+        leaders = self.__leaders()
+        best = self._best_solution(self.__population, 0)
 
         for iter_no in range(self.__iteration_number):
             a_parameter = 2 - iter_no * ((2) / self.__iteration_number)
 
-            for wolf in self.__wolves:
-                wolf.step(a_parameter, alpha.position, beta.position, delta.position)
-
-            if not best or alpha < best:
-                best = deepcopy(alpha)
-
-            LOGGER.info('Current best value: %s, Overall best value: %s', alpha.value, best.value)
+            # Fancy indexing copies the alpha, beta and delta positions before the pack moves
+            self.__step(a_parameter, self.__population.positions[leaders])
 
             # Add data for plot
-            positions = [wolf.position for wolf in self.__wolves]
             self._visualizer.add_data(
-                positions=positions,
-                best_wolf_indices=best_indices)
+                positions=self.__population.positions,
+                best_wolf_indices=leaders)
 
             # Update alpha beta delta
-            best_indices = np.argsort(self.__wolves)[:3]
-            alpha, beta, delta = [deepcopy(self.__wolves[index]) for index in best_indices]
+            leaders = self.__leaders()
+            best = self._best_solution(self.__population, iter_no + 1, best)
+
+            LOGGER.info('Current best value: %s, Overall best value: %s', self.__population.values[leaders[0]], best.value)
 
         return best
+
+    def __step(self, a_parameter: float, leader_positions: np.ndarray) -> None:
+        # Move all wolves towards all leaders at once with random coefficients per wolf, leader and dimension
+        positions = self.__population.positions
+        random = self._random.random(size=(2, len(positions), *leader_positions.shape))
+        a_vectors = 2 * a_parameter * random[0] - a_parameter  # Equation (3.3)
+        c_vectors = 2 * random[1]  # Equation (3.4)
+
+        distances = np.abs(c_vectors * leader_positions - positions[:, None])  # Equation (3.5)
+        self.__population.move(np.mean(leader_positions - a_vectors * distances, axis=1))  # Equations (3.6) and (3.7)
+
+    def __leaders(self) -> np.ndarray:
+        # The indices of the alpha, beta and delta wolves. Only the three best values are sorted.
+        values = self.__population.values
+        leaders = np.argpartition(values, min(2, len(values) - 1))[:3]
+        return leaders[np.argsort(values[leaders])]
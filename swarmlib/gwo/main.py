@@ -5,6 +5,7 @@
 import logging
 
 from .gwo_problem import GWOProblem
+from ..util.arguments import boundary
 from ..util.functions import FUNCTIONS
 
 LOGGER = logging.getLogger(__name__)
@@ -43,15 +44,22 @@ def configure_parser(sub_parsers):
     parser.add_argument(
         '-u',
         '--upper-boundary',
-        type=float,
+        type=boundary,
         default=4.,
-        help='Upper boundary of the function (default 4)')
+        help='Upper boundary of the function. Either one for all dimensions or comma separated, one per dimension (default 4)')
     parser.add_argument(
         '-l',
         '--lower-boundary',
-        type=float,
+        type=boundary,
         default=0.,
-        help='Lower boundary of the function (default 0)')
+        help='Lower boundary of the function. Either one for all dimensions or comma separated, one per dimension (default 0)')
+    parser.add_argument(
+        '-D',
+        '--dimensions',
+        type=int,
+        default=2,
+        help='''Number of dimensions of the search space. The visualization is only available in 2D.
+        Functions which are defined in 2D only ignore all further dimensions (default 2)''')
     parser.add_argument(
         '-n',
         '--iteration-number',
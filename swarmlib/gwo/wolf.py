@@ -4,22 +4,22 @@
 # ------------------------------------------------------------------------------------------------------
 
 # pylint: disable-msg=too-many-locals
-from typing import Tuple
+import numpy as np
 
 from ..util.coordinate import Coordinate
 
 
 class Wolf(Coordinate):
-    def step(self, a_parameter, alpha_pos: Tuple[float, float], beta_pos: Tuple[float, float],
-             delta_pos: Tuple[float, float]) -> None:
+    def step(self, a_parameter, alpha_pos: np.ndarray, beta_pos: np.ndarray,
+             delta_pos: np.ndarray) -> None:
         """
         Execute a wolf step.
         Update the wolf's position and value.
 
         Arguments:
-            alpha_pos {Tuple[float, float]} -- The alpha position
-            beta_pos {Tuple[float, float]} -- The beta position
-            delta_pos {Tuple[float, float]} -- The delta position
+            alpha_pos {numpy.ndarray} -- The alpha position
+            beta_pos {numpy.ndarray} -- The beta position
+            delta_pos {numpy.ndarray} -- The delta position
         """
 
 
@@ -6,6 +6,8 @@
 import logging
 
 from .pso_problem import PSOProblem
+from .topology import TOPOLOGIES
+from ..util.arguments import boundary
 from ..util.functions import FUNCTIONS
 
 LOGGER = logging.getLogger(__name__)
@@ -44,15 +46,22 @@ def configure_parser(sub_parsers):
     parser.add_argument(
         '-u',
         '--upper-boundary',
-        type=float,
+        type=boundary,
         default=4.,
-        help='Upper boundary of the function (default 4)')
+        help='Upper boundary of the function. Either one for all dimensions or comma separated, one per dimension (default 4)')
     parser.add_argument(
         '-l',
         '--lower-boundary',
-        type=float,
+        type=boundary,
         default=0.,
-        help='Lower boundary of the function (default 0)')
+        help='Lower boundary of the function. Either one for all dimensions or comma separated, one per dimension (default 0)')
+    parser.add_argument(
+        '-D',
+        '--dimensions',
+        type=int,
+        default=2,
+        help='''Number of dimensions of the search space. The visualization is only available in 2D.
+        Functions which are defined in 2D only ignore all further dimensions (default 2)''')
     parser.add_argument(
         '-w',
         '--weight',
@@ -83,6 +92,14 @@ def configure_parser(sub_parsers):
         type=float,
         default=2.,
         help='Maximum absolute velocity that is allowed for a particle (default 2.0)')
+    parser.add_argument(
+        '-t',
+        '--topology',
+        type=str,
+        default='global',
+        choices=tuple(TOPOLOGIES),
+        help='''Each particle follows the best particle of its neighborhood. All particles (global), its two neighbors
+        in a ring (ring) or its four neighbors on a grid (von_neumann) (default global)''')
 
     parser.add_argument(
         'particles',
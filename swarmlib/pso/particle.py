@@ -3,7 +3,6 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
-from typing import Tuple
 import numpy as np
 
 from ..util.coordinate import Coordinate
@@ -20,43 +19,48 @@ class Particle(Coordinate):
         self.__max_velocity = kwargs.get('maximum_velocity', 2)
 
         # Randomly create a new particle properties
-        self.__velocity = self._random.uniform(-1, 1, size=2)
-        self.__clip_velocity()
-
-        # Local best
-        self.__best_position = self._position
-        self.__best_value = self.value
+        self.__set_velocity(self._random.uniform(-1, 1, size=self._population.dimensions))
 
     @property
     def velocity(self) -> float:
-        return self.__velocity
+        return self._population.velocities[self._index].copy()
 
-    def step(self, global_best_pos: Tuple[float, float]) -> None:
+    def step(self, global_best_pos: np.ndarray) -> None:
         """
         Execute a particle step.
         Update the particle's velocity, position and value.
 
         Arguments:
-            global_best_pos {Tuple[float, float]} -- The global best position
+            global_best_pos {numpy.ndarray} -- The global best position
         """
+        # Update position and clip it to boundaries
+        self._position = self.propose(global_best_pos)
 
-        # Calculate velocity
-        cognitive_velocity = self.__c_1 * self._random.random(size=2) * (self.__best_position - self._position)
-        social_velocity = self.__c_2 * self._random.random(size=2) * (global_best_pos - self._position)
-        self.__velocity = self.__w * self.__velocity + cognitive_velocity + social_velocity
+    def propose(self, global_best_pos: np.ndarray) -> np.ndarray:
+        """
+        Update the particle's velocity and get its next position.
+        The position itself is not changed, e.g. to evaluate it asynchronously first.
 
-        # Clip velocity
-        self.__clip_velocity()
+        Arguments:
+            global_best_pos {numpy.ndarray} -- The global best position
 
-        # Update position and clip it to boundaries
-        self._position = self._position + self.__velocity
+        Returns:
+            numpy.ndarray -- The next position
+        """
+        position = self._position
+        # Local best, it is updated by the population
+        best_position = self._population.best_positions[self._index]
 
-        # Update local best
-        if self.value < self.__best_value:
-            self.__best_position = self._position
-            self.__best_value = self.value
+        # Calculate velocity
+        cognitive_velocity = self.__c_1 * self._random.random(size=self._population.dimensions) * (best_position - position)
+        social_velocity = self.__c_2 * self._random.random(size=self._population.dimensions) * (global_best_pos - position)
+        self.__set_velocity(self.__w * self.velocity + cognitive_velocity + social_velocity)
 
-    def __clip_velocity(self):
-        norm = np.linalg.norm(self.__velocity)
+        return position + self.velocity
+
+    def __set_velocity(self, velocity):
+        # Clip velocity
+        norm = np.linalg.norm(velocity)
         if norm > self.__max_velocity:
-            self.__velocity *= self.__max_velocity/norm
+            velocity *= self.__max_velocity/norm
+        self._population.velocities[self._index] = velocity
@@ -5,11 +5,19 @@
 
 # pylint: disable=too-many-instance-attributes
 
+from concurrent.futures import FIRST_COMPLETED, wait
 import logging
+import time
+
+import numpy as np
 
 from .particle import Particle
+from .topology import TOPOLOGIES, neighborhood_bests
 from ..util.base_visualizer import BaseVisualizer
+from ..util.evaluator import EvaluationStatistics
+from ..util.population import Population
 from ..util.problem_base import ProblemBase
+from ..util.solution import Solution
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,32 +26,127 @@ class PSOProblem(ProblemBase):
     def __init__(self, **kwargs):
         """
         Initialize a new particle swarm optimization problem.
+
+        Keyword Arguments:
+            asynchronous {bool} -- Move each particle as soon as its evaluation returned instead of waiting for the whole
+                swarm. The run evaluates `iteration_number` times as many positions. Unless the evaluation is serial,
+                the result depends on the order the evaluations finish in. (default False)
+            topology {str | Callable[[int], numpy.ndarray]} -- Each particle follows the best particle of its neighborhood.
+                One of `global`, `ring` or `von_neumann` or a function returning the neighbors of each particle for a swarm size. (default global)
         """
         super().__init__(**kwargs)
         self.__iteration_number = kwargs['iteration_number']
+        self.__asynchronous = kwargs.get('asynchronous', False)
+        self.__weight = kwargs.get('weight', .5)
+        self.__c_1 = kwargs.get('c_1', 2)
+        self.__c_2 = kwargs.get('c_2', 2)
+        self.__max_velocity = kwargs.get('maximum_velocity', 2)
+        self.__statistics = None
+        self.__population = Population(kwargs['particles'], **kwargs, bit_generator=self._random, evaluator=self._evaluator)
         self.__particles = [
-            Particle(**kwargs, bit_generator=self._random)
-            for _ in range(kwargs['particles'])
+            Particle(**kwargs, population=self.__population, index=index)
+            for index in range(kwargs['particles'])
         ]
 
+        topology = kwargs.get('topology', 'global')
+        if not callable(topology):
+            if topology not in TOPOLOGIES:
+                raise ValueError(f'Unknown topology="{topology}". Choose one of {tuple(TOPOLOGIES)} or pass a function.')
+            topology = TOPOLOGIES[topology]
+        self.__neighbors = topology(kwargs['particles']) if topology else None
+
         # Initialize visualizer for plotting
-        positions = [particle.position for particle in self.__particles]
-        self._visualizer = BaseVisualizer(**kwargs)
-        self._visualizer.add_data(positions=positions)
+        self._init_visualizer(BaseVisualizer, **kwargs)
+        self._visualizer.add_data(positions=self.__population.positions)
 
-    def solve(self) -> Particle:
-        # And also update global_best_particle
-        for _ in range(self.__iteration_number):
+    @property
+    def statistics(self) -> EvaluationStatistics:
+        """The throughput and the workers' utilization of the last asynchronous run, otherwise None"""
+        return self.__statistics
 
-            # Update global best
-            global_best_particle = min(self.__particles)
+    def solve(self) -> Solution:
+        if self.__asynchronous:
+            return self.__solve_asynchronously()
 
-            for particle in self.__particles:
-                particle.step(global_best_particle.position)
+        best = self._best_solution(self.__population, 0)
+        for iteration in range(self.__iteration_number):
+            self.__step()
+            best = self._best_solution(self.__population, iteration + 1, best)
 
             # Add data for plot
-            positions = [particle.position for particle in self.__particles]
-            self._visualizer.add_data(positions=positions)
+            self._visualizer.add_data(positions=self.__population.positions)
+
+        LOGGER.info('Last best solution="%s" at position="%s"', best.value, best.position)
+        return best
+
+    def __step(self) -> None:
+        # Move all particles at once, like each particle's step does for itself
+        population = self.__population
+        positions = population.positions
+        leaders = positions[neighborhood_bests(population.values, self.__neighbors)]
+
+        # The generator draws the cognitive and the social random numbers of one particle after another
+        random = self._random.random(size=(len(population), 2, population.dimensions))
+        cognitive_velocities = self.__c_1 * random[:, 0] * (population.best_positions - positions)
+        social_velocities = self.__c_2 * random[:, 1] * (leaders - positions)
+        velocities = self.__weight * population.velocities + cognitive_velocities + social_velocities
+
+        # Clip the velocities' norms
+        norms = np.linalg.norm(velocities, axis=1)
+        too_fast = norms > self.__max_velocity
+        velocities[too_fast] *= (self.__max_velocity / norms[too_fast])[:, None]
+
+        population.velocities = velocities
+        population.move(positions + velocities)
+
+    def __solve_asynchronously(self) -> Solution:
+        budget = self.__iteration_number * len(self.__particles)
+        pending = {}
+        best = self._best_solution(self.__population, 0)
+
+        def submit(index):
+            # Steady state: each particle follows the best particle of its neighborhood known when it is submitted
+            neighbors = None if self.__neighbors is None else self.__neighbors[index:index + 1]
+            leader = neighborhood_bests(self.__population.values, neighbors)[0]
+            position = self.__population.clip(self.__particles[index].propose(self.__population.positions[leader]))[0]
+            pending[self._evaluator.submit(position)] = (index, position)
+
+        start = time.perf_counter()
+        busy_seconds = 0.
+        evaluations = 0
+        for index in range(min(budget, len(self.__particles))):
+            submit(index)
+        submitted = len(pending)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            # Handle finished evaluations in the order they were submitted to be reproducible for serial evaluations
+            for future in [future for future in pending if future in done]:
+                index, position = pending.pop(future)
+                evaluation = future.result()
+                self.__population.move(position, index, evaluation.value)
+                busy_seconds += evaluation.seconds
+                evaluations += 1
+                if evaluation.value < best.value:
+                    # Count one iteration per swarm size evaluations
+                    best = Solution.create(position, evaluation.value, evaluations // len(self.__particles), self._evaluator.evaluations)
+
+                if submitted < budget:
+                    submit(index)
+                    submitted += 1
+
+                # One iteration per swarm size evaluations for the visualization
+                if evaluations % len(self.__particles) == 0:
+                    self._visualizer.add_data(positions=self.__population.positions)
+
+        seconds = time.perf_counter() - start
+        self.__statistics = EvaluationStatistics(
+            evaluations=evaluations,
+            seconds=seconds,
+            throughput=evaluations / seconds,
+            utilization=busy_seconds / (seconds * self._evaluator.workers))
+        LOGGER.info('Evaluated %s positions in %.3fs (%.1f evaluations/s, %.0f%% worker utilization)',
+                    evaluations, seconds, self.__statistics.throughput, 100 * self.__statistics.utilization)
 
-        LOGGER.info('Last best solution="%s" at position="%s"', global_best_particle.value, global_best_particle.position)
-        return global_best_particle
+        LOGGER.info('Last best solution="%s" at position="%s"', best.value, best.position)
+        return best
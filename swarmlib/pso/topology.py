@@ -0,0 +1,75 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+
+def ring(size: int, radius: int = 1) -> np.ndarray:
+    """
+    Get the neighbors of each particle in a ring, the local best (lbest) topology.
+
+    Arguments:
+        size {int} -- The number of particles
+
+    Keyword Arguments:
+        radius {int} -- The number of neighbors on each side (default 1)
+
+    Returns:
+        numpy.ndarray -- Row i contains the indices of particle i and its neighbors
+    """
+    return (np.arange(size)[:, None] + np.arange(-radius, radius + 1)) % size
+
+
+def von_neumann(size: int) -> np.ndarray:
+    """
+    Get the neighbors of each particle in a von Neumann topology.
+    The particles are laid out row by row on a grid with about sqrt(size) columns, the last row may be shorter.
+    Each particle's neighbors are the particles left, right, above and below of it.
+    Rows and columns wrap around on their own, so the neighbors stay in the particle's row and column.
+
+    Arguments:
+        size {int} -- The number of particles
+
+    Returns:
+        numpy.ndarray -- Row i contains the indices of particle i and its neighbors
+    """
+    columns = max(int(round(np.sqrt(size))), 1)
+    row, column = np.divmod(np.arange(size), columns)
+    row_length = np.minimum(columns, size - row * columns)
+    column_length = (size - column - 1) // columns + 1
+
+    return np.column_stack([
+        row * columns + column,
+        row * columns + (column - 1) % row_length,
+        row * columns + (column + 1) % row_length,
+        (row - 1) % column_length * columns + column,
+        (row + 1) % column_length * columns + column
+    ])
+
+
+# Each topology returns the neighbors of all particles. The global topology connects all of them, so none are needed.
+TOPOLOGIES = {
+    'global': None,
+    'ring': ring,
+    'von_neumann': von_neumann
+}
+
+
+def neighborhood_bests(values: np.ndarray, neighbors: np.ndarray = None) -> np.ndarray:
+    """
+    Find the particle with the lowest value in each particle's neighborhood.
+
+    Arguments:
+        values {numpy.ndarray} -- The N values of the particles
+
+    Keyword Arguments:
+        neighbors {numpy.ndarray} -- Row i contains the indices of particle i's neighbors (default None, all particles are neighbors)
+
+    Returns:
+        numpy.ndarray -- The N indices of the best neighbors
+    """
+    if neighbors is None:
+        return np.full(len(values), np.argmin(values))
+    return neighbors[np.arange(len(neighbors)), np.argmin(values[neighbors], axis=1)]
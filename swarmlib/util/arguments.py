@@ -0,0 +1,25 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import argparse
+from typing import List, Union
+
+
+def boundary(value: str) -> Union[float, List[float]]:
+    """
+    Parse a boundary command line argument.
+
+    Arguments:
+        value {str} -- A single boundary for all dimensions or comma separated boundaries, one per dimension
+
+    Returns:
+        Union[float, List[float]] -- The boundary or the list of boundaries
+    """
+    try:
+        boundaries = [float(entry) for entry in value.split(',')]
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f'"{value}" is neither a number nor a comma separated list of numbers') from error
+
+    return boundaries[0] if len(boundaries) == 1 else boundaries
@@ -16,8 +16,9 @@ from .visualizer_base import VisualizerBase
 
 class BaseVisualizer(VisualizerBase):
     def __init__(self, **kwargs):
-        self.__lower_boundary = kwargs.get('lower_boundary', 0.)
-        self.__upper_boundary = kwargs.get('upper_boundary', 4.)
+        # Either a single boundary for both dimensions or one per dimension
+        self.__lower_boundary = np.broadcast_to(np.asarray(kwargs.get('lower_boundary', 0.), dtype=float), (2,))
+        self.__upper_boundary = np.broadcast_to(np.asarray(kwargs.get('upper_boundary', 4.), dtype=float), (2,))
         self.__iteration_number = kwargs.get('iteration_number', 10)
         self.__intervals = self.__iteration_number + 2  # Two extra intervals for unanimated start and end pose
         self.__interval_ms = kwargs.get('interval', 1000)
@@ -39,14 +40,14 @@ class BaseVisualizer(VisualizerBase):
         if self._dark:
             plt.style.use('dark_background')
 
-        x = np.linspace(self.__lower_boundary, self.__upper_boundary, 400)
-        y = np.linspace(self.__lower_boundary, self.__upper_boundary, 400)
+        x = np.linspace(self.__lower_boundary[0], self.__upper_boundary[0], 400)
+        y = np.linspace(self.__lower_boundary[1], self.__upper_boundary[1], 400)
         X, Y = np.meshgrid(x, y)
         z = self.__function([X, Y])
 
         self._fig = plt.figure()
 
-        ax = self._fig.add_subplot(1, 1, 1, label='BaseAxis')
+        ax = self._ax = self._fig.add_subplot(1, 1, 1, label='BaseAxis')
         cs = ax.contourf(X, Y, z, cmap=get_cmap('inferno' if self._dark else 'PuBu_r'))
         self._fig.colorbar(cs)
 
@@ -56,20 +57,21 @@ class BaseVisualizer(VisualizerBase):
         # Plot all velocities
         self.__particle_vel = ax.quiver([], [], [], [], angles='xy', scale_units='xy', scale=1)
 
-        self.__rectangle = plt.Rectangle([self.__lower_boundary, self.__lower_boundary],
-                                         self.__upper_boundary-self.__lower_boundary,
-                                         self.__upper_boundary-self.__lower_boundary,
+        width, height = self.__upper_boundary - self.__lower_boundary
+        self.__rectangle = plt.Rectangle(tuple(self.__lower_boundary), width, height,
                                          ec='none', lw=2, fc='none')
         ax.add_patch(self.__rectangle)
 
     def add_data(self, **kwargs) -> None:
         positions: Iterable[Tuple[float, float]] = kwargs['positions']
 
-        self._positions.append(np.transpose(positions))
+        # Copy the positions as the population updates its arrays in place
+        positions = np.array(positions, dtype=float).T
+        self._positions.append(positions)
 
         if len(self._positions) == 1:
             # Insert the first position twice to show it "unanimated" first.
-            self._positions.append(np.transpose(positions))
+            self._positions.append(positions)
 
         # Calculate at time t the velocity for step t-1
         self._velocities.append(self._positions[-1] - self._positions[-2])
@@ -91,13 +93,9 @@ class BaseVisualizer(VisualizerBase):
         """
         Init function for animations. Only used for FuncAnimation
         """
-        self.__particles.set_offsets([[]])
+        self.__particles.set_offsets(np.empty((0, 2)))
         self._marker_colors = np.full(len(self._positions[0][0]), self._marker_color)  # Create array of correct size
-        self.__particle_vel.X = []
-        self.__particle_vel.Y = []
-        self.__particle_vel.XY = []
-        self.__particle_vel.U = []
-        self.__particle_vel.V = []
+        self.__particle_vel.set_visible(False)
 
         self.__rectangle.set_edgecolor('none')
 
@@ -110,12 +108,12 @@ class BaseVisualizer(VisualizerBase):
 
         self._marker_size = int(50 * self._fig.get_figwidth()/self._fig.dpi)
         self.__rectangle.set_edgecolor('k')
-        ax = self._fig.gca(label='BaseAxis')
+        ax = self._ax
 
         # Get the index of the current data to show
         self._index = int(np.floor(i / (frames/self.__intervals)))
 
-        self._fig.canvas.set_window_title(f'Iteration {np.minimum(self._index, self.__iteration_number)}/{self.__iteration_number}')
+        self._fig.canvas.manager.set_window_title(f'Iteration {np.minimum(self._index, self.__iteration_number)}/{self.__iteration_number}')
 
         # Calculate the scale to apply to the data in order to generate a more dynamic visualization
         scale = i / (frames/self.__intervals) - self._index
@@ -123,7 +121,7 @@ class BaseVisualizer(VisualizerBase):
         # Calculate scaled position and velocity
         pos = self._positions[self._index]
         vel = self._velocities[self._index]
-        pos_scaled = np.clip(pos + scale * vel, a_min=self.__lower_boundary, a_max=self.__upper_boundary)
+        pos_scaled = np.clip(pos + scale * vel, a_min=self.__lower_boundary[:, None], a_max=self.__upper_boundary[:, None])
         vel_scaled = (1-scale)*vel
 
         # Update the particle position
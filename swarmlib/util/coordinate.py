@@ -3,28 +3,44 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
+from copy import copy
+
 import numpy as np
 
+from .population import Population
+
 
 class Coordinate:
     def __init__(self, **kwargs) -> None:
         """
-        Initializes a new random coordinate.
+        Initializes a new coordinate.
+        A coordinate is a view onto one agent of a `Population`. If no population is passed,
+        a new population holding this coordinate only is created at a random position.
+
+        Keyword Arguments:
+            population {Population} -- The population the coordinate belongs to (default None, create a new one)
+            index {int} -- The coordinate's index in the population (default 0)
+            For a new population its arguments: `function`, `bit_generator`, `dimensions`, `lower_boundary` and `upper_boundary`.
         """
-        self.__lower_boundary = kwargs.get('lower_boundary', 0.)
-        self.__upper_boundary = kwargs.get('upper_boundary', 4.)
-        self._random = kwargs['bit_generator']
-        self._function = kwargs['function']
-
-        self.__value = None
-        self.__position = None
-        self._initialize()
+        self._population = kwargs.get('population', None)
+        self._index = kwargs.get('index', 0)
+        if self._population is None:
+            self._population = Population(1, **kwargs)
+        self._random = self._population.random
+        self._function = self._population.function
+
+    def __deepcopy__(self, memo):
+        # Copy only the own row instead of the whole population. The function and the generator are shared.
+        clone = copy(self)
+        clone._population = self._population.subset(self._index)  # pylint: disable=protected-access
+        clone._index = 0  # pylint: disable=protected-access
+        return clone
 
     def _initialize(self) -> None:
         """
         Initialize a new random position and its value
         """
-        self._position = self._random.uniform(self.__lower_boundary, self.__upper_boundary, 2)
+        self._population.initialize(self._index)
 
     @property
     def position(self) -> np.ndarray:
@@ -39,7 +55,7 @@ class Coordinate:
     # Internal Getter
     @property
     def _position(self) -> np.ndarray:
-        return self.__position
+        return self._population.positions[self._index].copy()
 
     # Internal Setter for automatic position clipping and value update
     @_position.setter
@@ -52,27 +68,26 @@ class Coordinate:
         Args:
             new_pos (numpy.ndarray): The new coordinate position
         """
-        self.__position = np.clip(new_pos, a_min=self.__lower_boundary, a_max=self.__upper_boundary)
-        self.__value = self._function(self.__position)
+        self._population.move(new_pos, self._index)
 
     @property
     def value(self) -> float:
-        return self.__value
+        return self._population.values[self._index]
 
     def __eq__(self, other) -> bool:
-        return self.__value == other.value
+        return self.value == other.value
 
     def __ne__(self, other) -> bool:
-        return self.__value != other.value
+        return self.value != other.value
 
     def __lt__(self, other) -> bool:
-        return self.__value < other.value
+        return self.value < other.value
 
     def __le__(self, other) -> bool:
-        return self.__value <= other.value
+        return self.value <= other.value
 
     def __gt__(self, other) -> bool:
-        return self.__value > other.value
+        return self.value > other.value
 
     def __ge__(self, other) -> bool:
-        return self.__value >= other.value
+        return self.value >= other.value
@@ -0,0 +1,125 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from collections import OrderedDict
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+
+
+class EvaluationCache:
+    def __init__(self, size: int = 100000, decimals: int = 10) -> None:
+        """
+        Initializes a new instance of the `EvaluationCache` class.
+        It remembers the values of the most recently evaluated positions. Positions are rounded to the
+        given decimals first, so positions closer than that share their value, e.g. the positions clipped to a boundary.
+
+        Keyword Arguments:
+            size {int} -- The maximum number of remembered values. The least recently used one is dropped first. (default 100000)
+            decimals {int} -- The number of decimals the positions are rounded to (default 10)
+        """
+        if size < 1:
+            raise ValueError(f'The cache size must be positive, got {size}.')
+
+        self.__size = size
+        self.__decimals = decimals
+        self.__values = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    @property
+    def hits(self) -> int:
+        """The number of values that were taken from the cache"""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """The number of values that had to be evaluated"""
+        return self.__misses
+
+    def get(self, position: np.ndarray) -> Optional[float]:
+        """
+        Get the cached value of the given position and count the hit or the miss.
+
+        Arguments:
+            position {numpy.ndarray} -- The position
+
+        Returns:
+            Optional[float] -- The value or None if it is not cached
+        """
+        return self.__get(self.__keys(position)[0])
+
+    def put(self, position: np.ndarray, value: float) -> None:
+        """
+        Cache the value of the given position.
+
+        Arguments:
+            position {numpy.ndarray} -- The position
+            value {float} -- Its value
+        """
+        self.__put(self.__keys(position)[0], value)
+
+    def evaluate(self, positions: np.ndarray, batch_function: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Get the values of the given positions. Only the positions that are not cached are evaluated,
+        each distinct one once, with a single call of the batched function.
+
+        Arguments:
+            positions {numpy.ndarray} -- The (k x D) positions
+            batch_function {Callable[[numpy.ndarray], numpy.ndarray]} -- Evaluates an (m x D) array of positions
+
+        Returns:
+            numpy.ndarray -- The k values
+        """
+        positions = np.asarray(positions, dtype=float)
+        values = np.empty(len(positions))
+        missing = {}
+        for row, key in enumerate(self.__keys(positions)):
+            if key in missing:
+                # Evaluated once for all of its occurrences
+                missing[key].append(row)
+                self.__hits += 1
+                continue
+
+            value = self.__get(key)
+            if value is None:
+                missing[key] = [row]
+            else:
+                values[row] = value
+
+        if missing:
+            new_values = batch_function(positions[[rows[0] for rows in missing.values()]])
+            for (key, rows), value in zip(missing.items(), new_values):
+                values[rows] = value
+                self.__put(key, value)
+
+        return values
+
+    def __keys(self, positions: np.ndarray):
+        # Adding zero turns -0.0 into 0.0 so both have the same bytes
+        rounded = np.round(np.atleast_2d(np.asarray(positions, dtype=float)), self.__decimals) + 0.
+        return [row.tobytes() for row in rounded]
+
+    def __get(self, key: bytes) -> Optional[float]:
+        with self.__lock:
+            value = self.__values.get(key, None)
+            if value is None:
+                self.__misses += 1
+            else:
+                self.__values.move_to_end(key)
+                self.__hits += 1
+            return value
+
+    def __put(self, key: bytes, value: float) -> None:
+        with self.__lock:
+            self.__values[key] = float(value)
+            self.__values.move_to_end(key)
+            if len(self.__values) > self.__size:
+                self.__values.popitem(last=False)
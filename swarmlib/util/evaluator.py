@@ -0,0 +1,217 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
+import logging
+import os
+import pickle
+import time
+from typing import Callable, NamedTuple, Union
+import weakref
+
+import numpy as np
+
+from .evaluation_cache import EvaluationCache
+from .functions import FUNCTIONS, batch_function
+
+# pylint: disable=too-many-instance-attributes
+
+LOGGER = logging.getLogger(__name__)
+
+EVALUATIONS = ['serial', 'threads', 'processes']
+
+
+class Evaluation(NamedTuple):
+    """A function value and the time it took to evaluate it"""
+    value: float
+    seconds: float
+
+
+class EvaluationStatistics(NamedTuple):
+    """How well a run kept the evaluation's workers busy"""
+    evaluations: int
+    seconds: float
+    throughput: float  # Evaluations per second
+    utilization: float  # Share of the workers' time spent evaluating
+
+
+class Evaluator:
+    def __init__(self, function: Callable[[np.ndarray], float], evaluation: Union[str, Executor] = 'serial', workers: int = None,
+                 cache: EvaluationCache = None) -> None:
+        """
+        Initializes a new instance of the `Evaluator` class.
+        It evaluates the function at many positions at once, either in the calling thread or split into chunks
+        among the workers of an executor. The values do not depend on the evaluation, so the results of a problem
+        stay the same for a given seed.
+
+        Arguments:
+            function {Callable[[numpy.ndarray], float]} -- The function to evaluate
+
+        Keyword Arguments:
+            evaluation {str | concurrent.futures.Executor} -- `serial`, `threads`, `processes` or an own executor (default serial).
+                The processes pickle the function, hence it must be defined on module level. The built-in `FUNCTIONS`
+                cannot be pickled, the workers look them up by name instead.
+            workers {int} -- Number of threads or processes. It is also used to chunk the positions for an own executor (default number of CPUs)
+            cache {EvaluationCache} -- Remembers the values, so only new positions are evaluated (default None)
+        """
+        if not isinstance(evaluation, Executor) and evaluation not in EVALUATIONS:
+            raise ValueError(f'Unknown evaluation "{evaluation}". Choose one of {EVALUATIONS} or pass an executor.')
+
+        self.__function = function
+        self.__batch_function = batch_function(function)
+        self.__evaluation = evaluation
+        self.__workers = workers or os.cpu_count()
+        self.__executor = evaluation if isinstance(evaluation, Executor) else None
+        self.__cache = cache
+        self.__evaluations = 0
+
+        # Process pools pickle the function. Functions of the registry which cannot be pickled are looked up by name instead.
+        self.__reference = function
+        name = getattr(function, '__name__', None)
+        if FUNCTIONS.get(name, None) is function and not _is_picklable(function):
+            self.__reference = name
+
+    @property
+    def function(self) -> Callable[[np.ndarray], float]:
+        """The evaluated function"""
+        return self.__function
+
+    @property
+    def cache(self) -> EvaluationCache:
+        """The cache of the evaluated values or None"""
+        return self.__cache
+
+    @property
+    def evaluations(self) -> int:
+        """The number of positions the function was evaluated at or submitted to. Cached values are not counted."""
+        return self.__evaluations
+
+    @property
+    def workers(self) -> int:
+        """The number of positions evaluated at the same time"""
+        return 1 if self.__evaluation == 'serial' else self.__workers
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the function at the given positions.
+
+        Arguments:
+            positions {numpy.ndarray} -- The (k x D) positions
+
+        Returns:
+            numpy.ndarray -- The k values
+        """
+        if self.__cache is not None:
+            return self.__cache.evaluate(positions, self.__evaluate)
+        return self.__evaluate(positions)
+
+    def evaluate_position(self, position: np.ndarray) -> float:
+        """
+        Evaluate the function at a single position in the calling thread.
+
+        Arguments:
+            position {numpy.ndarray} -- The position
+
+        Returns:
+            float -- The value
+        """
+        if self.__cache is None:
+            self.__evaluations += 1
+            return self.__function(position)
+
+        value = self.__cache.get(position)
+        if value is None:
+            self.__evaluations += 1
+            value = self.__function(position)
+            self.__cache.put(position, value)
+        return value
+
+    def __evaluate(self, positions: np.ndarray) -> np.ndarray:
+        positions = np.asarray(positions, dtype=float)
+        self.__evaluations += len(positions)
+        if self.__evaluation == 'serial' or len(positions) < 2:
+            return self.__batch_function(positions)
+
+        executor = self.__get_executor()
+        chunks = np.array_split(positions, min(len(positions), 4 * self.__workers))
+        if isinstance(executor, ThreadPoolExecutor):
+            values = executor.map(self.__batch_function, chunks)
+        else:
+            values = executor.map(_evaluate, repeat(self.__reference), chunks)
+
+        return np.concatenate(list(values))
+
+    def submit(self, position: np.ndarray) -> Future:
+        """
+        Start to evaluate the function at the given position.
+        The serial evaluation evaluates it right away and returns a completed future.
+
+        Arguments:
+            position {numpy.ndarray} -- The position
+
+        Returns:
+            concurrent.futures.Future -- Resolves to the `Evaluation`
+        """
+        value = None if self.__cache is None else self.__cache.get(position)
+        if value is None:
+            self.__evaluations += 1
+
+        if value is not None or self.__evaluation == 'serial':
+            future = Future()
+            future.set_result(Evaluation(value, 0.) if value is not None else _evaluate_timed(self.__function, position))
+        else:
+            executor = self.__get_executor()
+            reference = self.__function if isinstance(executor, ThreadPoolExecutor) else self.__reference
+            future = executor.submit(_evaluate_timed, reference, position)
+
+        if value is None and self.__cache is not None:
+            future.add_done_callback(partial(self.__store, position))
+        return future
+
+    def close(self) -> None:
+        """
+        Shut the own threads or processes down. An executor that was passed in is left running.
+        """
+        if self.__executor is not None and not isinstance(self.__evaluation, Executor):
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __store(self, position: np.ndarray, future: Future) -> None:
+        if future.exception() is None:
+            self.__cache.put(position, future.result().value)
+
+    def __get_executor(self) -> Executor:
+        if self.__executor is None:
+            executor_type = ThreadPoolExecutor if self.__evaluation == 'threads' else ProcessPoolExecutor
+            self.__executor = executor_type(max_workers=self.__workers)
+            weakref.finalize(self, self.__executor.shutdown)
+            LOGGER.info('Started %s evaluation workers', self.__workers)
+
+        return self.__executor
+
+
+def _evaluate(reference: Union[str, Callable[[np.ndarray], float]], positions: np.ndarray) -> np.ndarray:
+    return batch_function(_resolve(reference))(positions)
+
+
+def _evaluate_timed(reference: Union[str, Callable[[np.ndarray], float]], position: np.ndarray) -> Evaluation:
+    function = _resolve(reference)
+    start = time.perf_counter()
+    value = float(function(position))
+    return Evaluation(value, time.perf_counter() - start)
+
+
+def _resolve(reference: Union[str, Callable[[np.ndarray], float]]) -> Callable[[np.ndarray], float]:
+    return FUNCTIONS[reference] if isinstance(reference, str) else reference
+
+
+def _is_picklable(function: Callable[[np.ndarray], float]) -> bool:
+    try:
+        pickle.dumps(function)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
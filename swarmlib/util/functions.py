@@ -13,12 +13,297 @@ import landscapes.single_objective
 import numpy as np
 
 
-# Wrapper for landscapes.single_objective functions for inputs > 1d
+# Native vectorized versions of the common landscapes.single_objective functions.
+# Each takes an (N x D) array of positions and returns the N values.
+# Functions defined for 2D only use the first two columns like their landscapes counterparts.
+
+def _ackley(x):
+    return (-20 * np.exp(-0.2 * np.sqrt(0.5 * (x[:, 0]**2 + x[:, 1]**2))) -
+            np.exp(0.5 * (np.cos(2 * np.pi * x[:, 0]) + np.cos(2 * np.pi * x[:, 1]))) + np.e + 20)
+
+
+def _beale(x):
+    x, y = x[:, 0], x[:, 1]
+    return (1.5 - x + x*y)**2 + (2.25 - x + x*y**2)**2 + (2.625 - x + x*y**3)**2
+
+
+def _booth(x):
+    x, y = x[:, 0], x[:, 1]
+    return (x + 2*y - 7)**2 + (2*x + y - 5)**2
+
+
+def _bukin_n6(x):
+    x, y = x[:, 0], x[:, 1]
+    return 100 * np.sqrt(np.abs(y - 0.01*x**2)) + 0.01*np.abs(x + 10)
+
+
+def _camel_hump_3(x):
+    x, y = x[:, 0], x[:, 1]
+    return 2*x**2 - 1.05*x**4 + x**6 / 6 + x*y + y**2
+
+
+def _camel_hump_6(x):
+    x, y = x[:, 0], x[:, 1]
+    return (4 - 2.1*x**2 + x**4 / 3) * x**2 + x*y + (-4 + 4*y**2) * y**2
+
+
+def _cross_in_tray(x):
+    x, y = x[:, 0], x[:, 1]
+    return -0.0001 * (np.abs(np.sin(x) * np.sin(y) * np.exp(np.abs(100 - np.sqrt(x**2 + y**2) / np.pi))) + 1)**0.1
+
+
+def _dixon_price(x):
+    indices = np.arange(1, x.shape[1])
+    return (x[:, 0] - 1)**2 + np.sum(indices * (2 * x[:, 1:]**2 - x[:, :-1])**2, axis=1)
+
+
+def _drop_wave(x):
+    squared = x[:, 0]**2 + x[:, 1]**2
+    return -(1 + np.cos(12 * np.sqrt(squared))) / (0.5 * squared + 2)
+
+
+def _easom(x):
+    x, y = x[:, 0], x[:, 1]
+    return -np.cos(x) * np.cos(y) * np.exp(-((x - np.pi)**2 + (y - np.pi)**2))
+
+
+def _eggholder(x):
+    x, y = x[:, 0], x[:, 1]
+    return -(y + 47) * np.sin(np.sqrt(np.abs(x / 2 + y + 47))) - x * np.sin(np.sqrt(np.abs(x - (y + 47))))
+
+
+def _goldstein_price(x):
+    x, y = x[:, 0], x[:, 1]
+    return ((1 + (x + y + 1)**2 * (19 - 14*x + 3*x**2 - 14*y + 6*x*y + 3*y**2)) *
+            (30 + (2*x - 3*y)**2 * (18 - 32*x + 12*x**2 + 48*y - 36*x*y + 27*y**2)))
+
+
+def _griewank(x):
+    return np.sum(x**2, axis=1) / 4000 - np.prod(np.cos(x / np.sqrt(np.arange(1, x.shape[1] + 1))), axis=1) + 1
+
+
+def _himmelblau(x):
+    x, y = x[:, 0], x[:, 1]
+    return (x**2 + y - 11)**2 + (x + y**2 - 7)**2
+
+
+def _holder_table(x):
+    x, y = x[:, 0], x[:, 1]
+    return -np.abs(np.sin(x) * np.cos(y) * np.exp(np.abs(1 - np.sqrt(x**2 + y**2) / np.pi)))
+
+
+def _levi_n13(x):
+    x, y = x[:, 0], x[:, 1]
+    return (np.sin(3 * np.pi * x)**2 + (x - 1)**2 * (1 + np.sin(3 * np.pi * y)**2) +
+            (y - 1)**2 * (1 + np.sin(2 * np.pi * y)**2))
+
+
+def _matyas(x):
+    x, y = x[:, 0], x[:, 1]
+    return 0.26 * (x**2 + y**2) - 0.48 * x * y
+
+
+def _mccormick(x):
+    x, y = x[:, 0], x[:, 1]
+    return np.sin(x + y) + (x - y)**2 - 1.5*x + 2.5*y + 1
+
+
+def _michalewicz(x, m=10):
+    indices = np.arange(1, x.shape[1] + 1)
+    return -np.sum(np.sin(x) * np.sin(indices * x**2 / np.pi)**(2 * m), axis=1)
+
+
+def _rastrigin(x):
+    return 10 * x.shape[1] + np.sum(x**2 - 10 * np.cos(2 * np.pi * x), axis=1)
+
+
+def _rosenbrock(x):
+    return np.sum(100 * (x[:, 1:] - x[:, :-1]**2)**2 + (1 - x[:, :-1])**2, axis=1)
+
+
+def _rotated_hyper_ellipsoid(x):
+    # Like landscapes, the i-th term sums the squares of the first i - 1 dimensions
+    return np.sum(np.cumsum(x**2, axis=1)[:, :-1], axis=1)
+
+
+def _salomon(x):
+    norm = np.sqrt(np.sum(x**2, axis=1))
+    return 1 - np.cos(2 * np.pi * norm) + 0.1 * norm
+
+
+def _schaffer_n2(x):
+    x, y = x[:, 0], x[:, 1]
+    return 0.5 + (np.sin(x**2 - y**2)**2 - 0.5) / (1 + 0.001 * (x**2 + y**2))**2
+
+
+def _schaffer_n4(x):
+    x, y = x[:, 0], x[:, 1]
+    return 0.5 + (np.cos(np.sin(np.abs(x**2 - y**2)))**2 - 0.5) / (1 + 0.001 * (x**2 + y**2))**2
+
+
+def _schwefel(x):
+    return 418.9829 * x.shape[1] - np.sum(x * np.sin(np.sqrt(np.abs(x))), axis=1)
+
+
+def _sphere(x):
+    return np.sum(x**2, axis=1)
+
+
+def _styblinski_tang(x):
+    return np.sum(x**4 - 16 * x**2 + 5 * x, axis=1) / 2
+
+
+def _sum_of_squares(x):
+    return np.sum(np.arange(1, x.shape[1] + 1) * x**2, axis=1)
+
+
+def _trid(x):
+    return np.sum((x - 1)**2, axis=1) - np.sum(x[:, 1:] * x[:, :-1], axis=1)
+
+
+def _zakharov(x):
+    weighted = np.sum(0.5 * np.arange(x.shape[1]) * x, axis=1)
+    return np.sum(x**2, axis=1) + weighted**2 + weighted**4
+
+
+BATCH_FUNCTIONS = {
+    'ackley': _ackley,
+    'beale': _beale,
+    'booth': _booth,
+    'bukin_n6': _bukin_n6,
+    'camel_hump_3': _camel_hump_3,
+    'camel_hump_6': _camel_hump_6,
+    'cross_in_tray': _cross_in_tray,
+    'dixon_price': _dixon_price,
+    'drop_wave': _drop_wave,
+    'easom': _easom,
+    'eggholder': _eggholder,
+    'goldstein_price': _goldstein_price,
+    'griewank': _griewank,
+    'himmelblau': _himmelblau,
+    'holder_table': _holder_table,
+    'levi_n13': _levi_n13,
+    'matyas': _matyas,
+    'mccormick': _mccormick,
+    'michalewicz': _michalewicz,
+    'rastrigin': _rastrigin,
+    'rosenbrock': _rosenbrock,
+    'rotated_hyper_ellipsoid': _rotated_hyper_ellipsoid,
+    'salomon': _salomon,
+    'schaffer_n2': _schaffer_n2,
+    'schaffer_n4': _schaffer_n4,
+    'schwefel': _schwefel,
+    'sphere': _sphere,
+    'styblinski_tang': _styblinski_tang,
+    'sum_of_squares': _sum_of_squares,
+    'trid': _trid,
+    'zakharov': _zakharov
+}
+
+
+def batch_function(function: Callable[[np.ndarray], float]) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Get the batched form of the given function.
+
+    Arguments:
+        function {Callable[[numpy.ndarray], float]} -- A function of a single position
+
+    Returns:
+        Callable[[numpy.ndarray], numpy.ndarray] -- Takes an (N x D) array of positions and returns the N values.
+            It is the function's `batch` attribute if it has one, otherwise the function is called once per position.
+    """
+    batch = getattr(function, 'batch', None)
+    if batch is not None:
+        return batch
+
+    def evaluate_rows(positions: np.ndarray) -> np.ndarray:
+        return np.array([function(position) for position in positions], dtype=float).reshape(len(positions))
+    return evaluate_rows
+
+
+def _attach_batch(wrapper, batch_func) -> Callable[[np.ndarray], float]:
+    def batch(positions: np.ndarray) -> np.ndarray:
+        positions = np.asarray(positions, dtype=float)
+        return np.asarray(batch_func(positions), dtype=float).reshape(len(positions))
+
+    wrapper.batch = batch
+    return wrapper
+
+
+# Wrapper for batched functions to evaluate single positions as well
+def wrap_batch_func(batch_func) -> Callable[[np.ndarray], float]:
+    @wraps(batch_func)
+    def wrapper(x: np.ndarray) -> float:
+        # The first axis holds the dimensions, e.g. the visualizer passes the 2 x h x w mesh grid
+        x = np.asarray(x, dtype=float)
+        values = batch_func(np.moveaxis(x, 0, -1).reshape(-1, len(x)))
+        return np.float64(np.reshape(values, x.shape[1:]))
+
+    return _attach_batch(wrapper, batch_func)
+
+
+# Wrapper for landscapes.single_objective functions for inputs > 1d.
+# The native vectorized version is used if there is one.
 def wrap_landscapes_func(landscapes_func) -> Callable[[np.ndarray], float]:
+    native = BATCH_FUNCTIONS.get(landscapes_func.__name__, None)
+    if native is not None:
+        return wraps(landscapes_func)(wrap_batch_func(native))
+
     @wraps(landscapes_func)
     def wrapper(x: np.ndarray) -> float:
         return np.float64(np.apply_along_axis(func1d=landscapes_func, axis=0, arr=x))
-    return wrapper
+
+    return _attach_batch(wrapper, batch_function(landscapes_func))
+
+
+def register_function(name: str, function: Callable[[np.ndarray], float] = None, batch: Callable[[np.ndarray], np.ndarray] = None) -> None:
+    """
+    Add a function to the `FUNCTIONS` registry, e.g. to choose it on the command line.
+    The registered function can be pickled, e.g. to evaluate it in a process pool, if the given functions can.
+
+    Arguments:
+        name {str} -- The function's name
+
+    Keyword Arguments:
+        function {Callable[[numpy.ndarray], float]} -- Evaluates a single position (default None, derived from batch)
+        batch {Callable[[numpy.ndarray], numpy.ndarray]} -- Evaluates an (N x D) array of positions at once
+            (default None, the function is called once per position)
+    """
+    if function is None and batch is None:
+        raise ValueError('Pass a function, a batched function or both.')
+
+    FUNCTIONS[name] = RegisteredFunction(name, function, batch)
+
+
+class RegisteredFunction:
+    """
+    A function added with `register_function`. Unlike the wrappers of the other `FUNCTIONS` it is a plain object,
+    hence it can be pickled if its single position and batched functions can.
+    """
+
+    def __init__(self, name: str, function: Callable[[np.ndarray], float] = None, batch: Callable[[np.ndarray], np.ndarray] = None) -> None:
+        self.__name__ = name
+        self.__doc__ = getattr(function or batch, '__doc__', None)
+        self.__function = function
+        self.__batch = batch
+
+    def __call__(self, x: np.ndarray) -> float:
+        if self.__function is not None:
+            return self.__function(x)
+
+        # The first axis holds the dimensions, e.g. the visualizer passes the 2 x h x w mesh grid
+        x = np.asarray(x, dtype=float)
+        values = self.__batch(np.moveaxis(x, 0, -1).reshape(-1, len(x)))
+        return np.float64(np.reshape(values, x.shape[1:]))
+
+    def batch(self, positions: np.ndarray) -> np.ndarray:
+        """Evaluate an (N x D) array of positions and return the N values."""
+        positions = np.asarray(positions, dtype=float)
+        if self.__batch is None:
+            values = [self.__function(position) for position in positions]
+        else:
+            values = self.__batch(positions)
+        return np.asarray(values, dtype=float).reshape(len(positions))
 
 
 # Add all functions from landscapes.single_objective
@@ -3,34 +3,83 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
+from functools import lru_cache
 from math import gamma
 
 import numpy as np
 
 
-def levy_flight(start: np.ndarray, alpha: float, param_lambda: float, gen: np.random.Generator) -> np.ndarray:
+@lru_cache(maxsize=None)
+def mantegna_sigma(param_lambda: float) -> float:
     """
-    Perform a levy flight step.
+    Get the standard deviation of the step's numerator in Mantegna's algorithm.
 
     Arguments:
-        start {numpy.ndarray} -- The cuckoo's start position
-        alpha {float} -- The step size
         param_lambda {float} -- lambda parameter of the levy distribution
-        gen {Generator} -- the generator used to generate pseudo random numbers
 
     Returns:
-        numpy.ndarray -- The new position
+        float -- The standard deviation
     """
-
     dividend = gamma(1 + param_lambda) * np.sin(np.pi * param_lambda / 2)
     divisor = gamma((1 + param_lambda) / 2) * param_lambda * np.power(2, (param_lambda - 1) / 2)
-    sigma1 = np.power(dividend / divisor, 1 / param_lambda)
+    return np.power(dividend / divisor, 1 / param_lambda)
+
+
+class LevyFlightSampler:
+    def __init__(self, alpha: float, param_lambda: float, gen: np.random.Generator) -> None:
+        """
+        Initializes a new instance of the `LevyFlightSampler` class.
+        It performs the levy flights of many positions at once.
+
+        Arguments:
+            alpha {float} -- The step size
+            param_lambda {float} -- lambda parameter of the levy distribution
+            gen {Generator} -- the generator used to generate pseudo random numbers
+        """
+        self.__alpha = alpha
+        self.__lambda = param_lambda
+        self.__sigma = mantegna_sigma(param_lambda)
+        self.__random = gen
+
+    def steps(self, shape) -> np.ndarray:
+        """
+        Draw levy distributed steps.
+
+        Arguments:
+            shape {Tuple[int, ...]} -- The shape of the steps, e.g. (N x D) for N positions
+
+        Returns:
+            numpy.ndarray -- The steps, not scaled by the step size
+        """
+        u_vec = self.__random.normal(0, self.__sigma, size=shape)
+        v_vec = self.__random.normal(0, 1, size=shape)
+        return u_vec / np.power(np.fabs(v_vec), 1 / self.__lambda)
+
+    def __call__(self, starts: np.ndarray) -> np.ndarray:
+        """
+        Perform a levy flight step from each start position.
 
-    sigma2 = 1
+        Arguments:
+            starts {numpy.ndarray} -- The (N x D) start positions
 
-    u_vec = gen.normal(0, sigma1, size=2)
-    v_vec = gen.normal(0, sigma2, size=2)
+        Returns:
+            numpy.ndarray -- The (N x D) new positions
+        """
+        starts = np.asarray(starts, dtype=float)
+        return starts + self.__alpha * self.steps(starts.shape)
 
-    step_length = u_vec / np.power(np.fabs(v_vec), 1 / param_lambda)
 
-    return start + alpha * step_length
+def levy_flight(start: np.ndarray, alpha: float, param_lambda: float, gen: np.random.Generator) -> np.ndarray:
+    """
+    Perform a levy flight step.
+
+    Arguments:
+        start {numpy.ndarray} -- The cuckoo's start position. The step has as many dimensions.
+        alpha {float} -- The step size
+        param_lambda {float} -- lambda parameter of the levy distribution
+        gen {Generator} -- the generator used to generate pseudo random numbers
+
+    Returns:
+        numpy.ndarray -- The new position
+    """
+    return LevyFlightSampler(alpha, param_lambda, gen)(start)
@@ -0,0 +1,20 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import logging
+
+from .visualizer_base import VisualizerBase
+
+LOGGER = logging.getLogger(__name__)
+
+
+class NullVisualizer(VisualizerBase):
+    """A visualizer which records nothing. Used to run a problem headless."""
+
+    def add_data(self, **kwargs) -> None:
+        pass
+
+    def replay(self, **kwargs) -> None:
+        LOGGER.info('Nothing was recorded, hence there is nothing to replay.')
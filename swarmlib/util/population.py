@@ -0,0 +1,264 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from contextlib import contextmanager
+from copy import copy
+
+import numpy as np
+
+from .evaluator import Evaluator
+
+# pylint: disable=too-many-instance-attributes
+
+
+class Population:
+    def __init__(self, size: int, **kwargs) -> None:
+        """
+        Initializes a new instance of the `Population` class with random positions.
+        It stores the positions, velocities, values and personal best positions of all agents in arrays
+        with one row per agent, so the agents can be updated all at once.
+
+        Arguments:
+            size {int} -- The number of agents
+
+        Keyword Arguments:
+            function {Callable[[numpy.ndarray], float]} -- The function to minimize
+            evaluator {Evaluator} -- Evaluates the function at many positions at once (default None, evaluate serially)
+            bit_generator {numpy.random.Generator} -- The generator used to generate pseudo random numbers
+            dimensions {int} -- The number of dimensions of the search space (default 2)
+            lower_boundary {float | numpy.ndarray} -- The lower boundary of all dimensions or one per dimension (default 0)
+            upper_boundary {float | numpy.ndarray} -- The upper boundary of all dimensions or one per dimension (default 4)
+        """
+        self.__dimensions = kwargs.get('dimensions', 2)
+        self.__lower_boundary = self.__boundary(kwargs.get('lower_boundary', 0.))
+        self.__upper_boundary = self.__boundary(kwargs.get('upper_boundary', 4.))
+        self.__random = kwargs['bit_generator']
+        self.__function = kwargs['function']
+        self.__evaluator = kwargs.get('evaluator', None) or Evaluator(self.__function)
+        self.__pending = None
+
+        self.__positions = np.empty((size, self.__dimensions))
+        self.__values = np.empty(size)
+        self.__velocities = np.zeros((size, self.__dimensions))
+        self.__best_positions = np.empty((size, self.__dimensions))
+        self.__best_values = np.empty(size)
+        self.initialize()
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    @property
+    def dimensions(self) -> int:
+        """The number of dimensions of the search space"""
+        return self.__dimensions
+
+    @property
+    def lower_boundary(self) -> np.ndarray:
+        """The lower boundary of each dimension"""
+        return self.__lower_boundary
+
+    @property
+    def upper_boundary(self) -> np.ndarray:
+        """The upper boundary of each dimension"""
+        return self.__upper_boundary
+
+    @property
+    def function(self):
+        """The function to minimize"""
+        return self.__function
+
+    @property
+    def random(self) -> np.random.Generator:
+        """The generator used to generate pseudo random numbers"""
+        return self.__random
+
+    @property
+    def positions(self) -> np.ndarray:
+        """The (N x D) positions. Use `move` to change them."""
+        return self.__positions
+
+    @property
+    def values(self) -> np.ndarray:
+        """The function value of each position"""
+        return self.__values
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """The (N x D) velocities. They are zero unless an algorithm sets them."""
+        return self.__velocities
+
+    @velocities.setter
+    def velocities(self, velocities: np.ndarray) -> None:
+        self.__velocities[:] = velocities
+
+    @property
+    def best_positions(self) -> np.ndarray:
+        """The (N x D) best positions each agent visited since it was initialized"""
+        return self.__best_positions
+
+    @property
+    def best_values(self) -> np.ndarray:
+        """The function value of each best position"""
+        return self.__best_values
+
+    def best(self) -> int:
+        """
+        Get the index of the agent with the lowest value.
+        """
+        return int(np.argmin(self.__values))
+
+    def initialize(self, indices=None) -> None:
+        """
+        Move the given agents to new random positions and reset their personal bests.
+
+        Arguments:
+            indices {numpy.ndarray} -- The agents' indices (default None, all agents)
+        """
+        indices = self.__indices(indices)
+        positions = self.__random.uniform(self.__lower_boundary, self.__upper_boundary, (len(indices), self.__dimensions))
+        # Any value is an improvement, so the new positions become the personal bests
+        self.__best_values[indices] = np.inf
+        self.move(positions, indices)
+
+    def move(self, positions: np.ndarray, indices=None, values=None) -> None:
+        """
+        Move the given agents to the given positions.
+        The positions are clipped to the boundaries and evaluated. The personal bests are updated.
+
+        Arguments:
+            positions {numpy.ndarray} -- The (k x D) new positions
+
+        Keyword Arguments:
+            indices {numpy.ndarray} -- The k agents' indices (default None, all agents)
+            values {numpy.ndarray} -- The k values of the clipped positions if they are known already (default None, evaluate them)
+        """
+        if values is None and self.__pending is not None:
+            self.__defer(positions, indices)
+            return
+
+        if values is None and isinstance(indices, (int, np.integer)):
+            self.__move_one(positions, indices)
+            return
+
+        indices = self.__indices(indices)
+        positions = self.clip(positions)
+        values = self.evaluate(positions) if values is None else np.reshape(values, len(indices))
+
+        self.__positions[indices] = positions
+        self.__values[indices] = values
+
+        improved = values < self.__best_values[indices]
+        self.__best_positions[indices[improved]] = positions[improved]
+        self.__best_values[indices[improved]] = values[improved]
+
+    def evaluate_position(self, position: np.ndarray) -> float:
+        """
+        Evaluate the function at a single position.
+
+        Arguments:
+            position {numpy.ndarray} -- The position
+
+        Returns:
+            float -- The value
+        """
+        return self.__evaluator.evaluate_position(position)
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the function at the given positions.
+        Functions with a batched form, e.g. the ones in `FUNCTIONS`, evaluate all positions in one call.
+        The population's evaluator may split them among threads or processes.
+
+        Arguments:
+            positions {numpy.ndarray} -- The (k x D) positions
+
+        Returns:
+            numpy.ndarray -- The k values
+        """
+        return self.__evaluator(positions)
+
+    @contextmanager
+    def deferred(self):
+        """
+        Defer the evaluation of all agents moved within the context.
+        Their positions change immediately, but their values and personal bests are updated when the context exits.
+        Then all moved agents are evaluated at once. An agent that moved several times is evaluated at its last position only.
+
+        Example:
+            with population.deferred():
+                for agent in agents:
+                    agent.step()
+        """
+        if self.__pending is not None:
+            yield
+            return
+
+        self.__pending = []
+        try:
+            yield
+        finally:
+            pending, self.__pending = self.__pending, None
+            if pending:
+                indices = np.unique(pending)
+                self.move(self.__positions[indices], indices)
+
+    def clip(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Clip the given positions to the boundaries.
+        """
+        return np.clip(np.asarray(positions, dtype=float).reshape(-1, self.__dimensions), self.__lower_boundary, self.__upper_boundary)
+
+    def subset(self, indices) -> 'Population':
+        """
+        Copy the given agents into a new population. The function and the generator are shared.
+
+        Arguments:
+            indices {numpy.ndarray} -- The agents' indices
+
+        Returns:
+            Population -- The new population
+        """
+        # pylint: disable=protected-access,unused-private-member
+        indices = self.__indices(indices)
+        population = copy(self)
+        population.__positions = self.__positions[indices]
+        population.__values = self.__values[indices]
+        population.__velocities = self.__velocities[indices]
+        population.__best_positions = self.__best_positions[indices]
+        population.__best_values = self.__best_values[indices]
+        population.__pending = None
+        return population
+
+    def __defer(self, positions, indices):
+        if isinstance(indices, (int, np.integer)):
+            self.__positions[indices] = np.clip(np.asarray(positions, dtype=float), self.__lower_boundary, self.__upper_boundary)
+            self.__pending.append(indices)
+            return
+
+        indices = self.__indices(indices)
+        self.__positions[indices] = self.clip(positions)
+        self.__pending.extend(indices.tolist())
+
+    def __move_one(self, position, index):
+        # Agents moved one by one would spend most of the time in the bookkeeping for index arrays
+        position = np.clip(np.asarray(position, dtype=float), self.__lower_boundary, self.__upper_boundary)
+        value = self.__evaluator.evaluate_position(position)
+
+        self.__positions[index] = position
+        self.__values[index] = value
+        if value < self.__best_values[index]:
+            self.__best_positions[index] = position
+            self.__best_values[index] = value
+
+    def __boundary(self, boundary) -> np.ndarray:
+        try:
+            return np.broadcast_to(np.asarray(boundary, dtype=float), (self.__dimensions,))
+        except ValueError as error:
+            raise ValueError(f'Expected a single boundary or one per dimension ({self.__dimensions}), got {boundary}.') from error
+
+    def __indices(self, indices) -> np.ndarray:
+        if indices is None:
+            return np.arange(len(self))
+        return np.atleast_1d(np.asarray(indices, dtype=np.intp))
@@ -3,21 +3,93 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
+import logging
 from abc import ABC, abstractmethod
 from numpy.random import default_rng
-from ..util.coordinate import Coordinate
+from ..util.evaluation_cache import EvaluationCache
+from ..util.evaluator import Evaluator
+from ..util.null_visualizer import NullVisualizer
+from ..util.population import Population
+from ..util.solution import Solution
 from ..util.visualizer_base import VisualizerBase
 
+LOGGER = logging.getLogger(__name__)
+
 
 class ProblemBase(ABC):
     def __init__(self, **kwargs) -> None:
+        """
+        Initializes the problem's random generator and the evaluation of its function.
+
+        Keyword Arguments:
+            seed {int} -- Used to set the initial state of the random bit generator (default None)
+            function {Callable[[numpy.ndarray], float]} -- The function to minimize (default None)
+            evaluation {str | concurrent.futures.Executor} -- Evaluate a generation's positions `serial`, in `threads`,
+                in `processes` or with an own executor. The results do not depend on it. (default serial)
+            workers {int} -- Number of threads or processes of the evaluation (default number of CPUs)
+            cache_size {int} -- Remember the values of that many positions to never evaluate a position twice (default None, no cache)
+            cache_decimals {int} -- The decimals the positions are rounded to for the cache (default 10)
+        """
         self._random = default_rng(kwargs.get('seed', None))
         self._visualizer: VisualizerBase = None
 
+        # The ant colony optimization has no function to evaluate
+        function = kwargs.get('function', None)
+        cache_size = kwargs.get('cache_size', None)
+        cache = EvaluationCache(cache_size, kwargs.get('cache_decimals', 10)) if cache_size else None
+        self._evaluator = Evaluator(function, kwargs.get('evaluation', 'serial'), kwargs.get('workers', None), cache) if function else None
+
     @abstractmethod
-    def solve(self) -> Coordinate:
+    def solve(self) -> Solution:
         pass
 
+    @property
+    def cache(self) -> EvaluationCache:
+        """
+        The cache of the evaluated values. Its hits and misses tell how many evaluations it saved.
+        It is None unless a `cache_size` is set.
+        """
+        return self._evaluator.cache if self._evaluator else None
+
+    def _best_solution(self, population: Population, iteration: int, solution: Solution = None) -> Solution:
+        """
+        Get the best solution found so far. That is the given one unless the population's best agent is better.
+
+        Arguments:
+            population {Population} -- The population of the problem's agents
+            iteration {int} -- The current iteration
+
+        Keyword Arguments:
+            solution {Solution} -- The best solution found before (default None)
+
+        Returns:
+            Solution -- The best solution
+        """
+        index = population.best()
+        if solution is not None and solution.value <= population.values[index]:
+            return solution
+        return Solution.create(population.positions[index], population.values[index], iteration, self._evaluator.evaluations)
+
+    def _init_visualizer(self, visualizer_type, **kwargs) -> None:
+        """
+        Create the problem's visualizer.
+        Only 2D search spaces can be drawn, for all other dimensions nothing is recorded.
+
+        Arguments:
+            visualizer_type {type} -- The visualizer class for 2D search spaces
+
+        Keyword Arguments:
+            record {bool} -- Record the positions for the replay. Disable it to run headless (default True)
+        """
+        dimensions = kwargs.get('dimensions', 2)
+        if not kwargs.get('record', True):
+            self._visualizer = NullVisualizer()
+        elif dimensions == 2:
+            self._visualizer = visualizer_type(**kwargs)
+        else:
+            LOGGER.info('The visualization is disabled for a search space with %s dimensions.', dimensions)
+            self._visualizer = NullVisualizer()
+
     def replay(self) -> None:
         """
         Start the problems visualization.
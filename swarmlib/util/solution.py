@@ -0,0 +1,61 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from functools import total_ordering
+from typing import NamedTuple
+
+import numpy as np
+
+
+@total_ordering
+class Solution(NamedTuple):
+    """
+    The best position a problem found so far.
+    The record is immutable, its position is a read-only copy. Solutions are compared by their values,
+    like the agents, so a solution and an agent can be compared as well.
+    """
+    position: np.ndarray
+    value: float
+    iteration: int  # The iteration the position was found in, 0 for the initial positions
+    evaluations: int  # The number of function evaluations until the position was found
+
+    @classmethod
+    def create(cls, position: np.ndarray, value: float, iteration: int = 0, evaluations: int = 0) -> 'Solution':
+        """
+        Create a new solution with a read-only copy of the given position.
+
+        Arguments:
+            position {numpy.ndarray} -- The position
+            value {float} -- Its value
+
+        Keyword Arguments:
+            iteration {int} -- The iteration the position was found in (default 0)
+            evaluations {int} -- The number of function evaluations until the position was found (default 0)
+
+        Returns:
+            Solution -- The new solution
+        """
+        position = np.array(position, dtype=float)
+        position.setflags(write=False)
+        return cls(position, float(value), iteration, evaluations)
+
+    # tuple compares element-wise. Fall back to object's comparisons, so total_ordering derives them from value.
+    __ne__ = object.__ne__
+    __le__ = object.__le__
+    __gt__ = object.__gt__
+    __ge__ = object.__ge__
+
+    def __eq__(self, other) -> bool:
+        if not hasattr(other, 'value'):
+            return NotImplemented
+        return self.value == other.value
+
+    def __lt__(self, other) -> bool:
+        if not hasattr(other, 'value'):
+            return NotImplemented
+        return self.value < other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
@@ -24,7 +24,7 @@ class Whale(Coordinate):
             rand_whale {Coordinate} -- Randomly selected whale
         """
         prob: float = self._random.uniform()
-        r_vec = self._random.uniform(size=2)  # Here r is in [0, 1) although the paper suggests [0, 1]
+        r_vec = self._random.uniform(size=self._population.dimensions)  # Here r is in [0, 1) although the paper suggests [0, 1]
         a_vec = 2 * self.__a * r_vec - self.__a  # Equation 2.3
         c_vec = 2 * r_vec  # Equation 2.4
 
@@ -48,5 +48,5 @@ class Whale(Coordinate):
 
     def __attack_prey(self, prey: Coordinate):
         d_vec = np.linalg.norm(prey.position - self._position)
-        l_vec = self._random.uniform(size=2) # Here l is in [0, 1) although the paper suggests [0, 1]
+        l_vec = self._random.uniform(size=self._population.dimensions) # Here l is in [0, 1) although the paper suggests [0, 1]
         self._position = d_vec * np.exp(self.__b * l_vec) * np.cos(2 * np.pi * l_vec) + prey.position  # Equation 2.5
@@ -3,16 +3,14 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
-# pylint: disable=too-many-instance-attributes
-
 import logging
-from copy import deepcopy
 
 import numpy as np
 
-from .whale import Whale
 from ..util.base_visualizer import BaseVisualizer
+from ..util.population import Population
 from ..util.problem_base import ProblemBase
+from ..util.solution import Solution
 
 LOGGER = logging.getLogger(__name__)
 
@@ -21,35 +19,53 @@ class WOAProblem(ProblemBase):
     def __init__(self, **kwargs):
         """
         Initialize a new whale optimization algorithm problem.
+        The whole pod is moved at once. The parameter `a` shrinks linearly from its initial value to zero over the iterations.
         """
         super().__init__(**kwargs)
         self.__iteration_number = kwargs['iteration_number']
-        self.__whales = [
-            Whale(**kwargs, bit_generator=self._random)
-            for _ in range(kwargs['whales'])
-        ]
+        self.__a = kwargs.get('a', 1.)
+        self.__b = kwargs.get('b', .5)
+        self.__population = Population(kwargs['whales'], **kwargs, bit_generator=self._random, evaluator=self._evaluator)
 
-        self._visualizer = BaseVisualizer(**kwargs)
+        self._init_visualizer(BaseVisualizer, **kwargs)
         # Initialize visualizer for plotting
-        positions = [whale.position for whale in self.__whales]
-        self._visualizer.add_data(positions=positions)
+        self._visualizer.add_data(positions=self.__population.positions)
 
-    def solve(self) -> Whale:
-        global_best_whale = None
+    def solve(self) -> Solution:
+        best = self._best_solution(self.__population, 0)
+        for iteration in range(self.__iteration_number):
+            self.__step(self.__a * (1 - iteration / self.__iteration_number))
+            best = self._best_solution(self.__population, iteration + 1, best)
 
-        # And also update global_best_whale
-        for _ in range(self.__iteration_number):
+            # Add data for plot
+            self._visualizer.add_data(positions=self.__population.positions)
 
-            # Update global best
-            global_best_whale = np.amin(self.__whales)
+        LOGGER.info('Last best solution="%s" at position="%s"', best.value, best.position)
+        return best
 
-            random_whales = deepcopy(self._random.choice(self.__whales, size=len(self.__whales)))
-            for whale, random_whale in zip(self.__whales, random_whales):
-                whale.step(global_best_whale, random_whale)
+    def __step(self, a_parameter: float) -> None:
+        # Move all whales at once, like each whale's step does for itself
+        population = self.__population
+        size = len(population)
+        positions = population.positions
 
-            # Add data for plot
-            self._visualizer.add_data(positions=[whale.position for whale in self.__whales])
+        # Fancy indexing copies the prey's and the random partners' positions before the pod moves
+        prey = positions[[population.best()]]
+        partners = positions[self._random.choice(size, size=size)]
+
+        attack = self._random.uniform(size=size) >= 0.5
+        r_vectors = self._random.uniform(size=positions.shape)  # Here r is in [0, 1) although the paper suggests [0, 1]
+        a_vectors = 2 * a_parameter * r_vectors - a_parameter  # Equation 2.3
+        c_vectors = 2 * r_vectors  # Equation 2.4
+
+        # Encircle the prey if |A| < 1, otherwise search for prey around the random partner (Equation 2.6)
+        targets = np.where((np.linalg.norm(a_vectors, axis=1) < 1)[:, None], prey, partners)
+        distances = np.linalg.norm(c_vectors * targets - positions, axis=1)  # Equations 2.1 and 2.7
+        new_positions = targets - a_vectors * distances[:, None]  # Equations 2.2 and 2.8
+
+        # Attack the prey on a spiral. Here l is in [0, 1) although the paper suggests [0, 1]
+        l_vectors = self._random.uniform(size=(np.count_nonzero(attack), population.dimensions))
+        distances = np.linalg.norm(prey - positions[attack], axis=1)
+        new_positions[attack] = distances[:, None] * np.exp(self.__b * l_vectors) * np.cos(2 * np.pi * l_vectors) + prey  # Equation 2.5
 
-        global_best_whale = np.amin(self.__whales)
-        LOGGER.info('Last best solution="%s" at position="%s"', global_best_whale.value, global_best_whale.position)
-        return global_best_whale
+        population.move(new_positions)
@@ -0,0 +1,62 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from swarmlib.abc.abc_problem import ABCProblem
+from swarmlib.util.functions import FUNCTIONS
+
+# pylint: disable=unused-variable,protected-access
+
+
+@pytest.fixture
+def kwargs():
+    return {
+        'function': FUNCTIONS['sphere'],
+        'bees': 10,
+        'iteration_number': 5,
+        'lower_boundary': -4.,
+        'seed': 3
+    }
+
+
+def describe_abc_problem():
+    def keeps_the_best_food_source_found(kwargs):
+        problem = ABCProblem(**kwargs)
+        population = problem._ABCProblem__population
+        initial_best = np.min(population.values)
+
+        best = problem.solve()
+
+        assert best.value <= min(initial_best, np.min(population.values))
+        assert best.value == FUNCTIONS['sphere'](best.position)
+
+    def resets_the_bees_that_exceeded_the_trial_limit(kwargs):
+        problem = ABCProblem(**kwargs, trials=2)
+
+        problem.solve()
+
+        assert np.all(problem._ABCProblem__trials < 2)
+
+    def keeps_better_food_sources_without_scouts(kwargs):
+        problem = ABCProblem(**kwargs, trials=100)
+        population = problem._ABCProblem__population
+        initial_values = population.values.copy()
+
+        problem.solve()
+
+        assert np.all(population.values <= initial_values)
+        assert np.all(problem._ABCProblem__trials <= 2 * kwargs['iteration_number'])
+
+    def records_the_iteration_the_best_food_source_was_found_in(kwargs):
+        kwargs['iteration_number'] = 20
+        best = ABCProblem(**kwargs).solve()
+
+        assert best.iteration > 0
+        kwargs['iteration_number'] = best.iteration
+        assert ABCProblem(**kwargs).solve().value == best.value
+        kwargs['iteration_number'] = best.iteration - 1
+        assert ABCProblem(**kwargs).solve().value > best.value
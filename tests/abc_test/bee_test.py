@@ -0,0 +1,67 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from swarmlib.abc.abc_problem import ABCProblem
+from swarmlib.abc.bees.employee_bee import EmployeeBee
+from swarmlib.abc.bees.onlooker_bee import OnlookerBee
+from swarmlib.util.functions import FUNCTIONS
+
+# pylint: disable=unused-variable,protected-access
+
+
+@pytest.fixture
+def problem():
+    return ABCProblem(function=FUNCTIONS['sphere'], bees=3, iteration_number=2, trials=2, seed=3)
+
+
+def _bee(bee_type, problem, index):
+    return bee_type(
+        population=problem._ABCProblem__population,
+        index=index,
+        trials=2,
+        trial_counts=problem._ABCProblem__trials,
+        reset_flags=problem._ABCProblem__reset)
+
+
+def describe_bee():
+    def shares_the_trials_with_the_problem(problem):
+        test_object = _bee(EmployeeBee, problem, 1)
+
+        test_object.update(test_object.position, test_object.value, test_object.value)
+
+        assert test_object.trials == 1
+        np.testing.assert_array_equal(problem._ABCProblem__trials, [0, 1, 0, 0, 0, 0])
+
+    def reads_the_trials_of_the_problem(problem):
+        test_object = _bee(OnlookerBee, problem, 4)
+
+        problem.solve()
+
+        assert test_object.trials == problem._ABCProblem__trials[4]
+        assert test_object.is_reset == problem._ABCProblem__reset[4]
+
+    def is_reset_after_exceeding_the_trial_limit(problem):
+        test_object = _bee(EmployeeBee, problem, 0)
+        test_object.update(test_object.position - 1, test_object.value - 1, test_object.value)
+        assert not test_object.is_reset
+
+        for _ in range(2):
+            test_object.update(test_object.position, test_object.value, test_object.value)
+        test_object.reset()
+
+        assert test_object.is_reset
+        assert test_object.trials == 0
+        assert problem._ABCProblem__reset[0]
+
+    def creates_own_trials_without_a_population():
+        test_object = EmployeeBee(function=FUNCTIONS['sphere'], bit_generator=np.random.default_rng(3))
+
+        test_object.update(test_object.position, test_object.value, test_object.value)
+
+        assert test_object.trials == 1
+        assert test_object.is_reset
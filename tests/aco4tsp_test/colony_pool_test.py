@@ -0,0 +1,76 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from os import path
+
+import numpy as np
+import pytest
+
+from swarmlib.aco4tsp.aco_problem import ACOProblem
+from swarmlib.aco4tsp.colony_pool import ColonyPool
+from swarmlib.aco4tsp.tsp_graph import Graph
+from swarmlib.aco4tsp.tsplib_loader import load_instance
+
+# pylint: disable=unused-variable
+
+TSP_FILE = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'swarmlib', 'aco4tsp', 'resources', 'burma14.tsp')
+
+
+@pytest.fixture
+def graph():
+    return Graph(load_instance(TSP_FILE, None))
+
+
+def _seed_sequences(workers):
+    return np.random.SeedSequence(5).spawn(workers)
+
+
+def describe_colony_pool():
+    def constructs_closed_tours_visiting_each_node_once(graph):
+        starts = np.array([0, 5, 5, 13, 2])
+
+        with ColonyPool(graph, 1., 2., _seed_sequences(2)) as test_object:
+            tours, lengths = test_object.build(starts)
+
+        assert tours.shape == (5, 15)
+        np.testing.assert_array_equal(tours[:, 0], starts)
+        for tour, length in zip(tours, lengths):
+            np.testing.assert_array_equal(np.sort(tour[:-1]), np.arange(14))
+            np.testing.assert_almost_equal(length, graph.distance_matrix[tour[:-1], tour[1:]].sum())
+
+    def is_reproducible(graph):
+        with ColonyPool(graph, 1., 2., _seed_sequences(3)) as test_object:
+            first, _ = test_object.build(np.arange(14))
+        with ColonyPool(graph, 1., 2., _seed_sequences(3)) as test_object:
+            second, _ = test_object.build(np.arange(14))
+
+        np.testing.assert_array_equal(first, second)
+
+    def shares_the_parents_pheromone(graph):
+        with ColonyPool(graph, 1., 0., _seed_sequences(2)) as test_object:
+            graph.set_pheromone((1, 2), 1e6)
+            tours, _ = test_object.build(np.zeros(4, dtype=int))
+
+        np.testing.assert_array_equal(tours[:, 1], 1)
+
+    def keeps_the_pheromone_after_closing(graph):
+        with ColonyPool(graph, 1., 2., _seed_sequences(2)):
+            graph.set_pheromone((1, 2), 3.)
+
+        assert graph.get_edge_pheromone((1, 2)) == 3.
+        graph.evaporate(0.5)
+        assert graph.get_edge_pheromone((2, 1)) == 1.5
+
+    def applies_the_local_search():
+        problem = ACOProblem(ant_number=4, iteration_number=2, engine='processes', workers=2, local_search='2opt', seed=1)
+
+        _, distance = problem.solve()
+
+        # The 2-opt optimum of each tour is far shorter than an unimproved tour
+        assert distance < 3500
+
+    def rejects_local_pheromone_updates():
+        with pytest.raises(ValueError):
+            ACOProblem(ant_number=4, engine='processes', variant='ACS')
@@ -0,0 +1,148 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from os import path
+
+import numpy as np
+import pytest
+
+from swarmlib.aco4tsp import distance_oracle
+from swarmlib.aco4tsp.aco_problem import ACOProblem
+from swarmlib.aco4tsp.distance_oracle import tree_nearest_neighbors
+from swarmlib.aco4tsp.tsp_graph import nearest_neighbors
+from swarmlib.aco4tsp.tsplib_loader import load_instance
+
+# pylint: disable=unused-variable,redefined-outer-name
+
+TSP_FILE = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'swarmlib', 'aco4tsp', 'resources', 'burma14.tsp')
+
+
+@pytest.fixture
+def random_problem(tmp_path):
+    coordinates = np.random.default_rng(4).uniform(0, 1000, (200, 2)).round(1)
+    lines = [
+        'NAME: random200',
+        'TYPE: TSP',
+        'DIMENSION: 200',
+        'EDGE_WEIGHT_TYPE: EUC_2D',
+        'NODE_COORD_SECTION',
+        *[f'{index + 1} {x} {y}' for index, (x, y) in enumerate(coordinates)],
+        'EOF'
+    ]
+    tsp_file = tmp_path / 'random200.tsp'
+    tsp_file.write_text('\n'.join(lines) + '\n')
+    return str(tsp_file)
+
+
+@pytest.fixture
+def expected():
+    return load_instance(TSP_FILE, None).distances
+
+
+@pytest.fixture
+def test_object():
+    return load_instance(TSP_FILE, lazy=True, cache_rows=2).distances
+
+
+def describe_distance_oracle():
+    def has_the_matrix_shape(test_object):
+        assert len(test_object) == 14
+        assert test_object.shape == (14, 14)
+
+    def returns_single_distances(test_object, expected):
+        for start in range(14):
+            for end in range(14):
+                assert test_object[start, end] == expected[start, end]
+
+    def returns_distances_of_index_arrays(test_object, expected):
+        rows = np.array([[0], [3], [13]])
+        columns = np.array([[1, 2, 3, 13]])
+
+        np.testing.assert_array_equal(test_object[rows, columns], expected[rows, columns])
+
+    def returns_rows(test_object, expected):
+        np.testing.assert_array_equal(test_object[4], expected[4])
+        np.testing.assert_array_equal(test_object[np.array([1, 2])], expected[[1, 2]])
+
+    def caches_the_most_recently_used_rows(test_object):
+        first = test_object.row(1)
+        test_object.row(2)
+        assert test_object.row(1) is first
+
+        test_object.row(3)
+        test_object.row(4)
+
+        assert test_object.row(1) is not first
+
+    def rejects_lazy_loading_without_coordinates(tmp_path):
+        tsp_file = tmp_path / 'explicit.tsp'
+        tsp_file.write_text('NAME: e\nTYPE: TSP\nDIMENSION: 2\nEDGE_WEIGHT_TYPE: EXPLICIT\nEDGE_WEIGHT_FORMAT: FULL_MATRIX\n'
+                            'EDGE_WEIGHT_SECTION\n0 1\n1 0\nEOF\n')
+
+        with pytest.raises(ValueError):
+            load_instance(str(tsp_file), lazy=True)
+
+    def describe_nearest_neighbors():
+        @pytest.mark.parametrize('search', ['kdtree', 'tree'])
+        def equals_the_dense_neighbors(search, random_problem, monkeypatch):
+            if search == 'kdtree':
+                pytest.importorskip('scipy.spatial')
+            else:
+                monkeypatch.setattr(distance_oracle, 'cKDTree', None)
+            test_object = load_instance(random_problem, lazy=True).distances
+            dense = load_instance(random_problem, None).distances
+
+            neighbors = test_object.nearest_neighbors(6)
+
+            np.testing.assert_array_equal(dense[np.arange(200)[:, np.newaxis], neighbors],
+                                          dense[np.arange(200)[:, np.newaxis], nearest_neighbors(dense, 6)])
+
+        def scans_all_rows_without_embedding(test_object, expected, monkeypatch):
+            monkeypatch.setattr(test_object, '_DistanceOracle__embedding', None)
+            monkeypatch.setattr(distance_oracle, 'BLOCK_SIZE', 20)
+
+            neighbors = test_object.nearest_neighbors(4)
+
+            np.testing.assert_array_equal(expected[np.arange(14)[:, np.newaxis], neighbors],
+                                          expected[np.arange(14)[:, np.newaxis], nearest_neighbors(expected, 4)])
+
+        def requires_a_neighbor_number(test_object):
+            with pytest.raises(ValueError):
+                test_object.nearest_neighbors(None)
+
+    def describe_tree_nearest_neighbors():
+        @pytest.mark.parametrize('dimension', [2, 3])
+        def finds_the_nearest_points(dimension):
+            points = np.random.default_rng(5).normal(size=(300, dimension))
+            distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+
+            neighbors = tree_nearest_neighbors(points, 5)
+
+            expected = np.sort(distances, axis=1)[:, :5]
+            np.testing.assert_allclose(np.sort(np.take_along_axis(distances, neighbors, axis=1), axis=1), expected)
+
+        def finds_the_nearest_points_of_clustered_and_equal_points():
+            random = np.random.default_rng(6)
+            centers = random.uniform(0, 1e6, (10, 2))
+            # 300 equal points and 1700 points in 10 small clusters
+            points = np.concatenate([np.repeat(centers[:1], 300, axis=0), centers[random.integers(10, size=1700)] + random.normal(scale=10, size=(1700, 2))])
+            distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+
+            neighbors = tree_nearest_neighbors(points, 20)
+
+            np.testing.assert_allclose(np.sort(np.take_along_axis(distances, neighbors, axis=1), axis=1), np.sort(distances, axis=1)[:, :20])
+
+    def describe_aco_problem():
+        def solves_with_lazy_distances():
+            problem = ACOProblem(ant_number=4, iteration_number=3, lazy_distances=True, candidate_number=5, local_search='2opt', seed=2)
+
+            best_path, distance = problem.solve()
+
+            assert sorted(best_path[:-1]) == list(range(1, 15))
+            assert distance < 3500
+
+        def requires_a_candidate_number():
+            with pytest.raises(ValueError):
+                ACOProblem(ant_number=4, lazy_distances=True)
@@ -0,0 +1,86 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import argparse
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from swarmlib.aco4tsp.aco_problem import ACOProblem
+from swarmlib.aco4tsp.local_2_opt import run_2opt
+from swarmlib.aco4tsp.main import configure_parser
+from swarmlib.aco4tsp.tsp_graph import nearest_neighbors
+
+# pylint: disable=unused-variable
+
+
+@pytest.fixture
+def distances():
+    coordinates = np.random.default_rng(3).uniform(0, 100, size=(40, 2))
+    return np.linalg.norm(coordinates[:, np.newaxis] - coordinates[np.newaxis], axis=-1)
+
+
+@pytest.fixture
+def route():
+    tour = np.random.default_rng(4).permutation(40)
+    return [*tour, tour[0]]
+
+
+def route_distance(route, distances):
+    return sum(distances[start, end] for start, end in zip(route[:-1], route[1:]))
+
+
+def describe_run_2opt():
+    def returns_closed_route_with_same_start_and_nodes(route, distances):
+        result, _ = run_2opt(route, distances)
+
+        assert result[0] == route[0]
+        assert result[-1] == route[0]
+        np.testing.assert_array_equal(np.sort(result[:-1]), np.arange(40))
+
+    def returns_distance_of_improved_route(route, distances):
+        result, distance = run_2opt(route, distances)
+
+        np.testing.assert_almost_equal(distance, route_distance(result, distances))
+        assert distance < route_distance(route, distances)
+
+    def leaves_no_improving_move(route, distances):
+        result, distance = run_2opt(route, distances)
+
+        for i, k in combinations(range(1, len(result) - 1), 2):
+            swapped = [*result[:i], *reversed(result[i:k + 1]), *result[k + 1:]]
+            assert route_distance(swapped, distances) > distance - 1e-9
+
+    def improves_with_neighbor_lists(route, distances):
+        _, distance = run_2opt(route, distances, nearest_neighbors(distances, 5))
+
+        assert distance < route_distance(route, distances)
+
+    def keeps_tiny_routes(distances):
+        result, distance = run_2opt([0, 1, 2, 0], distances)
+
+        assert result == [0, 1, 2, 0]
+        np.testing.assert_almost_equal(distance, route_distance(result, distances))
+
+
+def describe_two_opt():
+    def warns_that_the_argument_is_deprecated():
+        with pytest.warns(DeprecationWarning):
+            problem = ACOProblem(ant_number=2, iteration_number=1, record=False, two_opt=True, seed=1)
+
+        _, distance = problem.solve()
+
+        assert distance > 0
+
+    def is_a_hidden_alias_of_the_local_search_option():
+        parser = argparse.ArgumentParser()
+        sub_parsers = parser.add_subparsers()
+        configure_parser(sub_parsers)
+
+        args = parser.parse_args(['ants', '--two-opt', '2'])
+
+        assert args.local_search == '2opt'
+        assert '--two-opt' not in sub_parsers.choices['ants'].format_help()
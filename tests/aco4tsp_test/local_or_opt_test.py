@@ -0,0 +1,68 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from swarmlib.aco4tsp.local_3_opt import run_3opt
+from swarmlib.aco4tsp.local_or_opt import run_or_opt
+from swarmlib.aco4tsp.tsp_graph import nearest_neighbors
+
+# pylint: disable=unused-variable
+
+
+@pytest.fixture
+def distances():
+    coordinates = np.random.default_rng(3).uniform(0, 100, size=(40, 2))
+    return np.linalg.norm(coordinates[:, np.newaxis] - coordinates[np.newaxis], axis=-1)
+
+
+@pytest.fixture
+def route():
+    tour = np.random.default_rng(4).permutation(40)
+    return [*tour, tour[0]]
+
+
+def route_distance(route, distances):
+    return sum(distances[start, end] for start, end in zip(route[:-1], route[1:]))
+
+
+@pytest.mark.parametrize('local_search', [run_or_opt, run_3opt])
+def describe_local_search():
+    def returns_closed_route_with_same_start_and_nodes(local_search, route, distances):
+        result, _ = local_search(route, distances)
+
+        assert result[0] == route[0]
+        assert result[-1] == route[0]
+        np.testing.assert_array_equal(np.sort(result[:-1]), np.arange(40))
+
+    def returns_distance_of_improved_route(local_search, route, distances):
+        result, distance = local_search(route, distances, nearest_neighbors(distances, 8))
+
+        np.testing.assert_almost_equal(distance, route_distance(result, distances))
+        assert distance < route_distance(route, distances)
+
+
+def describe_run_or_opt():
+    def moves_misplaced_city_back():
+        angles = np.linspace(0, 2 * np.pi, 12, endpoint=False)
+        coordinates = np.column_stack((np.cos(angles), np.sin(angles)))
+        distances = np.linalg.norm(coordinates[:, np.newaxis] - coordinates[np.newaxis], axis=-1)
+        optimal_distance = route_distance([*range(12), 0], distances)
+
+        result, distance = run_or_opt([0, 1, 2, 4, 5, 6, 3, 7, 8, 9, 10, 11, 0], distances)
+
+        np.testing.assert_almost_equal(distance, optimal_distance)
+        assert result in ([*range(12), 0], [0, *range(11, 0, -1), 0])
+
+
+def describe_run_3opt():
+    def is_not_worse_than_2opt_alone(route, distances):
+        from swarmlib.aco4tsp.local_2_opt import run_2opt  # pylint: disable=import-outside-toplevel
+        _, two_opt_distance = run_2opt(route, distances)
+
+        _, distance = run_3opt(route, distances)
+
+        assert distance <= two_opt_distance * 1.05
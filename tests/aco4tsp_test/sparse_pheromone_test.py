@@ -0,0 +1,78 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from swarmlib.aco4tsp.sparse_pheromone import SparsePheromone
+
+# pylint: disable=unused-variable
+
+
+@pytest.fixture
+def test_object():
+    # Stores the edges (0, 1), (0, 2), (1, 2) and (2, 3)
+    pheromone = SparsePheromone(np.array([[1, 2], [0, 2], [3, 0], [2, 2]]))
+    pheromone.fill(1.)
+    return pheromone
+
+
+def describe_sparse_pheromone():
+    def stores_each_undirected_edge_once(test_object):
+        starts, ends = test_object.edges()
+
+        np.testing.assert_array_equal(starts, [0, 0, 1, 2])
+        np.testing.assert_array_equal(ends, [1, 2, 2, 3])
+
+    def is_symmetric(test_object):
+        test_object[np.array([2]), np.array([0])] = 4.
+
+        assert test_object[0, 2] == 4.
+        assert test_object[2, 0] == 4.
+
+    def adds_pheromone_to_all_edges(test_object):
+        test_object.add(np.array([0, 1, 0, 1]), np.array([1, 0, 3, 3]), np.array([1., 2., 3., 4.]))
+
+        assert test_object[0, 1] == 4.
+        assert test_object[0, 3] == 4.
+        assert test_object[1, 3] == 5.
+        assert test_object[3, 1] == 5.
+
+    def stores_edges_which_received_pheromone(test_object):
+        test_object.add(np.array([3]), np.array([0]), np.array([2.]))
+
+        starts, ends = test_object.edges()
+        np.testing.assert_array_equal(starts, [0, 0, 0, 1, 2])
+        np.testing.assert_array_equal(ends, [1, 2, 3, 2, 3])
+        np.testing.assert_array_equal(test_object[0], [1., 1., 1., 3.])
+        np.testing.assert_array_equal(test_object[3], [3., 1., 1., 1.])
+
+    def stores_set_edges_which_differ_from_the_other_edges(test_object):
+        test_object[np.array([1, 3]), np.array([3, 0])] = np.array([1., 2.])
+
+        starts, _ = test_object.edges()
+        assert len(starts) == 5
+        assert test_object[1, 3] == 1.
+        assert test_object[0, 3] == 2.
+
+    def evaporates_all_edges(test_object):
+        test_object *= 0.5
+
+        np.testing.assert_array_equal(test_object[np.arange(4)[:, np.newaxis], np.arange(4)], 0.5)
+
+    def clips_all_edges(test_object):
+        test_object.add(np.array([2]), np.array([3]), np.array([5.]))
+
+        test_object.clip(2., 3.)
+
+        assert test_object[2, 3] == 3.
+        assert test_object[1, 3] == 2.
+
+    def returns_complete_rows(test_object):
+        test_object.add(np.array([0, 2]), np.array([1, 3]), np.array([1., 2.]))
+        expected = test_object[np.arange(4)[:, np.newaxis], np.arange(4)]
+
+        np.testing.assert_array_equal(test_object[np.arange(4)], expected)
+        np.testing.assert_array_equal(test_object[3], expected[3])
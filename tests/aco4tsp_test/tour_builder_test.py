@@ -0,0 +1,104 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from os import path
+
+import numpy as np
+import pytest
+
+from swarmlib.aco4tsp.tour_builder import TourBuilder, compute_heuristic
+from swarmlib.aco4tsp.tsp_graph import Graph
+from swarmlib.aco4tsp.tsplib_loader import load_instance
+
+# pylint: disable=unused-variable
+
+TSP_FILE = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'swarmlib', 'aco4tsp', 'resources', 'burma14.tsp')
+
+
+@pytest.fixture
+def graph():
+    return Graph(load_instance(TSP_FILE, None))
+
+
+@pytest.fixture
+def test_object(graph):
+    return TourBuilder(graph, 1., 2., np.random.default_rng(3))
+
+
+def describe_tour_builder():
+    def describe_build():
+        def constructs_closed_tours_visiting_each_node_once(test_object):
+            starts = np.array([0, 5, 5, 13])
+
+            tours, _ = test_object.build(starts)
+
+            assert tours.shape == (4, 15)
+            np.testing.assert_array_equal(tours[:, 0], starts)
+            np.testing.assert_array_equal(tours[:, -1], starts)
+            for tour in tours:
+                np.testing.assert_array_equal(np.sort(tour[:-1]), np.arange(14))
+
+        def returns_tour_lengths(test_object, graph):
+            tours, lengths = test_object.build(np.array([1, 2]))
+
+            for tour, length in zip(tours, lengths):
+                expected = sum(graph.distance_matrix[start, end] for start, end in zip(tour[:-1], tour[1:]))
+                np.testing.assert_almost_equal(length, expected)
+
+        def prefers_attractive_edges(graph):
+            graph.set_pheromone((1, 2), 1e6)
+            test_object = TourBuilder(graph, 1., 0., np.random.default_rng(3))
+
+            tours, _ = test_object.build(np.zeros(10, dtype=int))
+
+            np.testing.assert_array_equal(tours[:, 1], 1)
+
+        def uses_the_given_heuristic(graph):
+            graph.reset_pheromone(1.)
+            heuristic = np.roll(np.eye(14), 1, axis=1)
+            test_object = TourBuilder(graph, 1., 2., np.random.default_rng(3), heuristic=heuristic)
+
+            tours, _ = test_object.build(np.array([0, 4]))
+
+            np.testing.assert_array_equal(tours[0], [*range(14), 0])
+            np.testing.assert_array_equal(tours[1], [*range(4, 14), *range(5)])
+
+        def is_reproducible(graph):
+            first, _ = TourBuilder(graph, 1., 2., np.random.default_rng(7)).build(np.arange(14))
+            second, _ = TourBuilder(graph, 1., 2., np.random.default_rng(7)).build(np.arange(14))
+
+            np.testing.assert_array_equal(first, second)
+
+    def describe_with_candidates():
+        def constructs_valid_tours(graph):
+            test_object = TourBuilder(graph, 1., 2., np.random.default_rng(3), graph.get_neighbors(3))
+
+            tours, _ = test_object.build(np.arange(14))
+
+            for tour in tours:
+                np.testing.assert_array_equal(np.sort(tour[:-1]), np.arange(14))
+
+        def chooses_among_candidates_first(graph):
+            candidates = graph.get_neighbors(1)
+            test_object = TourBuilder(graph, 1., 2., np.random.default_rng(3), candidates)
+
+            tours, _ = test_object.build(np.arange(14))
+
+            np.testing.assert_array_equal(tours[:, 1], candidates[:, 0])
+
+
+def describe_compute_heuristic():
+    def computes_the_inverse_distance_to_the_power_of_beta():
+        distances = np.array([[0., 2.], [4., 0.]])
+
+        np.testing.assert_array_equal(compute_heuristic(distances, 2.), [[0., 0.25], [0.0625, 0.]])
+
+    def stores_the_result_in_the_given_array():
+        out = np.full((2, 2), 7.)
+
+        result = compute_heuristic(np.array([[0., 2.], [4., 0.]]), 1., out=out)
+
+        assert result is out
+        np.testing.assert_array_equal(out, [[0., 0.5], [0.25, 0.]])
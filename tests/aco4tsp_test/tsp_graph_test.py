@@ -0,0 +1,100 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from os import path
+
+import numpy as np
+import pytest
+import tsplib95
+
+from swarmlib.aco4tsp.tsp_graph import Graph
+from swarmlib.aco4tsp.tsplib_loader import load_instance
+
+# pylint: disable=unused-variable
+
+TSP_FILE = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'swarmlib', 'aco4tsp', 'resources', 'burma14.tsp')
+
+
+@pytest.fixture
+def problem():
+    return tsplib95.load_problem(TSP_FILE)
+
+
+@pytest.fixture
+def test_object():
+    return Graph(load_instance(TSP_FILE, None))
+
+
+def describe_graph():
+    def describe_constructor():
+        def creates_symmetric_distance_matrix(test_object, problem):
+            distances = test_object.distance_matrix
+
+            assert distances.shape == (14, 14)
+            np.testing.assert_array_equal(distances, distances.T)
+            np.testing.assert_array_equal(np.diag(distances), 0)
+            np.testing.assert_equal(distances[0, 1], problem.get_weight(1, 2))
+
+        def initializes_pheromone_with_zeros(test_object):
+            np.testing.assert_array_equal(test_object.pheromone_matrix, np.zeros((14, 14)))
+
+    def describe_edge_view():
+        def returns_edge_length(test_object, problem):
+            np.testing.assert_equal(test_object.get_edge_length((3, 7)), problem.get_weight(3, 7))
+
+        def sets_pheromone_symmetrically(test_object):
+            test_object.set_pheromone((2, 5), 0.7)
+
+            np.testing.assert_equal(test_object.get_edge_pheromone((2, 5)), 0.7)
+            np.testing.assert_equal(test_object.get_edge_pheromone((5, 2)), 0.7)
+
+        def returns_all_edges(test_object):
+            assert len(test_object.get_edges()) == 14 * 13 / 2
+            assert len(test_object.get_edges(1)) == 13
+
+        def returns_the_indices_of_all_edges(test_object):
+            starts, ends = test_object.get_edge_indices()
+
+            edges = [(test_object.get_node(start), test_object.get_node(end)) for start, end in zip(starts, ends)]
+            assert edges == test_object.get_edges()
+
+    def describe_get_neighbors():
+        def returns_nearest_neighbors_sorted_by_distance(test_object):
+            neighbors = test_object.get_neighbors(4)
+
+            assert neighbors.shape == (14, 4)
+            for node, row in enumerate(neighbors):
+                expected = [index for index in np.argsort(test_object.distance_matrix[node], kind='stable') if index != node]
+                np.testing.assert_array_equal(test_object.distance_matrix[node, row], test_object.distance_matrix[node, expected[:4]])
+
+        def lists_all_other_nodes_by_default(test_object):
+            neighbors = test_object.get_neighbors()
+
+            assert neighbors.shape == (14, 13)
+            assert not np.any(neighbors == np.arange(14)[:, np.newaxis])
+
+        def caches_the_lists(test_object):
+            assert test_object.get_neighbors(4) is test_object.get_neighbors(4)
+
+    def describe_evaporate():
+        def scales_pheromone_in_place(test_object):
+            test_object.set_pheromone((1, 2), 2.)
+            pheromone = test_object.pheromone_matrix
+
+            test_object.evaporate(0.25)
+
+            assert pheromone is test_object.pheromone_matrix
+            np.testing.assert_equal(test_object.get_edge_pheromone((1, 2)), 1.5)
+
+    def describe_deposit():
+        def adds_pheromone_for_repeated_edges(test_object):
+            starts = test_object.get_indices([1, 1, 3])
+            ends = test_object.get_indices([2, 2, 4])
+
+            test_object.deposit(starts, ends, np.array([1., 2., 3.]))
+
+            np.testing.assert_equal(test_object.get_edge_pheromone((2, 1)), 3.)
+            np.testing.assert_equal(test_object.get_edge_pheromone((3, 4)), 3.)
+            np.testing.assert_equal(test_object.pheromone_matrix.sum(), 12.)
@@ -0,0 +1,168 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from itertools import combinations
+from os import path
+
+import numpy as np
+import pytest
+import tsplib95
+
+from swarmlib.aco4tsp import tsplib_loader
+from swarmlib.aco4tsp.aco_problem import ACOProblem
+from swarmlib.aco4tsp.tsplib_loader import load_instance
+
+# pylint: disable=unused-variable
+
+TSP_FILE = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'swarmlib', 'aco4tsp', 'resources', 'burma14.tsp')
+
+EXPLICIT_PROBLEM = '''NAME: explicit4
+TYPE: TSP
+COMMENT: Explicit lower diagonal matrix
+DIMENSION: 4
+EDGE_WEIGHT_TYPE: EXPLICIT
+EDGE_WEIGHT_FORMAT: LOWER_DIAG_ROW
+EDGE_WEIGHT_SECTION
+0 3 0 5 4 0 7 6 2 0
+EOF
+'''
+
+
+def _write_problem(directory, edge_weight_type, coordinates):
+    lines = [
+        f'NAME: random{len(coordinates)}',
+        'TYPE: TSP',
+        f'COMMENT: Random {edge_weight_type} problem',
+        f'DIMENSION: {len(coordinates)}',
+        f'EDGE_WEIGHT_TYPE: {edge_weight_type}',
+        'NODE_COORD_SECTION',
+        *[f'{index + 1} {x} {y}' for index, (x, y) in enumerate(coordinates)],
+        'EOF'
+    ]
+    tsp_file = directory / f'{edge_weight_type}.tsp'
+    tsp_file.write_text('\n'.join(lines) + '\n')
+    return str(tsp_file)
+
+
+def _assert_matches_tsplib95(instance, tsp_file):
+    problem = tsplib95.load_problem(tsp_file)
+    nodes = list(problem.get_nodes())
+
+    def weight(start, end):
+        if not problem.node_coords:
+            return problem.get_weight(start, end)
+        # tsplib95's distance functions rounded to 2 decimals instead of integers
+        distance_function = tsplib95.distances.TYPES[problem.edge_weight_type]
+        return distance_function(start=problem.node_coords[start], end=problem.node_coords[end], round=lambda x: round(x, 2))
+
+    np.testing.assert_array_equal(instance.nodes, nodes)
+    np.testing.assert_array_equal(np.diag(instance.distances), 0)
+    for start, end in combinations(range(len(nodes)), 2):
+        assert instance.distances[start, end] == weight(nodes[start], nodes[end])
+        assert instance.distances[end, start] == instance.distances[start, end]
+
+
+def describe_load_instance():
+    @pytest.mark.parametrize('edge_weight_type', ['EUC_2D', 'CEIL_2D', 'ATT'])
+    def computes_planar_distances_like_tsplib95(edge_weight_type, tmp_path):
+        coordinates = np.random.default_rng(1).uniform(0, 5000, (40, 2)).round(2)
+        tsp_file = _write_problem(tmp_path, edge_weight_type, coordinates)
+
+        instance = load_instance(tsp_file, None)
+
+        _assert_matches_tsplib95(instance, tsp_file)
+        np.testing.assert_array_equal(instance.coordinates, coordinates)
+
+    def rounds_the_distances_to_two_decimals(tmp_path):
+        tsp_file = _write_problem(tmp_path, 'EUC_2D', [(0, 0), (1, 1), (3, 0)])
+
+        np.testing.assert_array_equal(load_instance(tsp_file, None).distances, [[0, 1.41, 3], [1.41, 0, 2.24], [3, 2.24, 0]])
+
+    def computes_geographical_distances_like_tsplib95(tmp_path):
+        random = np.random.default_rng(2)
+        coordinates = np.column_stack([random.uniform(-89, 89, 40), random.uniform(-179, 179, 40)]).round(2)
+        tsp_file = _write_problem(tmp_path, 'GEO', coordinates)
+
+        _assert_matches_tsplib95(load_instance(tsp_file, None), tsp_file)
+
+    def computes_distances_in_blocks(tmp_path, monkeypatch):
+        monkeypatch.setattr(tsplib_loader, 'BLOCK_SIZE', 7)
+        coordinates = np.random.default_rng(3).uniform(0, 100, (10, 2))
+        tsp_file = _write_problem(tmp_path, 'EUC_2D', coordinates)
+
+        _assert_matches_tsplib95(load_instance(tsp_file, None), tsp_file)
+
+    def reads_the_specification():
+        instance = load_instance(TSP_FILE, None)
+
+        assert instance.name == 'burma14'
+        assert instance.comment == '14-Staedte in Burma (Zaw Win)'
+        assert instance.coordinates.shape == (14, 2)
+
+    def falls_back_to_tsplib95(tmp_path):
+        tsp_file = tmp_path / 'explicit4.tsp'
+        tsp_file.write_text(EXPLICIT_PROBLEM)
+
+        instance = load_instance(str(tsp_file), None)
+
+        _assert_matches_tsplib95(instance, str(tsp_file))
+        assert instance.distances[3, 1] == 6
+        assert instance.coordinates.shape == (0, 2)
+
+
+def describe_instance_cache():
+    def is_disabled_by_default(monkeypatch):
+        monkeypatch.setattr(tsplib_loader.os, 'makedirs', pytest.fail)
+
+        instance = load_instance(TSP_FILE)
+
+        _assert_matches_tsplib95(instance, TSP_FILE)
+
+    def is_used_by_the_aco_problem(tmp_path):
+        cache_dir = tmp_path / 'cache'
+
+        ACOProblem(ant_number=2, iteration_number=1, record=False, cache_dir=str(cache_dir))
+
+        assert len(list(cache_dir.glob('*.npz'))) == 1
+
+    def stores_the_instance(tmp_path):
+        cache_dir = tmp_path / 'cache'
+
+        instance = load_instance(TSP_FILE, str(cache_dir))
+
+        assert len(list(cache_dir.glob('*.npz'))) == 1
+        assert len(list(cache_dir.glob('*.distances.npy'))) == 1
+        _assert_matches_tsplib95(instance, TSP_FILE)
+
+    def loads_the_cached_instance(tmp_path, monkeypatch):
+        cache_dir = str(tmp_path / 'cache')
+        expected = load_instance(TSP_FILE, cache_dir)
+        monkeypatch.setattr(tsplib_loader, '_parse', pytest.fail)
+
+        instance = load_instance(TSP_FILE, cache_dir)
+
+        assert instance.name == expected.name
+        assert instance.comment == expected.comment
+        np.testing.assert_array_equal(instance.nodes, expected.nodes)
+        np.testing.assert_array_equal(instance.coordinates, expected.coordinates)
+        np.testing.assert_array_equal(instance.distances, expected.distances)
+
+    def is_keyed_by_the_file_content(tmp_path):
+        cache_dir = str(tmp_path / 'cache')
+        tsp_file = _write_problem(tmp_path, 'EUC_2D', [[0, 0], [3, 4], [6, 8]])
+        load_instance(tsp_file, cache_dir)
+        tsp_file = _write_problem(tmp_path, 'EUC_2D', [[0, 0], [6, 8], [12, 16]])
+
+        instance = load_instance(tsp_file, cache_dir)
+
+        assert instance.distances[0, 1] == 10
+
+    def loads_without_cache_if_it_cannot_be_written(tmp_path):
+        blocking_file = tmp_path / 'cache'
+        blocking_file.write_text('')
+
+        instance = load_instance(TSP_FILE, str(blocking_file))
+
+        _assert_matches_tsplib95(instance, TSP_FILE)
@@ -0,0 +1,133 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from os import path
+
+import numpy as np
+import pytest
+
+from swarmlib.aco4tsp.aco_problem import ACOProblem
+from swarmlib.aco4tsp.tour_builder import TourBuilder
+from swarmlib.aco4tsp.tsp_graph import Graph
+from swarmlib.aco4tsp.tsplib_loader import load_instance
+from swarmlib.aco4tsp.variants import AntColonySystem, AntSystem, MaxMinAntSystem, nearest_neighbor_distance
+
+# pylint: disable=unused-variable
+
+TSP_FILE = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'swarmlib', 'aco4tsp', 'resources', 'burma14.tsp')
+
+
+@pytest.fixture
+def graph():
+    return Graph(load_instance(TSP_FILE, None))
+
+
+@pytest.fixture
+def tours(graph):
+    return TourBuilder(graph, 1., 2., np.random.default_rng(3)).build(np.arange(5))
+
+
+def _edges(tour):
+    return {tuple(sorted(edge)) for edge in zip(tour[:-1], tour[1:])}
+
+
+def describe_variants():
+    def describe_nearest_neighbor_distance():
+        def returns_greedy_tour_length():
+            distances = np.array([
+                [0., 1., 4., 2.],
+                [1., 0., 1., 5.],
+                [4., 1., 0., 1.],
+                [2., 5., 1., 0.]])
+
+            assert nearest_neighbor_distance(distances) == 5.
+
+    def describe_ant_system():
+        def deposits_pheromone_on_all_tours(graph, tours):
+            test_object = AntSystem(graph, rho=0.5, q=1.)
+            test_object.initialize()
+
+            test_object.update(*tours, tours[0][0], tours[1][0])
+
+            for tour in tours[0]:
+                assert np.all(graph.get_pheromone(tour[:-1], tour[1:]) > 0)
+
+    def describe_max_min_ant_system():
+        def initializes_pheromone_to_upper_bound(graph):
+            test_object = MaxMinAntSystem(graph, rho=0.5, q=1.)
+
+            test_object.initialize()
+
+            expected = 1. / (0.5 * nearest_neighbor_distance(graph.distance_matrix))
+            np.testing.assert_allclose(graph.pheromone_matrix, expected)
+
+        def keeps_pheromone_within_bounds(graph, tours):
+            test_object = MaxMinAntSystem(graph, rho=0.5, q=1.)
+            test_object.initialize()
+
+            for _ in range(20):
+                test_object.update(*tours, tours[0][0], tours[1][0])
+
+            tau_max = 1. / (0.5 * tours[1][0])
+            assert graph.pheromone_matrix.max() <= tau_max + 1e-12
+            assert graph.pheromone_matrix.min() > 0
+
+        def only_reinforces_iteration_best_tour(graph, tours):
+            test_object = MaxMinAntSystem(graph, rho=0.5, q=1.)
+            test_object.initialize()
+            best = np.argmin(tours[1])
+
+            test_object.update(*tours, tours[0][best], tours[1][best])
+
+            pheromone = graph.pheromone_matrix
+            reinforced = {tuple(sorted(edge)) for edge in zip(*np.nonzero(pheromone == pheromone.max()))}
+            assert reinforced == _edges(tours[0][best])
+
+        def reinitializes_pheromone_on_stagnation(graph, tours):
+            test_object = MaxMinAntSystem(graph, rho=0.5, q=1., stagnation_limit=2)
+            test_object.initialize()
+
+            for _ in range(3):
+                test_object.update(*tours, tours[0][0], tours[1][0])
+
+            np.testing.assert_allclose(graph.pheromone_matrix, graph.pheromone_matrix.max())
+
+    def describe_ant_colony_system():
+        def moves_traveled_edges_towards_initial_pheromone_once_per_ant(graph):
+            test_object = AntColonySystem(graph, q=1., xi=0.5)
+            test_object.initialize()
+            tau0 = graph.pheromone_matrix[0, 1]
+            graph.update_pheromone(np.array([0, 2]), np.array([1, 3]), np.array([5 * tau0, 3 * tau0]))
+
+            # Two ants travel the edge (0, 1) in opposite directions and one ant the edge (2, 3)
+            test_object.local_update(np.array([0, 1, 2]), np.array([1, 0, 3]))
+
+            np.testing.assert_allclose(graph.get_pheromone(np.array([0, 1, 2, 3]), np.array([1, 0, 3, 2])), [2 * tau0, 2 * tau0, 2 * tau0, 2 * tau0])
+
+        def only_reinforces_best_tour(graph, tours):
+            test_object = AntColonySystem(graph, rho=0.5, q=1.)
+            test_object.initialize()
+            tau0 = graph.pheromone_matrix[0, 1]
+
+            test_object.update(*tours, tours[0][2], tours[1][2])
+
+            changed = {tuple(sorted(edge)) for edge in zip(*np.nonzero(graph.pheromone_matrix != tau0))}
+            assert changed == _edges(tours[0][2])
+
+    def describe_aco_problem():
+        @pytest.mark.parametrize('variant', ['AS', 'MMAS', 'ACS'])
+        @pytest.mark.parametrize('engine', ['vectorized', 'threads'])
+        def finds_valid_tours(variant, engine):
+            problem = ACOProblem(ant_number=3, iteration_number=3, variant=variant, engine=engine, seed=1)
+
+            best_path, distance = problem.solve()
+
+            assert best_path[0] == best_path[-1]
+            assert sorted(best_path[:-1]) == list(range(1, 15))
+            assert distance > 0
+
+        def raises_on_unknown_variant():
+            with pytest.raises(ValueError):
+                ACOProblem(ant_number=3, variant='foo')
@@ -0,0 +1,75 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from os import path
+
+import numpy as np
+import pytest
+
+from swarmlib.aco4tsp.aco_problem import ACOProblem
+from swarmlib.aco4tsp.tsp_graph import Graph
+from swarmlib.aco4tsp.tsplib_loader import load_instance
+from swarmlib.aco4tsp.visualizer import Visualizer
+from swarmlib.util.null_visualizer import NullVisualizer
+
+# pylint: disable=unused-variable,redefined-outer-name,protected-access
+
+TSP_FILE = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'swarmlib', 'aco4tsp', 'resources', 'burma14.tsp')
+
+
+@pytest.fixture
+def graph():
+    graph = Graph(load_instance(TSP_FILE, None))
+    starts, ends = graph.get_edge_indices()
+    graph.deposit(starts, ends, np.arange(len(starts), dtype=float))
+    return graph
+
+
+@pytest.fixture
+def best_tour():
+    return np.array([*range(14), 0])
+
+
+def describe_visualizer():
+    def records_all_edges_as_float32(graph, best_tour):
+        test_object = Visualizer(iteration_number=2)
+
+        test_object.add_data(graph=graph, best_tour=best_tour)
+        test_object.add_data(graph=graph, best_tour=best_tour)
+
+        snapshots = test_object.snapshots
+        assert [snapshot.iteration for snapshot in snapshots] == [1, 2]
+        assert snapshots[0].positions is None
+        assert snapshots[0].pheromone.dtype == np.float32
+        np.testing.assert_array_equal(snapshots[0].pheromone, np.arange(14 * 13 / 2))
+        np.testing.assert_array_equal(snapshots[0].best_tour, best_tour)
+
+    def records_every_nth_and_the_last_iteration(graph, best_tour):
+        test_object = Visualizer(iteration_number=7, record_interval=3)
+
+        for _ in range(7):
+            test_object.add_data(graph=graph, best_tour=best_tour)
+
+        assert [snapshot.iteration for snapshot in test_object.snapshots] == [3, 6, 7]
+
+    def records_the_strongest_and_the_best_tours_edges(graph, best_tour):
+        test_object = Visualizer(record_edges=5)
+
+        test_object.add_data(graph=graph, best_tour=best_tour)
+
+        snapshot = test_object.snapshots[0]
+        edges = graph.get_edges()
+        recorded = [edges[position] for position in snapshot.positions]
+        tour_edges = [tuple(sorted((graph.get_node(start), graph.get_node(end)))) for start, end in zip(best_tour[:-1], best_tour[1:])]
+        assert set(recorded) == set(edges[-5:]) | set(tour_edges)
+        np.testing.assert_array_equal(snapshot.pheromone, snapshot.positions)
+
+    def describe_aco_problem():
+        def records_nothing_when_disabled():
+            problem = ACOProblem(ant_number=2, iteration_number=2, record=False)
+
+            problem.solve()
+
+            assert isinstance(problem._visualizer, NullVisualizer)
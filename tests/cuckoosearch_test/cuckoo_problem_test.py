@@ -0,0 +1,53 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from swarmlib.cuckoosearch.cuckoo_problem import CuckooProblem
+from swarmlib.util.functions import FUNCTIONS
+from swarmlib.util.null_visualizer import NullVisualizer
+
+# pylint: disable=unused-variable,protected-access
+
+
+@pytest.fixture
+def kwargs():
+    return {
+        'function': FUNCTIONS['sphere'],
+        'nests': 10,
+        'max_generations': 5,
+        'lower_boundary': -4.,
+        'seed': 3
+    }
+
+
+def describe_cuckoo_problem():
+    def replaces_nests_by_better_eggs_only(kwargs):
+        problem = CuckooProblem(**kwargs, p_a=0.)
+        population = problem._CuckooProblem__population
+        initial_values = population.values.copy()
+
+        best = problem.solve()
+
+        assert np.all(population.values <= initial_values)
+        assert best.value == np.min(population.values)
+
+    def abandons_nests(kwargs):
+        problem = CuckooProblem(**kwargs, p_a=1.)
+        population = problem._CuckooProblem__population
+        initial_positions = population.positions.copy()
+
+        problem.solve()
+
+        assert not np.any(np.all(population.positions == initial_positions, axis=1))
+
+    def records_nothing_when_headless(kwargs):
+        problem = CuckooProblem(**kwargs, record=False)
+
+        best = problem.solve()
+
+        assert isinstance(problem._visualizer, NullVisualizer)
+        assert best.position.shape == (2,)
@@ -0,0 +1,129 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from swarmlib.fireflyalgorithm import attraction as attraction_module
+from swarmlib.fireflyalgorithm.attraction import approximate_attraction, attraction, nearest_neighbors, squared_distances
+from swarmlib.fireflyalgorithm.firefly_problem import FireflyProblem
+from swarmlib.util.functions import FUNCTIONS
+
+# pylint: disable=unused-variable
+
+
+@pytest.fixture
+def positions():
+    return np.random.default_rng(3).uniform(-2, 2, (12, 3))
+
+
+@pytest.fixture
+def values(positions):
+    return np.sum(positions**2, axis=1)
+
+
+def describe_attraction():
+    def calculates_the_squared_distances(positions):
+        expected = [[np.sum((first - second)**2) for second in positions] for first in positions]
+
+        np.testing.assert_allclose(squared_distances(positions, positions), expected, atol=1e-12)
+
+    def sums_the_moves_towards_all_brighter_fireflies(positions, values):
+        expected = np.zeros_like(positions)
+        for i, position in enumerate(positions):
+            for j, other in enumerate(positions):
+                if values[j] < values[i]:
+                    expected[i] += 0.8 * np.exp(-0.5 * np.sum((other - position)**2)) * (other - position)
+
+        moves, moved = attraction(positions, values, 0.8, 0.5)
+
+        np.testing.assert_allclose(moves, expected, atol=1e-12)
+        np.testing.assert_array_equal(moved, values > values.min())
+
+    def processes_tiles_like_the_whole_matrix(positions, values):
+        expected = attraction(positions, values, 0.8, 0.5)
+
+        # A budget for one row only
+        moves, moved = attraction(positions, values, 0.8, 0.5, memory_budget=1)
+
+        np.testing.assert_allclose(moves, expected[0], rtol=1e-12, atol=1e-12)
+        np.testing.assert_array_equal(moved, expected[1])
+
+    @pytest.mark.parametrize('search', [
+        lambda positions, values, budget: attraction(positions, values, 0.8, 0.5, memory_budget=budget),
+        lambda positions, values, budget: nearest_neighbors(positions, 3, memory_budget=budget)
+    ])
+    def keeps_the_tiles_within_the_memory_budget(search, monkeypatch):
+        monkeypatch.setattr(attraction_module, 'cKDTree', None)
+        positions = np.random.default_rng(4).uniform(-2, 2, (2000, 3))
+        budget = 4 * 2**20
+
+        tracemalloc.start()
+        try:
+            search(positions, np.sum(positions**2, axis=1), budget)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Besides the tiles only arrays with one row per firefly are allocated
+        assert peak <= 1.1 * budget
+
+    def describe_approximate_attraction():
+        @pytest.fixture(autouse=True, params=['kdtree', 'tiles'])
+        def neighbor_search(request, monkeypatch):
+            if request.param == 'kdtree':
+                pytest.importorskip('scipy.spatial')
+            else:
+                monkeypatch.setattr(attraction_module, 'cKDTree', None)
+
+        def equals_the_attraction_when_all_fireflies_are_neighbors(positions, values):
+            expected = attraction(positions, values, 0.8, 0.5)
+
+            moves, moved = approximate_attraction(positions, values, 0.8, 0.5, len(positions))
+
+            np.testing.assert_allclose(moves, expected[0], atol=1e-12)
+            np.testing.assert_array_equal(moved, expected[1])
+
+        def is_attracted_by_the_brightest_neighbors_only(positions, values):
+            moves, moved = approximate_attraction(positions, values, 0.8, 0.5, 1)
+
+            for i, position in enumerate(positions):
+                neighbors = np.argsort(np.sum((positions - position)**2, axis=1))[1:5]
+                brighter = neighbors[values[neighbors] < values[i]]
+                expected = np.zeros(3)
+                if brighter.size:
+                    brightest = positions[brighter[np.argmin(values[brighter])]]
+                    expected = 0.8 * np.exp(-0.5 * np.sum((brightest - position)**2)) * (brightest - position)
+                np.testing.assert_allclose(moves[i], expected, atol=1e-12)
+                assert moved[i] == bool(brighter.size)
+
+        def finds_the_nearest_neighbors(positions):
+            expected = np.argsort(squared_distances(positions, positions), axis=1)[:, 1:4]
+
+            neighbors = nearest_neighbors(positions, 3, memory_budget=1)
+
+            np.testing.assert_array_equal(np.sort(neighbors, axis=1), np.sort(expected, axis=1))
+
+    def describe_firefly_problem():
+        def raises_an_error_for_unknown_engines():
+            with pytest.raises(ValueError):
+                FireflyProblem(function=FUNCTIONS['sphere'], firefly_number=3, engine='gpu')
+
+        @pytest.mark.parametrize('kwargs', [{'engine': 'vectorized'}, {'engine': 'vectorized', 'neighbor_number': 2}, {'evaluate_once': True}])
+        def evaluates_each_firefly_once_per_iteration(kwargs):
+            calls = []
+
+            def function(x):
+                calls.append(x)
+                return np.sum(np.asarray(x)**2)
+
+            problem = FireflyProblem(function=function, firefly_number=6, iteration_number=3, dimensions=3, seed=3, **kwargs)
+            calls.clear()
+            problem.solve()
+
+            # The moved fireflies are evaluated together, the best one again after its random walk
+            assert len(calls) <= 3 * (6 + 1)
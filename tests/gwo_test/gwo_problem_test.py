@@ -0,0 +1,50 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from swarmlib.gwo.gwo_problem import GWOProblem
+from swarmlib.util.functions import FUNCTIONS
+
+# pylint: disable=unused-variable,protected-access
+
+
+@pytest.fixture
+def kwargs():
+    return {
+        'function': FUNCTIONS['sphere'],
+        'wolves': 10,
+        'iteration_number': 5,
+        'lower_boundary': -4.,
+        'seed': 3
+    }
+
+
+def describe_gwo_problem():
+    def finds_the_three_best_wolves_as_leaders(kwargs):
+        problem = GWOProblem(**kwargs)
+
+        leaders = problem._GWOProblem__leaders()
+
+        values = problem._GWOProblem__population.values
+        np.testing.assert_array_equal(leaders, np.argsort(values)[:3])
+
+    def keeps_the_best_wolf_found(kwargs):
+        problem = GWOProblem(**kwargs)
+        initial_best = np.min(problem._GWOProblem__population.values)
+
+        best = problem.solve()
+
+        assert best.value <= initial_best
+        assert best.value == FUNCTIONS['sphere'](best.position)
+
+    def moves_packs_with_less_than_three_wolves(kwargs):
+        kwargs['wolves'] = 2
+        problem = GWOProblem(**kwargs, dimensions=5)
+
+        best = problem.solve()
+
+        assert best.position.shape == (5,)
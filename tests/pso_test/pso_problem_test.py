@@ -0,0 +1,95 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from swarmlib.pso.pso_problem import PSOProblem
+from swarmlib.pso.topology import ring
+from swarmlib.util.functions import FUNCTIONS
+
+# pylint: disable=unused-variable,protected-access
+
+
+@pytest.fixture
+def kwargs():
+    return {
+        'function': FUNCTIONS['sphere'],
+        'particles': 8,
+        'iteration_number': 5,
+        'lower_boundary': -4.,
+        'seed': 3
+    }
+
+
+def describe_pso_problem():
+    def has_no_statistics_when_synchronous(kwargs):
+        problem = PSOProblem(**kwargs)
+
+        problem.solve()
+
+        assert problem.statistics is None
+
+    def moves_all_particles_like_their_steps(kwargs):
+        kwargs['iteration_number'] = 1
+        problem = PSOProblem(**kwargs)
+        expected = PSOProblem(**kwargs)
+        population = expected._PSOProblem__population
+        global_best_position = population.positions[population.best()].copy()
+        with population.deferred():
+            for particle in expected._PSOProblem__particles:
+                particle.step(global_best_position)
+
+        problem.solve()
+
+        np.testing.assert_array_equal(problem._PSOProblem__population.positions, population.positions)
+        np.testing.assert_array_equal(problem._PSOProblem__population.velocities, population.velocities)
+
+    def describe_asynchronous():
+        def evaluates_iteration_number_times_the_swarm(kwargs):
+            problem = PSOProblem(**kwargs, asynchronous=True)
+
+            best = problem.solve()
+
+            statistics = problem.statistics
+            assert statistics.evaluations == 40
+            assert statistics.throughput > 0
+            assert 0 < statistics.utilization <= 1
+            assert best.value < 1
+
+        def is_reproducible_with_serial_evaluation(kwargs):
+            first = PSOProblem(**kwargs, asynchronous=True).solve()
+            second = PSOProblem(**kwargs, asynchronous=True).solve()
+
+            np.testing.assert_array_equal(first.position, second.position)
+
+        def runs_with_threads(kwargs):
+            problem = PSOProblem(**kwargs, asynchronous=True, evaluation='threads', workers=2)
+
+            problem.solve()
+
+            assert problem.statistics.evaluations == 40
+
+    def describe_topology():
+        @pytest.mark.parametrize('topology', ['global', 'ring', 'von_neumann', lambda size: ring(size, radius=2)])
+        def converges_with(kwargs, topology):
+            problem = PSOProblem(**kwargs, topology=topology)
+            population = problem._PSOProblem__population
+            initial_best = population.values.min()
+
+            problem.solve()
+
+            assert population.best_values.min() <= initial_best
+
+        def rejects_unknown_topologies(kwargs):
+            with pytest.raises(ValueError):
+                PSOProblem(**kwargs, topology='star')
+
+        def is_supported_asynchronously(kwargs):
+            problem = PSOProblem(**kwargs, topology='ring', asynchronous=True)
+
+            problem.solve()
+
+            assert problem.statistics.evaluations == 5 * 8
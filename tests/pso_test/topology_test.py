@@ -0,0 +1,57 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from swarmlib.pso.topology import neighborhood_bests, ring, von_neumann
+
+# pylint: disable=unused-variable
+
+
+def describe_ring():
+    def connects_each_particle_to_its_neighbors():
+        np.testing.assert_array_equal(ring(4), [[3, 0, 1], [0, 1, 2], [1, 2, 3], [2, 3, 0]])
+
+    def connects_more_neighbors_for_a_larger_radius():
+        assert ring(10, radius=2).shape == (10, 5)
+
+
+def describe_von_neumann():
+    def connects_each_particle_to_its_grid_neighbors():
+        # 0 1 2
+        # 3 4 5
+        # 6 7 8
+        np.testing.assert_array_equal(von_neumann(9), [
+            [0, 2, 1, 6, 3],
+            [1, 0, 2, 7, 4],
+            [2, 1, 0, 8, 5],
+            [3, 5, 4, 0, 6],
+            [4, 3, 5, 1, 7],
+            [5, 4, 3, 2, 8],
+            [6, 8, 7, 3, 0],
+            [7, 6, 8, 4, 1],
+            [8, 7, 6, 5, 2]])
+
+    def wraps_a_shorter_last_row_on_its_own():
+        # 0 1 2
+        # 3 4 5
+        # 6
+        result = von_neumann(7)
+
+        np.testing.assert_array_equal(result[6], [6, 6, 6, 3, 0])
+        np.testing.assert_array_equal(result[2], [2, 1, 0, 5, 5])
+        np.testing.assert_array_equal(result[0], [0, 2, 1, 6, 3])
+
+
+def describe_neighborhood_bests():
+    def finds_the_best_particle_of_each_neighborhood():
+        values = np.array([3., 0., 2., 1., 4.])
+
+        np.testing.assert_array_equal(neighborhood_bests(values, ring(5)), [1, 1, 1, 3, 3])
+
+    def finds_the_global_best_without_neighbors():
+        values = np.array([3., 0., 2.])
+
+        np.testing.assert_array_equal(neighborhood_bests(values), [1, 1, 1])
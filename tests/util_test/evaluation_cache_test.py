@@ -0,0 +1,95 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from swarmlib.cuckoosearch.nest import Nest
+from swarmlib.util.evaluation_cache import EvaluationCache
+from swarmlib.util.evaluator import Evaluator
+
+# pylint: disable=unused-variable
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def test_func(calls):
+    def function(x):
+        calls.append(np.array(x))
+        return float(np.sum(x))
+    return function
+
+
+def describe_evaluation_cache():
+    def raises_an_error_for_an_empty_cache():
+        with pytest.raises(ValueError):
+            EvaluationCache(0)
+
+    def counts_hits_and_misses():
+        test_object = EvaluationCache()
+
+        assert test_object.get([1, 2]) is None
+        test_object.put([1, 2], 3.)
+
+        assert test_object.get([1, 2]) == 3.
+        assert (test_object.hits, test_object.misses) == (1, 1)
+
+    def rounds_the_positions():
+        test_object = EvaluationCache(decimals=3)
+        test_object.put([0., 1.], 3.)
+
+        assert test_object.get([-0.0001, 1.0002]) == 3.
+
+    def drops_the_least_recently_used_value():
+        test_object = EvaluationCache(2)
+        test_object.put([1], 1.)
+        test_object.put([2], 2.)
+        test_object.get([1])
+
+        test_object.put([3], 3.)
+
+        assert len(test_object) == 2
+        assert test_object.get([2]) is None
+        assert test_object.get([1]) == 1.
+
+    def evaluates_each_distinct_missing_position_once():
+        test_object = EvaluationCache()
+        test_object.put([1, 1], 2.)
+        batches = []
+
+        def batch(positions):
+            batches.append(positions)
+            return np.sum(positions, axis=1)
+
+        values = test_object.evaluate(np.array([[1, 1], [0, 4], [0, 4], [2, 3]]), batch)
+
+        np.testing.assert_array_equal(values, [2, 4, 4, 5])
+        np.testing.assert_array_equal(batches, [[[0, 4], [2, 3]]])
+        assert (test_object.hits, test_object.misses) == (2, 2)
+
+    def describe_evaluator():
+        def evaluates_cached_positions_once(test_func, calls):
+            test_object = Evaluator(test_func, cache=EvaluationCache())
+
+            test_object(np.array([[1, 2], [1, 2]]))
+            test_object.evaluate_position(np.array([1, 2]))
+            assert test_object.submit(np.array([1, 2])).result().value == 3
+
+            assert len(calls) == 1
+
+    def describe_nest():
+        def evaluates_a_new_position_once(test_func, calls):
+            nest = Nest(function=test_func, bit_generator=np.random.default_rng(3))
+            calls.clear()
+
+            nest.update_pos(np.array([-1., -1.]))
+
+            assert len(calls) == 1
+            np.testing.assert_array_equal(nest.position, [0, 0])
+            assert nest.value == 0
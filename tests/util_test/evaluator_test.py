@@ -0,0 +1,74 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from swarmlib.util.evaluation_cache import EvaluationCache
+from swarmlib.util.evaluator import Evaluator
+from swarmlib.util.functions import FUNCTIONS, register_function
+
+# pylint: disable=unused-variable
+
+
+def sum_of_cubes(x):
+    return np.sum(np.asarray(x)**3)
+
+
+def sums_of_cubes(positions):
+    return np.sum(positions**3, axis=1)
+
+
+@pytest.fixture
+def positions():
+    return np.random.default_rng(3).uniform(-5, 5, (25, 3))
+
+
+def describe_evaluator():
+    def raises_an_error_for_unknown_evaluations():
+        with pytest.raises(ValueError):
+            Evaluator(sum_of_cubes, 'gpu')
+
+    @pytest.mark.parametrize('evaluation', ['threads', 'processes'])
+    def evaluates_like_the_serial_evaluation(positions, evaluation):
+        for function in [sum_of_cubes, FUNCTIONS['rastrigin']]:
+            test_object = Evaluator(function, evaluation, workers=2)
+
+            np.testing.assert_array_equal(test_object(positions), Evaluator(function)(positions))
+            test_object.close()
+
+    def evaluates_registered_functions_in_spawned_processes(positions, monkeypatch):
+        monkeypatch.delitem(FUNCTIONS, 'test_sums_of_cubes', raising=False)
+        register_function('test_sums_of_cubes', batch=sums_of_cubes)
+
+        # Spawned workers only know the built-in functions of the registry
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context('spawn')) as executor:
+            test_object = Evaluator(FUNCTIONS['test_sums_of_cubes'], executor, workers=2)
+
+            np.testing.assert_allclose(test_object(positions), sums_of_cubes(positions))
+            assert test_object.submit(positions[0]).result().value == pytest.approx(sum_of_cubes(positions[0]))
+
+    def uses_the_given_executor(positions):
+        with ThreadPoolExecutor(2) as executor:
+            test_object = Evaluator(sum_of_cubes, executor, workers=2)
+
+            np.testing.assert_array_equal(test_object(positions), [sum_of_cubes(position) for position in positions])
+            test_object.close()
+            # The executor is still usable
+            assert executor.submit(sum_of_cubes, positions[0]).result() == sum_of_cubes(positions[0])
+
+    def counts_the_evaluations_without_the_cached_values(positions):
+        test_object = Evaluator(sum_of_cubes, cache=EvaluationCache())
+
+        test_object(positions)
+        test_object(positions[:5])
+        test_object.evaluate_position(positions[0])
+        test_object.submit(positions[0]).result()
+        test_object.evaluate_position(np.zeros(3))
+
+        assert test_object.evaluations == len(positions) + 1
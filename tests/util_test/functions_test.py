@@ -3,9 +3,13 @@
 #  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
 # ------------------------------------------------------------------------------------------------------
 
+import pickle
+
+import landscapes.single_objective
 import numpy as np
+import pytest
 
-from swarmlib.util.functions import FUNCTIONS
+from swarmlib.util.functions import BATCH_FUNCTIONS, FUNCTIONS, batch_function, register_function
 
 # pylint: disable=unused-variable
 
@@ -17,3 +21,63 @@ def describe_functions():
         result = michalewicz(np.array([1.5, 2.5]))
 
         np.testing.assert_array_almost_equal(result, -0.001786698064987311)
+
+    @pytest.mark.parametrize('name', [*BATCH_FUNCTIONS])
+    @pytest.mark.parametrize('dimensions', [2, 5])
+    def have_native_batches_matching_landscapes(name, dimensions):
+        positions = np.random.default_rng(1).uniform(-5, 5, (20, dimensions))
+
+        expected = [getattr(landscapes.single_objective, name)(position) for position in positions]
+
+        np.testing.assert_allclose(FUNCTIONS[name].batch(positions), expected, rtol=1e-12, atol=1e-12)
+
+    def fall_back_to_the_landscapes_function_without_native_batch():
+        positions = np.random.default_rng(2).uniform(1, 2, (4, 2))
+
+        result = FUNCTIONS['csendes'].batch(positions)
+
+        np.testing.assert_array_equal(result, [landscapes.single_objective.csendes(position) for position in positions])
+
+    def evaluate_mesh_grids():
+        mesh = np.meshgrid(np.linspace(0, 4, 5), np.linspace(0, 3, 4))
+
+        result = FUNCTIONS['ackley'](mesh)
+
+        assert result.shape == (4, 5)
+        np.testing.assert_allclose(result[2, 3], FUNCTIONS['ackley'](np.array([mesh[0][2, 3], mesh[1][2, 3]])))
+
+    def describe_register_function():
+        def registers_a_batched_function(monkeypatch):
+            monkeypatch.delitem(FUNCTIONS, 'test_batch', raising=False)
+            register_function('test_batch', batch=lambda x: x.sum(axis=1))
+
+            np.testing.assert_array_equal(FUNCTIONS['test_batch'].batch(np.array([[1., 2.], [3., 4.]])), [3, 7])
+            assert FUNCTIONS['test_batch'](np.array([1., 2.])) == 3
+
+        def registers_a_function_evaluated_per_position(monkeypatch):
+            monkeypatch.delitem(FUNCTIONS, 'test_single', raising=False)
+            function = lambda x: x[0] - x[1]  # pylint: disable=unnecessary-lambda-assignment
+            register_function('test_single', function)
+
+            np.testing.assert_array_equal(FUNCTIONS['test_single'].batch(np.array([[1., 2.], [4., 3.]])), [-1, 1])
+            assert not hasattr(function, 'batch')
+
+        def registers_a_picklable_function(monkeypatch):
+            monkeypatch.delitem(FUNCTIONS, 'test_pickle', raising=False)
+            register_function('test_pickle', np.linalg.norm)
+
+            function = pickle.loads(pickle.dumps(FUNCTIONS['test_pickle']))
+
+            assert function.__name__ == 'test_pickle'
+            assert function(np.array([3., 4.])) == 5
+            np.testing.assert_array_equal(function.batch(np.array([[3., 4.], [0., 1.]])), [5, 1])
+
+        def requires_a_function():
+            with pytest.raises(ValueError):
+                register_function('test_none')
+
+    def describe_batch_function():
+        def calls_functions_without_batch_per_position():
+            batch = batch_function(lambda x: x[0] * x[1])
+
+            np.testing.assert_array_equal(batch(np.array([[1., 2.], [3., 4.]])), [2, 12])
@@ -5,7 +5,7 @@
 
 import numpy as np
 
-from swarmlib.util.levy_flight import levy_flight
+from swarmlib.util.levy_flight import LevyFlightSampler, levy_flight, mantegna_sigma
 
 # pylint: disable=unused-variable
 
@@ -15,3 +15,31 @@ def describe_levy_flight():
         result = levy_flight(np.array([1, 2]), 1, 1.5, np.random.default_rng(3))
 
         np.testing.assert_array_equal(result, [3.542576654276212, -0.5963111833259749])
+
+    def steps_in_as_many_dimensions_as_the_start_position():
+        result = levy_flight(np.zeros(30), 1, 1.5, np.random.default_rng(3))
+
+        assert result.shape == (30,)
+
+
+def describe_levy_flight_sampler():
+    def draws_a_step_per_position_and_dimension():
+        result = LevyFlightSampler(1, 1.5, np.random.default_rng(3))(np.zeros((20, 5)))
+
+        assert result.shape == (20, 5)
+
+    def caches_the_mantegna_sigma():
+        mantegna_sigma(1.5)
+        hits = mantegna_sigma.cache_info().hits
+
+        LevyFlightSampler(1, 1.5, np.random.default_rng(3))
+
+        assert mantegna_sigma.cache_info().hits == hits + 1
+
+    def is_distributed_like_single_levy_flights():
+        generator = np.random.default_rng(4)
+        steps = LevyFlightSampler(2, 1.5, np.random.default_rng(3))(np.zeros((5000, 2))).ravel()
+        single_steps = np.concatenate([levy_flight(np.zeros(2), 2, 1.5, generator) for _ in range(5000)])
+
+        quantiles = [0.1, 0.25, 0.5, 0.75, 0.9]
+        np.testing.assert_allclose(np.quantile(steps, quantiles), np.quantile(single_steps, quantiles), atol=0.25)
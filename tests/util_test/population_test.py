@@ -0,0 +1,130 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+from swarmlib.util.coordinate import Coordinate
+from swarmlib.util.population import Population
+
+# pylint: disable=unused-variable,too-many-statements
+
+
+@pytest.fixture
+def test_func():
+    return lambda x: np.sum(x)  # pylint: disable=unnecessary-lambda
+
+
+@pytest.fixture
+def test_object(test_func):
+    return Population(
+        4,
+        function=test_func,
+        bit_generator=np.random.default_rng(3),
+        lower_boundary=0.1,
+        upper_boundary=3.9)
+
+
+def describe_population():
+    def describe_constructor():
+        def initializes_all_agents_at_once(test_object):
+            expected = np.random.default_rng(3).uniform(0.1, 3.9, (4, 2))
+
+            np.testing.assert_array_equal(test_object.positions, expected)
+            np.testing.assert_array_equal(test_object.values, expected.sum(axis=1))
+            np.testing.assert_array_equal(test_object.best_positions, expected)
+            np.testing.assert_array_equal(test_object.velocities, np.zeros((4, 2)))
+
+        def supports_any_number_of_dimensions(test_func):
+            test_object = Population(4, function=test_func, bit_generator=np.random.default_rng(3), dimensions=5)
+
+            assert test_object.dimensions == 5
+            assert test_object.positions.shape == (4, 5)
+            assert test_object.velocities.shape == (4, 5)
+            np.testing.assert_array_equal(test_object.values, test_object.positions.sum(axis=1))
+
+        def initializes_within_the_boundaries_of_each_dimension(test_func):
+            lower, upper = [0, -10, 100], [1, -5, 200]
+            test_object = Population(50, function=test_func, bit_generator=np.random.default_rng(3),
+                                     dimensions=3, lower_boundary=lower, upper_boundary=upper)
+
+            assert np.all(test_object.positions >= lower)
+            assert np.all(test_object.positions <= upper)
+
+        def raises_an_error_for_boundaries_of_the_wrong_dimensions(test_func):
+            with pytest.raises(ValueError):
+                Population(4, function=test_func, bit_generator=np.random.default_rng(3), dimensions=3, lower_boundary=[0, 1])
+
+    def describe_move():
+        def clips_and_evaluates_the_positions(test_object):
+            test_object.move(np.array([[-5, 7], [1, 1]]), [1, 3])
+
+            np.testing.assert_array_equal(test_object.positions[[1, 3]], [[0.1, 3.9], [1, 1]])
+            np.testing.assert_array_equal(test_object.values[[1, 3]], [4, 2])
+
+        def clips_each_dimension_to_its_boundaries(test_func):
+            test_object = Population(2, function=test_func, bit_generator=np.random.default_rng(3),
+                                     dimensions=3, lower_boundary=[0, 1, 2], upper_boundary=[1, 2, 3])
+
+            test_object.move(np.full((2, 3), 5.))
+            test_object.move(np.full(3, -5.), 0)
+
+            np.testing.assert_array_equal(test_object.positions, [[0, 1, 2], [1, 2, 3]])
+
+        def keeps_the_personal_bests(test_object):
+            test_object.move(np.full((4, 2), 0.1))
+            test_object.move(np.full((4, 2), 3.9))
+
+            np.testing.assert_array_equal(test_object.best_positions, np.full((4, 2), 0.1))
+            np.testing.assert_array_equal(test_object.best_values, np.full(4, 0.2))
+
+    def describe_deferred():
+        def moves_immediately_but_evaluates_when_leaving(test_object):
+            values = test_object.values.copy()
+
+            with test_object.deferred():
+                test_object.move([1, 1], 0)
+                test_object.move(np.full((2, 2), 5.), [1, 2])
+
+                np.testing.assert_array_equal(test_object.positions[:3], [[1, 1], [3.9, 3.9], [3.9, 3.9]])
+                np.testing.assert_array_equal(test_object.values, values)
+
+            np.testing.assert_array_equal(test_object.values[:3], [2, 7.8, 7.8])
+            assert test_object.values[3] == values[3]
+
+        def resets_the_personal_bests_of_initialized_agents(test_object):
+            test_object.move(np.full((4, 2), 0.1))
+
+            with test_object.deferred():
+                test_object.initialize([2])
+
+            np.testing.assert_array_equal(test_object.best_positions[2], test_object.positions[2])
+            assert test_object.best_values[2] == test_object.values[2]
+
+    def returns_the_best_agent(test_object):
+        assert test_object.best() == np.argmin(test_object.values)
+
+    def describe_coordinate_view():
+        def reads_the_agents_row(test_object):
+            coordinate = Coordinate(population=test_object, index=2)
+
+            np.testing.assert_array_equal(coordinate.position, test_object.positions[2])
+            assert coordinate.value == test_object.values[2]
+
+        def writes_the_agents_row(test_object):
+            coordinate = Coordinate(population=test_object, index=2)
+
+            coordinate._position = [1, 2]  # pylint: disable=protected-access
+
+            np.testing.assert_array_equal(test_object.positions[2], [1, 2])
+            assert test_object.values[2] == 3
+
+        def is_copied_without_the_population(test_object):
+            copied = deepcopy(Coordinate(population=test_object, index=2))
+            test_object.move(np.full((4, 2), 1.))
+
+            assert copied.value == np.random.default_rng(3).uniform(0.1, 3.9, (4, 2))[2].sum()
@@ -0,0 +1,32 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import pytest
+
+from swarmlib.pso.pso_problem import PSOProblem
+from swarmlib.util.base_visualizer import BaseVisualizer
+from swarmlib.util.functions import FUNCTIONS
+from swarmlib.util.null_visualizer import NullVisualizer
+
+# pylint: disable=unused-variable,protected-access
+
+
+@pytest.fixture
+def test_func():
+    return FUNCTIONS['sphere']
+
+
+def describe_problem_base():
+    def describe_visualizer():
+        def draws_2d_search_spaces(test_func):
+            problem = PSOProblem(function=test_func, particles=3, iteration_number=1)
+
+            assert isinstance(problem._visualizer, BaseVisualizer)
+
+        def is_disabled_for_other_dimensions(test_func):
+            problem = PSOProblem(function=test_func, particles=3, iteration_number=1, dimensions=30)
+
+            assert isinstance(problem._visualizer, NullVisualizer)
+            assert problem.solve().position.shape == (30,)
@@ -0,0 +1,71 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from swarmlib import ABCProblem, CuckooProblem, FireflyProblem, GWOProblem, PSOProblem, WOAProblem
+from swarmlib.util.functions import FUNCTIONS
+from swarmlib.util.solution import Solution
+
+# pylint: disable=unused-variable
+
+
+def describe_solution():
+    def copies_the_position():
+        position = np.array([1., 2.])
+
+        test_object = Solution.create(position, 5., 3, 40)
+        position[0] = 0.
+
+        np.testing.assert_array_equal(test_object.position, [1., 2.])
+        assert (test_object.value, test_object.iteration, test_object.evaluations) == (5., 3, 40)
+
+    def is_immutable():
+        test_object = Solution.create([1., 2.], 5.)
+
+        with pytest.raises(ValueError):
+            test_object.position[0] = 0.
+        with pytest.raises(AttributeError):
+            test_object.value = 0.  # pylint: disable=assigning-non-slot
+
+    def is_compared_by_value():
+        better = Solution.create([1., 2.], 1., 5)
+        worse = Solution.create([1., 2.], 2., 1)
+
+        assert better < worse
+        assert min([worse, better]) is better
+        assert better == Solution.create([0., 0.], 1.)
+        assert better <= worse
+        assert worse > better
+        assert worse >= Solution.create([1., 2.], 2., 3)
+        assert better != worse
+
+    def is_not_comparable_to_objects_without_value():
+        test_object = Solution.create([1., 2.], 1.)
+
+        assert test_object != None  # pylint: disable=singleton-comparison
+        assert not test_object == 1.  # pylint: disable=unneeded-not
+        with pytest.raises(TypeError):
+            assert test_object < 2.
+
+    @pytest.mark.parametrize('problem_type, kwargs', [
+        (PSOProblem, {'particles': 5}),
+        (PSOProblem, {'particles': 5, 'asynchronous': True}),
+        (FireflyProblem, {'firefly_number': 5}),
+        (CuckooProblem, {'nests': 5, 'max_generations': 3}),
+        (ABCProblem, {'bees': 5}),
+        (GWOProblem, {'wolves': 5}),
+        (WOAProblem, {'whales': 5})
+    ])
+    def is_returned_by_the_problems(problem_type, kwargs):
+        problem = problem_type(**kwargs, function=FUNCTIONS['sphere'], iteration_number=3, seed=1, record=False)
+
+        best = problem.solve()
+
+        assert isinstance(best, Solution)
+        assert best.value == FUNCTIONS['sphere'](best.position)
+        assert 0 <= best.iteration <= 3
+        assert 5 <= best.evaluations
@@ -0,0 +1,43 @@
+# ------------------------------------------------------------------------------------------------------
+#  Copyright (c) Leo Hanisch. All rights reserved.
+#  Licensed under the BSD 3-Clause License. See LICENSE.txt in the project root for license information.
+# ------------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from swarmlib.util.functions import FUNCTIONS
+from swarmlib.woa.woa_problem import WOAProblem
+
+# pylint: disable=unused-variable,protected-access
+
+
+@pytest.fixture
+def kwargs():
+    return {
+        'function': FUNCTIONS['sphere'],
+        'whales': 10,
+        'iteration_number': 5,
+        'lower_boundary': -4.,
+        'seed': 3
+    }
+
+
+def describe_woa_problem():
+    def returns_the_best_whale_of_the_pod(kwargs):
+        problem = WOAProblem(**kwargs)
+
+        best = problem.solve()
+
+        assert best.value == np.min(problem._WOAProblem__population.values)
+
+    def moves_the_encircling_whales_onto_the_prey_without_spread(kwargs):
+        kwargs['iteration_number'] = 1
+        problem = WOAProblem(**kwargs, a=0.)
+        population = problem._WOAProblem__population
+        prey = population.positions[population.best()].copy()
+
+        problem.solve()
+
+        on_prey = np.all(population.positions == prey, axis=1)
+        assert 0 < np.count_nonzero(on_prey) < len(population)